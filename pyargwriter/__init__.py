@@ -1 +1,2 @@
 TAB_SIZE = 4
+RENDER_BUFFER_SIZE = 1 << 16
@@ -0,0 +1,274 @@
+import ast
+import logging
+from typing import Any, Dict, List
+
+# argparse type of the annotations which map to a single value, by qualified name
+TYPE_TABLE = {
+    "int": "int",
+    "float": "float",
+    "str": "str",
+    "bool": "bool",
+    "pathlib.Path": "Path",
+    "pathlib.PurePath": "PurePath",
+}
+# annotations of a sequence of values, passed with nargs="+"
+SEQUENCE_TYPES = {
+    "list",
+    "set",
+    "frozenset",
+    "tuple",
+    "typing.List",
+    "typing.Set",
+    "typing.FrozenSet",
+    "typing.Tuple",
+    "typing.Sequence",
+    "typing.Iterable",
+    "collections.abc.Sequence",
+    "collections.abc.Iterable",
+}
+OPTIONAL_TYPES = {"typing.Optional"}
+UNION_TYPES = {"typing.Union"}
+LITERAL_TYPES = {"typing.Literal", "typing_extensions.Literal"}
+# qualified name of annotations used without import, e.g. List from a star import
+IMPLICIT_NAMES = {
+    "Path": "pathlib.Path",
+    "PurePath": "pathlib.PurePath",
+    "List": "typing.List",
+    "Set": "typing.Set",
+    "FrozenSet": "typing.FrozenSet",
+    "Tuple": "typing.Tuple",
+    "Sequence": "typing.Sequence",
+    "Iterable": "typing.Iterable",
+    "Optional": "typing.Optional",
+    "Union": "typing.Union",
+    "Literal": "typing.Literal",
+}
+# converters of the generated code which are no builtins, with their import
+CONVERTER_IMPORTS = {
+    "Path": "from pathlib import Path",
+    "PurePath": "from pathlib import PurePath",
+    "str2bool": "from pyargwriter.api.converters import str2bool",
+}
+
+
+class AnnotationResolver:
+    """Maps the annotation of an argument to the keyword arguments of add_argument.
+
+    Annotations are resolved from the shape of their ast node without evaluating them.
+    Names are qualified with the imports of the inspected file and looked up in
+    TYPE_TABLE, so "Path", "pathlib.Path" and aliases of both resolve alike. The
+    resolved names are memoized until the next file. Supported shapes are single
+    values like int or Path, sequences like List[int], Tuple[int, int] or
+    tuple[float, ...], Optional[X], Union[X, None], X | None and Literal[...]. The type
+    of every argument is the name of the converter argparse calls, e.g. "str2bool" for
+    a sequence of bool. Unsupported annotations are left to argparse, which passes the
+    value as str.
+
+    Args:
+        imports (Dict[str, str], optional): Qualified names of the imported names of the
+            inspected file, shared with the inspector. Defaults to None.
+
+    Attributes:
+        imports (Dict[str, str]): Qualified names of the imported names.
+        _names (Dict[str, Dict[str, Any]]): Resolved names by their source.
+        _forward_refs (Dict[str, Dict[str, Any]]): Resolved string annotations by their source.
+
+    Methods:
+        reset() -> None: Forget the resolved names of the previous file.
+        resolve(annotation: ast.expr) -> Dict[str, Any]: Resolve an annotation.
+
+    Example:
+        >>> resolver = AnnotationResolver({"Literal": "typing.Literal"})
+        >>> resolver.resolve(ast.parse("Literal['a', 'b']", mode="eval").body)
+        {'type': 'str', 'choices': ['a', 'b']}
+    """
+
+    def __init__(self, imports: Dict[str, str] = None) -> None:
+        self.imports = {} if imports is None else imports
+        self._names: Dict[str, Dict[str, Any]] = {}
+        self._forward_refs: Dict[str, Dict[str, Any]] = {}
+
+    def reset(self) -> None:
+        """Forget the resolved names of the previous file, as its imports may differ."""
+        self._names.clear()
+        self._forward_refs.clear()
+
+    def resolve(self, annotation: ast.expr) -> Dict[str, Any]:
+        """Resolve an annotation to keyword arguments of add_argument.
+
+        Args:
+            annotation (ast.expr): The annotation of the argument.
+
+        Returns:
+            Dict[str, Any]: Values of "type", "nargs" and "choices" if given by the annotation.
+        """
+        resolved = self._resolve(annotation)
+        if resolved is None:
+            logging.warning(
+                f"Unsupported annotation {ast.unparse(annotation)}. The argument is passed as str."
+            )
+            return {}
+        if resolved.get("nargs") is not None and resolved.get("type") == "bool":
+            # bool("False") is True
+            resolved = {**resolved, "type": "str2bool"}
+        if "choices" in resolved:
+            resolved = {**resolved, "choices": list(resolved["choices"])}
+        return resolved
+
+    def _resolve(self, annotation: ast.expr) -> Dict[str, Any] | None:
+        """Resolve an annotation without logging.
+
+        Args:
+            annotation (ast.expr): The annotation of the argument.
+
+        Returns:
+            Dict[str, Any] | None: The keyword arguments, None if the annotation is not supported.
+        """
+        if isinstance(annotation, (ast.Name, ast.Attribute)):
+            key = self._dotted_name(annotation)
+            if key is None:
+                return None
+            if key not in self._names:
+                name = self._qualified_name(key)
+                self._names[key] = {"type": TYPE_TABLE[name]} if name in TYPE_TABLE else None
+            return self._names[key]
+
+        if isinstance(annotation, ast.Constant):
+            if not isinstance(annotation.value, str):
+                return None
+            # forward reference, e.g. "Path"
+            if annotation.value not in self._forward_refs:
+                try:
+                    expression = ast.parse(annotation.value, mode="eval").body
+                except SyntaxError:
+                    expression = None
+                self._forward_refs[annotation.value] = (
+                    None if expression is None else self._resolve(expression)
+                )
+            return self._forward_refs[annotation.value]
+
+        if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+            return self._resolve_union([annotation.left, annotation.right])
+
+        if isinstance(annotation, ast.Subscript):
+            container = self._dotted_name(annotation.value)
+            if container is not None:
+                container = self._qualified_name(container)
+            elements = (
+                annotation.slice.elts
+                if isinstance(annotation.slice, ast.Tuple)
+                else [annotation.slice]
+            )
+            if container in OPTIONAL_TYPES:
+                return self._resolve(elements[0])
+            if container in UNION_TYPES:
+                return self._resolve_union(elements)
+            if container in LITERAL_TYPES:
+                return self._resolve_literal(elements)
+            if container in SEQUENCE_TYPES:
+                return self._resolve_sequence(container, elements)
+        return None
+
+    def _resolve_union(self, elements: List[ast.expr]) -> Dict[str, Any] | None:
+        """Resolve a union, which is supported if only None is added to a single type.
+
+        Args:
+            elements (List[ast.expr]): The united annotations.
+
+        Returns:
+            Dict[str, Any] | None: The keyword arguments, None if the union is not supported.
+        """
+        values = [
+            element
+            for element in elements
+            if not (isinstance(element, ast.Constant) and element.value is None)
+        ]
+        if len(values) != 1:
+            return None
+        return self._resolve(values[0])
+
+    def _resolve_literal(self, elements: List[ast.expr]) -> Dict[str, Any] | None:
+        """Resolve a literal to its choices.
+
+        Args:
+            elements (List[ast.expr]): The allowed values.
+
+        Returns:
+            Dict[str, Any] | None: The keyword arguments, None if a value is no str, int or float.
+        """
+        choices = []
+        for element in elements:
+            if not isinstance(element, ast.Constant) or type(element.value) not in (
+                str,
+                int,
+                float,
+            ):
+                return None
+            choices.append(element.value)
+
+        value_types = {type(choice).__name__ for choice in choices}
+        if len(value_types) != 1:
+            # argparse compares the choices to the converted value
+            return None
+        return {"type": value_types.pop(), "choices": choices}
+
+    def _resolve_sequence(
+        self, container: str, elements: List[ast.expr]
+    ) -> Dict[str, Any] | None:
+        """Resolve a sequence of values of the same type.
+
+        Args:
+            container (str): Qualified name of the sequence type.
+            elements (List[ast.expr]): The subscripted element types.
+
+        Returns:
+            Dict[str, Any] | None: The keyword arguments, None if the elements are not supported.
+        """
+        nargs = "+"
+        if container in ("tuple", "typing.Tuple"):
+            if (
+                len(elements) == 2
+                and isinstance(elements[1], ast.Constant)
+                and elements[1].value is Ellipsis
+            ):
+                elements = elements[:1]
+            else:
+                nargs = len(elements)
+        resolved = [self._resolve(element) for element in elements]
+        if any(value is None or "nargs" in value for value in resolved):
+            return None
+        if any(value != resolved[0] for value in resolved[1:]):
+            return None
+        return {**resolved[0], "nargs": nargs}
+
+    @staticmethod
+    def _dotted_name(node: ast.expr) -> str | None:
+        """Get the source of a name or attribute.
+
+        Args:
+            node (ast.expr): The name or attribute, e.g. pl.Path.
+
+        Returns:
+            str | None: The dotted name, e.g. "pl.Path", None if the node is no name.
+        """
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+
+    def _qualified_name(self, dotted_name: str) -> str:
+        """Qualify a dotted name with the imports of the file.
+
+        Args:
+            dotted_name (str): The name as written in the annotation, e.g. "pl.Path".
+
+        Returns:
+            str: The qualified name, e.g. "pathlib.Path".
+        """
+        head, _, tail = dotted_name.partition(".")
+        head = self.imports.get(head) or IMPLICIT_NAMES.get(head, head)
+        return f"{head}.{tail}" if tail else head
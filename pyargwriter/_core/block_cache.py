@@ -0,0 +1,185 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Tuple
+
+from pyargwriter._core.code_abstracts import Code, LineOfCode
+from pyargwriter._core.inspection_cache import PYARGWRITER_VERSION
+
+STATE_FILE = ".pyargwriter_state.json"
+# bump whenever the generators produce different code for the same structures, the
+# package version is not updated by every change, e.g. of an editable install
+GENERATION_SCHEMA = 3
+
+
+class CodeBlockCache:
+    """Remembers the code generated for every module between two generator runs.
+
+    The generators ask the cache for each block of code they derive from a single module,
+    e.g. the setup_<module>_parser function with its add_<command>_args functions or the
+    branch of the module in execute. A block is keyed by a hash of the module structure and
+    of the generator options it depends on. If the same key was generated in the previous
+    run, its lines are reused instead of generating the block again. Only blocks of changed
+    modules are generated, and nothing is written if no block changed and the files on
+    disk are the ones written before. Options affecting the whole files, like the path of
+    the parser file, form the context of the cache: if it changes, all blocks are generated.
+    The state of a different pyargwriter version or GENERATION_SCHEMA is not reused.
+
+    Args:
+        blocks (Dict[str, List[Tuple[int, str]]], optional): Blocks of the previous run, as lists of
+            (tab level, line) pairs keyed by block key. Defaults to None.
+        files (Dict[str, str], optional): Content hashes of the files written in the previous run.
+            Defaults to None.
+        context (Dict[str, Any], optional): Context of the previous run. Defaults to None.
+
+    Attributes:
+        _previous (Dict[str, List[Tuple[int, str]]]): Blocks of the previous run.
+        _blocks (Dict[str, List[Tuple[int, str]]]): Blocks used in the current run.
+        _files (Dict[str, str]): Content hashes of the files written in the previous run.
+        _previous_context (Dict[str, Any]): Context of the previous run.
+        _context (Dict[str, Any]): Context of the current run.
+        _misses (int): Number of blocks generated in the current run.
+
+    Methods:
+        load(path: str) -> CodeBlockCache: Load the state of the previous run.
+        set_context(context: Dict[str, Any]) -> None: Add options all blocks depend on.
+        get_or_build(kind: str, data: Any, build: Callable[[], Code]) -> Code: Reuse or generate a block.
+        up_to_date(paths: List[str]) -> bool: Check if the files would be written unchanged.
+        save(path: str, paths: List[str]) -> None: Store the blocks and the hashes of the written files.
+
+    Example:
+        >>> blocks = CodeBlockCache.load("cli/.pyargwriter_state.json")
+        >>> # the generator sets the context of the cache
+        >>> generator.from_structures(modules, "cli/utils/parser.py", blocks)
+        >>> if not blocks.up_to_date(["cli/utils/parser.py", "cli/__main__.py"]):
+        ...     generator.write("cli/utils/parser.py", "cli/__main__.py")
+        ...     blocks.save("cli/.pyargwriter_state.json", ["cli/utils/parser.py", "cli/__main__.py"])
+    """
+
+    def __init__(
+        self,
+        blocks: Dict[str, List[Tuple[int, str]]] = None,
+        files: Dict[str, str] = None,
+        context: Dict[str, Any] = None,
+    ) -> None:
+        self._previous = blocks or {}
+        self._blocks: Dict[str, List[Tuple[int, str]]] = {}
+        self._files = files or {}
+        self._previous_context = context or {}
+        self._context: Dict[str, Any] = {}
+        self._misses = 0
+
+    @classmethod
+    def load(cls, path: str) -> "CodeBlockCache":
+        """Load the state of the previous run or start without one.
+
+        Args:
+            path (str): Path to the state file.
+
+        Returns:
+            CodeBlockCache: The block cache.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return cls()
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != PYARGWRITER_VERSION
+            or state.get("schema") != GENERATION_SCHEMA
+        ):
+            logging.info("State of previous generation is outdated. Regenerate all code.")
+            return cls()
+        return cls(state["blocks"], state["files"], state["context"])
+
+    def set_context(self, context: Dict[str, Any]) -> None:
+        """Add options all blocks depend on and forget the previous blocks if they changed.
+
+        Args:
+            context (Dict[str, Any]): The options. Has to be JSON serializable.
+        """
+        # compare the JSON form, the stored context went through JSON
+        context = json.loads(json.dumps(context))
+        if any(self._previous_context.get(key) != value for key, value in context.items()):
+            self._previous = {}
+            self._files = {}
+        self._context.update(context)
+
+    @property
+    def changed(self) -> bool:
+        """bool: whether the generated code differs from the previous run"""
+        return self._misses > 0 or self._blocks.keys() != self._previous.keys()
+
+    def get_or_build(self, kind: str, data: Any, build: Callable[[], Code]) -> Code:
+        """Reuse the block generated in the previous run or generate it.
+
+        Args:
+            kind (str): Kind of the block, e.g. "setup_command_parser".
+            data (Any): Everything the block is generated from. Has to be JSON serializable.
+            build (Callable[[], Code]): Generates the block.
+
+        Returns:
+            Code: The block.
+        """
+        payload = json.dumps([kind, data], sort_keys=True, default=str)
+        key = hashlib.sha256(payload.encode()).hexdigest()
+
+        lines = self._previous.get(key)
+        if lines is None:
+            self._misses += 1
+            code = build()
+            lines = [(line.tab_level, line.raw) for line in code.file]
+            self._blocks[key] = lines
+            return code
+
+        self._blocks[key] = lines
+        return Code.from_lines_of_code(
+            [LineOfCode(line, tab_level) for tab_level, line in lines]
+        )
+
+    def up_to_date(self, paths: List[str]) -> bool:
+        """Check if writing the generated code would leave the given files unchanged.
+
+        Args:
+            paths (List[str]): The files the generated code is written to.
+
+        Returns:
+            bool: True if no block changed and the files were not modified since the previous run.
+        """
+        if self.changed:
+            return False
+        return all(self._files.get(path) == self._hash_file(path) for path in paths)
+
+    def save(self, path: str, paths: List[str]) -> None:
+        """Store the blocks of the current run and the hashes of the written files.
+
+        Args:
+            path (str): Path to the state file.
+            paths (List[str]): The files the generated code was written to.
+        """
+        state = {
+            "version": PYARGWRITER_VERSION,
+            "schema": GENERATION_SCHEMA,
+            "context": self._context,
+            "blocks": self._blocks,
+            "files": {file: self._hash_file(file) for file in paths},
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+
+    @staticmethod
+    def _hash_file(path: str) -> str | None:
+        """Hash the content of a file.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            str | None: The hash or None if the file does not exist.
+        """
+        if not os.path.isfile(path):
+            return None
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
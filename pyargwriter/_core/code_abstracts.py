@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Tuple, Type, get_origin
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Iterator, List, TextIO, Tuple, Type, get_origin
 
-from pyargwriter import TAB_SIZE
+from pyargwriter import RENDER_BUFFER_SIZE, TAB_SIZE
 from pyargwriter.decorator import overwrite_protection
 from pyargwriter.utils.type_testing import type_of_all
 
@@ -12,7 +13,9 @@ class LineOfCode:
     """Represents a single line of code with indentation.
 
     This class represents a single line of code with a specified level of indentation.
-    It is used to build code blocks and maintain proper indentation.
+    It is used to build code blocks and maintain proper indentation. The raw content
+    and the indentation level are stored separately; the indentation is only applied
+    when the line is rendered.
 
     Args:
         content (str): The content of the line of code.
@@ -20,16 +23,43 @@ class LineOfCode:
 
     Attributes:
         tab_level (int): The level of indentation for the line.
-        content (str): The content of the line of code.
+        raw (str): The content of the line of code without indentation and line break.
+        content (str): The rendered line of code including indentation and line break.
 
     """
 
+    __slots__ = ("_raw", "_tab_level")
+
     def __init__(self, content: str, tab_level: int = 0) -> None:
-        self._content: str = " " * (TAB_SIZE * tab_level) + content + "\n"
-        self._tab_level = tab_level
+        self._raw: str = content
+        self._tab_level: int = tab_level
 
     def __repr__(self) -> str:
-        return self._content
+        return self.render()
+
+    def render(self, offset: int = 0) -> str:
+        """Render the line of code with its indentation.
+
+        Args:
+            offset (int, optional): Additional tab levels to indent the line by. Defaults to 0.
+
+        Returns:
+            str: The indented line of code including the line break.
+        """
+        return " " * (TAB_SIZE * (self._tab_level + offset)) + self._raw + "\n"
+
+    def shifted(self, offset: int) -> LineOfCode:
+        """Return a copy of the line moved by the given number of tab levels.
+
+        Args:
+            offset (int): Number of tab levels to add to the line.
+
+        Returns:
+            LineOfCode: The shifted line or the line itself if offset is 0.
+        """
+        if offset == 0:
+            return self
+        return LineOfCode(self._raw, self._tab_level + offset)
 
     @property
     def tab_level(self) -> int:
@@ -40,6 +70,15 @@ class LineOfCode:
         """
         return self._tab_level
 
+    @property
+    def raw(self) -> str:
+        """The content of the line of code without indentation.
+
+        Returns:
+            str: The content of the line of code without indentation and line break.
+        """
+        return self._raw
+
     @property
     def content(self) -> str:
         """The content of the line of code.
@@ -47,7 +86,42 @@ class LineOfCode:
         Returns:
             str: The content of the line of code.
         """
-        return self._content
+        return self.render()
+
+
+class _Block:
+    """Nested code block inside a Code instance.
+
+    A block holds an immutable snapshot of the segments of another Code instance and
+    the tab level the block is indented by relative to its parent. Indentation is
+    resolved once while rendering instead of re-creating every nested line.
+
+    Args:
+        segments (Tuple[LineOfCode | _Block, ...]): The segments of the nested code.
+        depth (int): The indentation of the block relative to its parent.
+        length (int): The number of lines in the block.
+
+    """
+
+    __slots__ = ("segments", "depth", "length")
+
+    def __init__(
+        self, segments: Tuple[LineOfCode | _Block, ...], depth: int, length: int
+    ) -> None:
+        self.segments = segments
+        self.depth = depth
+        self.length = length
+
+    def first_tab_level(self) -> int:
+        """Get the tab level of the first line in the block.
+
+        Returns:
+            int: Tab level of the first line relative to the parent of the block.
+        """
+        first = self.segments[0]
+        if isinstance(first, _Block):
+            return self.depth + first.first_tab_level()
+        return self.depth + first.tab_level
 
 
 class Code:
@@ -56,9 +130,20 @@ class Code:
     This class represents a collection of code lines with indentation. It is used
     to build and manipulate code blocks.
 
+    The code is stored as a tree. Each segment is either a single line of code or a
+    nested block that keeps its indentation relative to the parent. The segments are
+    kept in a double-ended queue so that appending to the end and inserting at the
+    front (the two operations the code generators rely on) take amortized constant
+    time. Indentation is applied exactly once when the code is rendered or when the
+    flat list of lines is requested via `file`.
+
     Attributes:
-        _file (List[LineOfCode]): The list of code lines.
+        _file (Deque[LineOfCode | _Block]): The segments in order of appearance.
+        _length (int): The number of lines in the code block.
         _tab_level (int): The level of indentation for the code block.
+        _depth (int): Offset added to every line while rendering, see `set_tab_level`.
+        _content_index (Counter[str]): Occurrences of every line content, used for membership tests.
+        _import_registry (Counter[str]): Occurrences of import statements on the top tab level.
 
     Methods:
         insert(self, content: List[LineOfCode] | LineOfCode | Code, index: int) -> None:
@@ -73,25 +158,23 @@ class Code:
         from_str(cls: Code, code: str) -> Code:
             Create a Code instance from a single string representing a line of code.
 
-        _split_file(self, index: int) -> Tuple[List[LineOfCode], List[LineOfCode]]:
-            Split the code block into two parts at the specified index.
+        has_import(self, statement: str) -> bool:
+            Check if an import statement exists on the top tab level.
 
-        _insert_line_of_code(
-            first: List[LineOfCode], line_of_code: LineOfCode, second: List[LineOfCode]
-        ) -> List[LineOfCode]:
-            Insert a single line of code into the code block.
+        add_import(self, statement: str, index: int = 0) -> bool:
+            Insert an import statement unless it already exists.
 
-        _insert_lines_of_code(
-            first: List[LineOfCode],
-            lines_of_code: List[LineOfCode],
-            second: List[LineOfCode],
-        ) -> List[LineOfCode]:
-            Insert multiple lines of code into the code block.
+        _to_segments(self, content: List[LineOfCode] | LineOfCode | Code, depth: int) -> List[LineOfCode | _Block] | None:
+            Normalize insertable content into a list of segments.
 
-        _insert_code(
-            self, first: List[LineOfCode], code: Code, second: List[LineOfCode]
-        ) -> List[LineOfCode]:
-            Insert another Code instance into the code block.
+        _insert_segments(self, segments: List[LineOfCode | _Block], index: int) -> None:
+            Insert segments into the code block.
+
+        iter_lines(self) -> Iterator[str]:
+            Lazily render the code block line by line.
+
+        render_to(self, stream: TextIO, buffer_size: int = RENDER_BUFFER_SIZE) -> None:
+            Write the rendered code block in buffered chunks to a text stream.
 
         _write(self, path: str) -> None:
             Write the code block to a specified file path.
@@ -103,30 +186,138 @@ class Code:
             Set the tab level for all lines of code in the code block.
 
     """
-    
+
     def __init__(self) -> None:
-        self._file: List[LineOfCode] = []
+        self._file: Deque[LineOfCode | _Block] = deque()
+        self._length: int = 0
         self._tab_level: int = 0
+        self._depth: int = 0
+        self._content_index: Counter[str] = Counter()
+        self._import_registry: Counter[str] = Counter()
 
     def __repr__(self) -> str:
-        result = ""
-        for line in self.file:
-            result += repr(line)
-
-        return result
+        return "".join(self.iter_lines())
 
     def __len__(self) -> int:
-        return len(self._file)
+        return self._length
 
     def __contains__(self, key: str | LineOfCode) -> bool:
         if isinstance(key, LineOfCode):
-            key = key.content.lstrip(" ").rstrip("\n")
+            key = self._normalize(key.raw)
+        return key in self._content_index
+
+    @staticmethod
+    def _normalize(content: str) -> str:
+        """Normalize the content of a line for index lookups.
+
+        Args:
+            content (str): Raw content of a line of code.
 
-        for line in self._file:
-            content = line.content.lstrip(" ").rstrip("\n")
-            if key == content:
-                return True
-        return False
+        Returns:
+            str: The content without leading indentation.
+        """
+        return content.lstrip(" ")
+
+    @staticmethod
+    def _is_import(content: str) -> bool:
+        """Check if the normalized content of a line is an import statement.
+
+        Args:
+            content (str): Normalized content of a line of code.
+
+        Returns:
+            bool: True if the line imports something.
+        """
+        return content.startswith("import ") or (
+            content.startswith("from ") and " import " in content
+        )
+
+    def _register_line(self, line: LineOfCode) -> None:
+        """Add a line on the top level of this code block to the content and import index.
+
+        Args:
+            line (LineOfCode): The added line.
+        """
+        key = self._normalize(line.raw)
+        self._content_index[key] += 1
+        if line.tab_level == 0 and self._is_import(key):
+            self._import_registry[key] += 1
+
+    def _unregister_line(self, line: LineOfCode) -> None:
+        """Remove a line on the top level of this code block from the content and import index.
+
+        Args:
+            line (LineOfCode): The removed line.
+        """
+        key = self._normalize(line.raw)
+        self._decrement(self._content_index, key)
+        if line.tab_level == 0 and self._is_import(key):
+            self._decrement(self._import_registry, key)
+
+    @staticmethod
+    def _decrement(counter: Counter[str], key: str) -> None:
+        """Decrement the count of a key and drop it once it reaches zero.
+
+        Args:
+            counter (Counter[str]): Counter to update.
+            key (str): Key to decrement.
+        """
+        count = counter[key] - 1
+        if count > 0:
+            counter[key] = count
+        else:
+            del counter[key]
+
+    def _register(self, content: List[LineOfCode] | LineOfCode | Code, depth: int) -> None:
+        """Add inserted content to the content and import index.
+
+        Args:
+            content (List[LineOfCode] | LineOfCode | Code): The inserted content.
+            depth (int): Indentation of a Code block relative to this code block.
+        """
+        if isinstance(content, Code):
+            self._content_index.update(content._content_index)
+            if depth == 0:
+                # an unshifted block keeps its top level imports
+                self._import_registry.update(content._import_registry)
+                return
+            # a shifted block moves its lines to other tab levels, look them up again
+            for line, offset in content._walk():
+                if line.tab_level + offset - content._depth + depth == 0:
+                    key = self._normalize(line.raw)
+                    if self._is_import(key):
+                        self._import_registry[key] += 1
+        elif isinstance(content, LineOfCode):
+            self._register_line(content)
+        else:
+            for line in content:
+                self._register_line(line)
+
+    def has_import(self, statement: str) -> bool:
+        """Check if an import statement exists on the top tab level.
+
+        Args:
+            statement (str): The import statement, e.g. "from argparse import ArgumentParser".
+
+        Returns:
+            bool: True if the statement exists in this code block.
+        """
+        return self._normalize(statement) in self._import_registry
+
+    def add_import(self, statement: str, index: int = 0) -> bool:
+        """Insert an import statement unless it already exists on the top tab level.
+
+        Args:
+            statement (str): The import statement, e.g. "from argparse import ArgumentParser".
+            index (int, optional): Where to insert the statement. Defaults to 0.
+
+        Returns:
+            bool: True if the statement was inserted, False if it already existed.
+        """
+        if self.has_import(statement):
+            return False
+        self.insert(LineOfCode(statement, 0), index)
+        return True
 
     @classmethod
     def from_lines_of_code(cls: Code, code: List[LineOfCode]) -> Code:
@@ -161,29 +352,23 @@ class Code:
     def insert(self, content: List[LineOfCode] | LineOfCode | Code, index: int) -> None:
         """insert given lines of code into self._file of class at given index
 
+        Inserting at the front or at the end of the code block takes amortized
+        constant time per inserted segment. Any other position costs O(n). A Code
+        instance is inserted as a single nested block that keeps its own indentation.
+
         Args:
             content (List[LineOfCode] | LineOfCode): Lines of code to insert
             index (int): Where to insert the given content
         """
-        first, second = self._split_file(index)
-
-        # insert content
-        if (
-            isinstance(content, list)
-            and type_of_all(content, LineOfCode)
-            and len(content)
-        ):
-            method = self._insert_lines_of_code
-        elif isinstance(content, LineOfCode):
-            method = self._insert_line_of_code
-        elif isinstance(content, Code):
-            method = self._insert_code
-        else:
+        depth = content._depth if isinstance(content, Code) else 0
+        segments = self._to_segments(content, depth)
+        if segments is None:
             msg = f"Wrong type to insert into content. You provided: {type(content), isinstance(content, Code), type(self)}"
             logging.error(msg)
             return
 
-        self._file = method(first, content, second)
+        self._insert_segments(segments, index)
+        self._register(content, depth)
 
     def replace(self, content: LineOfCode, index: int) -> None:
         """replaces the line of code at the given index with the given content
@@ -192,75 +377,158 @@ class Code:
             content (LineOfCode): content to put at given index
             index (int): where to put the replacing content
         """
-        self._file[index] = content
+        content = content.shifted(-self._depth)
+        self._unregister_line(self.get_line(index).shifted(-self._depth))
+        self._register_line(content)
+
+        position, inner_index = self._locate(index)
+        segment = self._file[position]
+        if isinstance(segment, _Block):
+            self._file[position] = self._replace_in_block(segment, content, inner_index)
+        else:
+            self._file[position] = content
 
-    def _split_file(self, index: int) -> Tuple[List[LineOfCode], List[LineOfCode]]:
-        """Split the code block into two parts at the specified index.
+    @classmethod
+    def _replace_in_block(cls, block: _Block, content: LineOfCode, index: int) -> _Block:
+        """Return a copy of the block with the line at the given index replaced.
+
+        Only the blocks on the path to the replaced line are copied, every other
+        segment is shared with the original block.
 
         Args:
-            index (int): The index at which to split the code block.
+            block (_Block): Block to replace the line in.
+            content (LineOfCode): Line in the coordinates of the block's parent.
+            index (int): Index of the line inside the block.
 
         Returns:
-            Tuple[List[LineOfCode], List[LineOfCode]]: A tuple containing two lists of code lines,
-                the first part before the index and the second part after the index.
-
+            _Block: The updated block.
         """
-        first = self._file[:index]
-        second = self._file[index:]
-        return first, second
+        segments = list(block.segments)
+        for position, segment in enumerate(segments):
+            length = segment.length if isinstance(segment, _Block) else 1
+            if index < length:
+                break
+            index -= length
+
+        content = content.shifted(-block.depth)
+        if isinstance(segment, _Block):
+            segments[position] = cls._replace_in_block(segment, content, index)
+        else:
+            segments[position] = content
+        return _Block(tuple(segments), block.depth, block.length)
 
-    @staticmethod
-    def _insert_line_of_code(
-        first: List[LineOfCode], line_of_code: LineOfCode, second: List[LineOfCode]
-    ) -> List[LineOfCode]:
-        """Insert a single line of code into the code block.
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Find the segment that holds the line at the given index.
 
         Args:
-            first (List[LineOfCode]): The first part of the code block.
-            line_of_code (LineOfCode): The line of code to insert.
-            second (List[LineOfCode]): The second part of the code block.
+            index (int): Index of the line. Negative values count from the end.
 
-        Returns:
-            List[LineOfCode]: The updated code block with the line_of_code inserted.
+        Raises:
+            IndexError: If the index is out of range.
 
+        Returns:
+            Tuple[int, int]: Position of the segment and index of the line inside it.
         """
-        return [*first, line_of_code, *second]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Code index out of range")
+
+        if index < self._length // 2:
+            start = 0
+            for position, segment in enumerate(self._file):
+                length = segment.length if isinstance(segment, _Block) else 1
+                if index < start + length:
+                    return position, index - start
+                start += length
+        else:
+            end = self._length
+            position = len(self._file)
+            for segment in reversed(self._file):
+                position -= 1
+                length = segment.length if isinstance(segment, _Block) else 1
+                end -= length
+                if index >= end:
+                    return position, index - end
+        raise IndexError("Code index out of range")
 
     @staticmethod
-    def _insert_lines_of_code(
-        first: List[LineOfCode],
-        lines_of_code: List[LineOfCode],
-        second: List[LineOfCode],
-    ) -> List[LineOfCode]:
-        """Insert multiple lines of code into the code block.
+    def _to_segments(
+        content: List[LineOfCode] | LineOfCode | Code, depth: int
+    ) -> List[LineOfCode | _Block] | None:
+        """Normalize insertable content into a list of segments.
 
         Args:
-            first (List[LineOfCode]): The first part of the code block.
-            lines_of_code (List[LineOfCode]): The lines of code to insert.
-            second (List[LineOfCode]): The second part of the code block.
+            content (List[LineOfCode] | LineOfCode | Code): Content to normalize.
+            depth (int): Indentation of a Code block relative to this code block.
 
         Returns:
-            List[LineOfCode]: The updated code block with the lines_of_code inserted.
+            List[LineOfCode | _Block] | None: The segments to insert or None if the content
+                can not be inserted.
 
         """
+        if (
+            isinstance(content, list)
+            and type_of_all(content, LineOfCode)
+            and len(content)
+        ):
+            return content
+        elif isinstance(content, LineOfCode):
+            return [content]
+        elif isinstance(content, Code):
+            if not len(content):
+                return []
+            return [_Block(tuple(content._file), depth, len(content))]
+        return None
 
-        return [*first, *lines_of_code, *second]
+    def _insert_segments(self, segments: List[LineOfCode | _Block], index: int) -> None:
+        """Insert segments into the code block.
 
-    def _insert_code(
-        self, first: List[LineOfCode], code: Code, second: List[LineOfCode]
-    ) -> List[LineOfCode]:
-        """Insert another Code instance into the code block.
+        Args:
+            segments (List[LineOfCode | _Block]): The segments to insert.
+            index (int): The line index at which the first segment should be placed.
+
+        """
+        length = self._length
+        if index < 0:
+            index = max(length + index, 0)
+        index = min(index, length)
+
+        if index == length:
+            self._file.extend(segments)
+        elif index == 0:
+            self._file.extendleft(reversed(segments))
+        else:
+            position, inner_index = self._locate(index)
+            if inner_index:
+                # the insert position lies within a block -> split it up
+                self._file.rotate(-position)
+                block: _Block = self._file.popleft()
+                for segment in reversed(self._flatten_block(block)):
+                    self._file.appendleft(segment)
+                self._file.rotate(position)
+                position, _ = self._locate(index)
+            # bring the insert position to the front, insert and rotate back
+            self._file.rotate(-position)
+            self._file.extendleft(reversed(segments))
+            self._file.rotate(position)
+
+        for segment in segments:
+            self._length += segment.length if isinstance(segment, _Block) else 1
+
+    @staticmethod
+    def _flatten_block(block: _Block) -> List[LineOfCode]:
+        """Resolve a block into single lines in the coordinates of its parent.
 
         Args:
-            first (List[LineOfCode]): The first part of the code block.
-            code (Code): The Code instance to insert.
-            second (List[LineOfCode]): The second part of the code block.
+            block (_Block): Block to resolve.
 
         Returns:
-            List[LineOfCode]: The updated code block with the code inserted.
-
+            List[LineOfCode]: The lines of the block.
         """
-        return self._insert_lines_of_code(first, code.file, second)
+        code = Code()
+        code._file.extend(block.segments)
+        return [line.shifted(offset + block.depth) for line, offset in code._walk()]
 
     def append(self, content: str | Code | LineOfCode | List[LineOfCode]) -> None:
         """Append content to the end of the code block.
@@ -270,11 +538,18 @@ class Code:
 
         """
         if isinstance(content, str):
-            self._file.append(LineOfCode(content=content, tab_level=self._tab_level))
+            line = LineOfCode(content=content, tab_level=self._tab_level)
+            self._file.append(line)
+            self._length += 1
+            self._register_line(line)
         elif isinstance(content, Code):
             content: Code
-            content.set_tab_level(self._tab_level)
-            self.insert(content, len(self))
+            if not len(content):
+                return
+            # the first line of the appended code is placed at the current tab level
+            depth = self._tab_level - content._first_tab_level()
+            self._insert_segments(self._to_segments(content, depth), len(self))
+            self._register(content, depth)
 
         elif isinstance(content, LineOfCode) or (
             isinstance(content, list)
@@ -283,24 +558,87 @@ class Code:
         ):
             self.insert(content, len(self))
 
+    def _walk(self) -> Iterator[Tuple[LineOfCode, int]]:
+        """Walk over all lines of the code tree in order of appearance.
+
+        Yields:
+            Tuple[LineOfCode, int]: Each line and the offset of the block it belongs to.
+        """
+        stack = [(iter(self._file), self._depth)]
+        while stack:
+            segments, offset = stack[-1]
+            for segment in segments:
+                if isinstance(segment, _Block):
+                    stack.append((iter(segment.segments), offset + segment.depth))
+                    break
+                yield segment, offset
+            else:
+                stack.pop()
+
+    def iter_lines(self) -> Iterator[str]:
+        """Lazily render the code block line by line.
+
+        Yields:
+            str: One rendered line of code including indentation and line break.
+
+        """
+        indents: Dict[int, str] = {}
+        for line, offset in self._walk():
+            level = line.tab_level + offset
+            indent = indents.get(level)
+            if indent is None:
+                indent = indents[level] = " " * (TAB_SIZE * max(level, 0))
+            yield indent + line.raw + "\n"
+
+    def render_to(self, stream: TextIO, buffer_size: int = RENDER_BUFFER_SIZE) -> None:
+        """Write the rendered code block in buffered chunks to a text stream.
+
+        The full source is never held in memory at once. Rendered lines are collected
+        until roughly `buffer_size` characters are pending and then written in one call.
+
+        Args:
+            stream (TextIO): Writable text stream, e.g. an open file or sys.stdout.
+            buffer_size (int, optional): Number of characters to collect before writing
+                to the stream. Defaults to RENDER_BUFFER_SIZE.
+
+        """
+        chunk: List[str] = []
+        pending = 0
+        for line in self.iter_lines():
+            chunk.append(line)
+            pending += len(line)
+            if pending >= buffer_size:
+                stream.write("".join(chunk))
+                chunk.clear()
+                pending = 0
+        if chunk:
+            stream.write("".join(chunk))
+
     @overwrite_protection
-    def write(self, path: str) -> None:
+    def write(self, path: str) -> bool:
         """Write the code block to a file.
 
         Args:
             path (str): The file path where the code block should be written.
 
+        Returns:
+            bool: False if overwriting an existing file was declined, True otherwise.
+
         """
         self._write(path=path)
 
-    def write_force(self, path: str):
+    def write_force(self, path: str) -> bool:
         """Write the code block to a file without asking if you to overwrite existing files.
 
         Args:
             path (str): The file path where the code block should be written.
 
+        Returns:
+            bool: Always True, the file is written.
+
         """
         self._write(path)
+        return True
 
     def _write(self, path: str, encoding: str = "utf-8"):
         """Write the code block to a specified file path.
@@ -313,7 +651,7 @@ class Code:
         msg = f"Create {path}"
         logging.info(msg)
         with open(path, "w", encoding=encoding) as text_file:
-            text_file.write(repr(self))
+            self.render_to(text_file)
 
     @property
     def file(self) -> List[LineOfCode]:
@@ -323,13 +661,28 @@ class Code:
             List[LineOfCode]: The list of code lines.
 
         """
-        return self._file
+        return [line.shifted(offset) for line, offset in self._walk()]
+
+    def _first_tab_level(self) -> int:
+        """Get the tab level of the first line without the offset set by `set_tab_level`.
+
+        Returns:
+            int: Tab level of the first line or 0 if the code block is empty.
+        """
+        if not self._file:
+            return 0
+        first = self._file[0]
+        if isinstance(first, _Block):
+            return first.first_tab_level()
+        return first.tab_level
 
     def set_tab_level(self, tab_level: int) -> None:
         """Set the tab level for all lines of code in the code block.
 
         This method sets the tab level for all lines of code in the code block.
-        It adjusts the indentation of each line based on the specified tab level.
+        The first line is moved to the specified tab level and every other line keeps
+        its indentation relative to the first line. No line is re-created; the offset
+        is applied when the code is rendered.
 
         Args:
             tab_level (int): The tab level to set. Must be a non-negative integer.
@@ -339,20 +692,20 @@ class Code:
             logging.warning("Given tab-level was smaller than 0. Set tab_level = 0")
             tab_level = 0
 
-        first_tab_level = self._file[0].tab_level
-
-        renewed_files: List[LineOfCode] = []
-        for line in self._file:
-            # reset by first tab-level
-            content = line.content[(TAB_SIZE * first_tab_level) :]  # noqa: E203
-            internal_tab_level = line.tab_level
-            renewed_files.append(
-                LineOfCode(content=content, tab_level=internal_tab_level + tab_level)
-            )
-        self._file = renewed_files
+        self._depth = tab_level - self._first_tab_level()
 
     def get_line(self, index: int) -> LineOfCode:
-        return self._file[index]
+        position, inner_index = self._locate(index)
+        segment = self._file[position]
+        offset = self._depth
+        while isinstance(segment, _Block):
+            offset += segment.depth
+            for segment in segment.segments:
+                length = segment.length if isinstance(segment, _Block) else 1
+                if inner_index < length:
+                    break
+                inner_index -= length
+        return segment.shifted(offset)
 
 
 class Function(Code):
@@ -575,5 +928,4 @@ class MatchCase(Code):
         self.append(content=f"match {self._name}:")
         self._tab_level += 1
         for match in self._matches:
-            match.set_tab_level(1)
             self.append(match)
@@ -1,8 +1,10 @@
 from argparse import ArgumentParser
-from copy import deepcopy
+from functools import partial
 import logging
 from typing import Any, Callable, Dict, List, Tuple, Type
 from pyargwriter.utils.casts import create_call_args, dict2args, format_help
+from pyargwriter._core.annotation_resolver import CONVERTER_IMPORTS
+from pyargwriter._core.block_cache import CodeBlockCache
 from pyargwriter._core.code_abstracts import (
     Code,
     DefaultCase,
@@ -12,7 +14,7 @@ from pyargwriter._core.code_abstracts import (
     MatchCase,
 )
 from abc import ABC, abstractmethod
-from pyargwriter.utils.file_system import load_json, load_yaml
+from pyargwriter.utils.file_system import iter_jsonl, load_binary, load_json, load_yaml
 from pyargwriter._core.structures import (
     ArgumentStructure,
     CommandStructure,
@@ -32,19 +34,23 @@ class AddArguments(Function):
     Args:
         infix (str): The infix string used to construct the function name and as a part of the argument names.
         arguments (List[ArgumentStructure], optional): A list of ArgumentStructure objects representing the arguments to be added.
+        shared_args_func (str, optional): Name of a function adding arguments shared with other
+            parsers, called after the given arguments are added. Defaults to None.
+        private (bool, optional): Whether to name the function _add_<infix>_args, a name no
+            function of a public command can have. Defaults to False.
 
     Attributes:
         (inherited attributes from Function...)
 
     Methods:
-        __init__(self, infix: str, arguments: List[ArgumentStructure] = {}) -> None:
+        __init__(self, infix: str, arguments: List[ArgumentStructure] = {}, shared_args_func: str = None, private: bool = False) -> None:
             Initializes a new AddArguments instance with the specified infix and arguments.
 
         _check_infix(self, infix: str) -> None:
             Checks the validity of the provided infix string and raises an error if it contains spaces,
             dashes, or is not in lowercase.
 
-        _add_function(self, arguments: List[ArgumentStructure]) -> None:
+        _add_function(self, arguments: List[ArgumentStructure], shared_args_func: str = None) -> None:
             Adds the code to add arguments to the ArgumentParser instance in the function.
 
     Example:
@@ -58,14 +64,20 @@ class AddArguments(Function):
 
     """
 
-    def __init__(self, infix: str, arguments: List[ArgumentStructure] = {}) -> None:
+    def __init__(
+        self,
+        infix: str,
+        arguments: List[ArgumentStructure] = {},
+        shared_args_func: str = None,
+        private: bool = False,
+    ) -> None:
         self._check_infix(infix)
-        name = f"add_{infix}_args"
+        name = f"{'_' if private else ''}add_{infix}_args"
         signature = {"parser": ArgumentParser}
         return_type = ArgumentParser
         super().__init__(name, signature, return_type)
 
-        self._add_function(arguments)
+        self._add_function(arguments, shared_args_func)
 
     def _check_infix(self, infix: str) -> None:
         """Check the validity of the provided infix string.
@@ -88,17 +100,22 @@ class AddArguments(Function):
         if infix != infix.lower():
             raise ValueError("infix is not correctly formatted")
 
-    def _add_function(self, arguments: List[ArgumentStructure]) -> None:
+    def _add_function(
+        self, arguments: List[ArgumentStructure], shared_args_func: str = None
+    ) -> None:
         """Add code to add arguments to the ArgumentParser instance in the function.
 
         Args:
             arguments (List[ArgumentStructure]): A list of ArgumentStructure objects representing the arguments to be added.
+            shared_args_func (str, optional): Name of a function adding shared arguments. Defaults to None.
 
         """
         for arg in arguments:
             self.append(
-                content=f"parser.add_argument({dict2args(vars(arg))})",
+                content=f"parser.add_argument({dict2args(arg.to_dict())})",
             )
+        if shared_args_func is not None:
+            self.append(content=f"parser = {shared_args_func}(parser)")
 
         self.append(content="return parser")
 
@@ -112,11 +129,13 @@ class SetupCommandParser(Function):
     Args:
         module_name (str): The name of the module or command group.
         no_imports (bool, optional): If True, omit importing ArgumentParser; otherwise, include the import.
+        lazy (bool, optional): If True, the arguments of a command are only added once its parser is used.
 
     Attributes:
         (inherited attributes from Function...)
         _commands (List[CommandStructure]): A list of CommandStructure objects representing the subcommands to be added.
         _imports (bool): Indicates whether ArgumentParser should be imported.
+        _lazy (bool): Indicates whether the command parsers are LazyArgumentParsers.
 
     Methods:
         generate_code(self, commands: List[CommandStructure]) -> Any:
@@ -135,36 +154,58 @@ class SetupCommandParser(Function):
 
     """
 
-    def __init__(self, module_name: str, no_imports: bool = False) -> None:
+    def __init__(
+        self, module_name: str, no_imports: bool = False, lazy: bool = False
+    ) -> None:
         name = f"setup_{module_name.lower()}_parser"
         signature = {"parser": ArgumentParser}
         return_type = Tuple[ArgumentParser, Dict[str, ArgumentParser]]
         super().__init__(name, signature, return_type)
 
+        self._module_name = module_name.lower()
         self._commands: List[CommandStructure]
+        self._module_args: List[ArgumentStructure] = []
         self._imports = not no_imports
+        self._lazy = lazy
 
-    def generate_code(self, commands: List[CommandStructure]) -> None:
+    def generate_code(
+        self,
+        commands: List[CommandStructure],
+        module_args: List[ArgumentStructure] = [],
+    ) -> None:
         """Generates the code to set up the ArgumentParser with subcommands, including imports (if enabled).
 
+        The given structures are only read, never modified.
+
         Args:
             commands (List[CommandStructure]): A list of CommandStructure objects representing the subcommands to be added.
+            module_args (List[ArgumentStructure], optional): Arguments needed to create the module instance.
+                They are added to the parser of every command by a single _add_<module>_init_args
+                function, which every add_<command>_args function calls. Defaults to [].
 
         """
         self._commands = commands
+        self._module_args = module_args
         self._add_command_parser()
+        self._add_converter_imports()
         if self._imports:
             self._add_imports()
         self._add_return()
 
     def _add_imports(self):
         """Add an import statement for ArgumentParser."""
-        self.insert(
-            LineOfCode(content="from typing import Tuple, Dict, List", tab_level=0), 0
-        )
-        self.insert(
-            LineOfCode(content="from argparse import ArgumentParser", tab_level=0), 0
-        )
+        self.add_import("from typing import Tuple, Dict, List")
+        self.add_import("from argparse import ArgumentParser")
+        if self._lazy:
+            self.add_import("from pyargwriter.api.lazy_parser import LazyArgumentParser")
+
+    def _add_converter_imports(self) -> None:
+        """Add the imports of the argument types which are no builtins, e.g. Path."""
+        for args in [self._module_args, *(command.args for command in self._commands)]:
+            for arg in args:
+                statement = CONVERTER_IMPORTS.get(getattr(arg, "type", None))
+                if statement is not None:
+                    self.add_import(statement)
 
     def _add_command_parser(self) -> None:
         """Add code to set up the subcommand parser and add subcommands."""
@@ -172,29 +213,54 @@ class SetupCommandParser(Function):
         self.append(content="subparser = {}")
 
         subparser_name = "command_subparser"
+        # some decorators defer their arguments even if the command arguments are added eagerly
+        lazy = self._lazy or any(
+            DecoratorWrapGenerator.get_class(flag.name).defers_parser
+            for command in self._commands
+            for flag in command.decorator_flags
+        )
+        parser_class = ", parser_class=LazyArgumentParser" if lazy else ""
         self.append(
-            content=f"{subparser_name} = parser.add_subparsers(dest='command', title='command')",
+            content=f"{subparser_name} = parser.add_subparsers(dest='command', title='command'{parser_class})",
         )
 
+        init_args_func = None
+        if self._module_args:
+            # private, a command named <module>_init has an add_<module>_init_args function
+            init_args = AddArguments(
+                f"{self._module_name}_init", self._module_args, private=True
+            )
+            init_args_func = init_args.name
+
         for command in self._commands:
-            args = vars(command)
-            decorator_flags = args.pop("decorator_flags")
-            parser_var_name = self._add_parser(subparser_name=subparser_name, **args)
-            self.append(
-                content=f"{parser_var_name} = add_{parser_var_name}_args({parser_var_name})",
+            parser_var_name = self._add_parser(
+                subparser_name=subparser_name,
+                name=command.name,
+                help=command.help,
+                args=command.args,
+                shared_args_func=init_args_func,
             )
+            if self._lazy:
+                content = f"{parser_var_name} = {parser_var_name}.defer(add_{parser_var_name}_args)"
+            else:
+                content = f"{parser_var_name} = add_{parser_var_name}_args({parser_var_name})"
+            self.append(content=content)
 
-            for flag in decorator_flags:
+            for flag in command.decorator_flags:
                 cls = DecoratorWrapGenerator.get_class(flag.name)
                 self = cls.add_on_parser_level(self, flag.values)
             self.append(f"subparser['{parser_var_name}'] = {parser_var_name}")
 
+        if init_args_func is not None:
+            self.insert(init_args, 0)
+
     def _add_parser(
         self,
         subparser_name,
         name: str,
         help: str = "",
         args: List[ArgumentStructure] = [],
+        shared_args_func: str = None,
     ) -> str:
         """Add code to set up a subcommand parser and add its arguments.
 
@@ -203,6 +269,7 @@ class SetupCommandParser(Function):
             name (str): The name of the subcommand.
             help (str, optional): The help message for the subcommand.
             args (List[ArgumentStructure], optional): A list of ArgumentStructure objects representing the subcommand's arguments.
+            shared_args_func (str, optional): Name of the function adding the arguments of the module. Defaults to None.
 
         Returns:
             str: The variable name of the subcommand parser.
@@ -212,18 +279,26 @@ class SetupCommandParser(Function):
         self.append(
             content=f"{var_name} = {subparser_name}.add_parser('{name.replace('_', '-')}', help='{format_help(help)}')",
         )
-        self._add_args(name_infix=var_name, args=args)
+        self._add_args(name_infix=var_name, args=args, shared_args_func=shared_args_func)
         return var_name
 
-    def _add_args(self, name_infix: str, args: List[ArgumentStructure]) -> None:
+    def _add_args(
+        self,
+        name_infix: str,
+        args: List[ArgumentStructure],
+        shared_args_func: str = None,
+    ) -> None:
         """Add arguments to a subcommand parser.
 
         Args:
             name_infix (str): The infix used to construct variable names.
             args (List[ArgumentStructure]): A list of ArgumentStructure objects representing the subcommand's arguments.
+            shared_args_func (str, optional): Name of the function adding the arguments of the module. Defaults to None.
 
         """
-        args_func = AddArguments(infix=name_infix, arguments=args)
+        args_func = AddArguments(
+            infix=name_infix, arguments=args, shared_args_func=shared_args_func
+        )
         self.insert(args_func, 0)
 
     def _add_return(self):
@@ -239,10 +314,12 @@ class SetupParser(Function):
     multiple modules with individual subparsers. Imports for ArgumentParser are included based on the number of modules.
 
     Args:
-        None
+        lazy (bool, optional): If True, module and command parsers are LazyArgumentParsers which
+            only add their arguments once they are used. Defaults to False.
 
     Attributes:
         (inherited attributes from Function...)
+        _lazy (bool): Indicates whether lazy parsers are generated.
 
     Methods:
         generate_code(self, modules: ModuleStructures) -> None:
@@ -271,53 +348,85 @@ class SetupParser(Function):
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, lazy: bool = False) -> None:
         name = "setup_parser"
         signature = {"parser": ArgumentParser}
         return_type = ArgumentParser
         super().__init__(name, signature, return_type)
 
-    def generate_code(self, modules: ModuleStructures) -> None:
+        self._lazy = lazy
+
+    def generate_code(
+        self, modules: ModuleStructures, blocks: CodeBlockCache = None
+    ) -> None:
         """Generates the code to set up the ArgumentParser with subcommands for multiple modules.
 
         Args:
             modules (ModuleStructures): A ModuleStructures object containing information about the modules and their subcommands.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
 
         """
         if len(modules) == 1:
             # only one class -> only command parser as setup_parser
             module: ModuleStructure = modules.modules[0]
-            setup_command_parser = SetupCommandParser(module.name)
-            module.add_args(module.args)
-            setup_command_parser.generate_code(module.commands)
+            setup_command_parser = self._generate_command_parser(module, False, blocks)
             self.insert(setup_command_parser, 0)
-            self.append(content=f"parser, _ = {setup_command_parser.name}(parser)")
+            self.append(content=f"parser, _ = setup_{module.name.lower()}_parser(parser)")
             self.append(content="return parser")
 
         elif len(modules) > 1:
             # multiple classes -> unify multiple parser architectures
+            parser_class = ", parser_class=LazyArgumentParser" if self._lazy else ""
             self.append(
-                content="module_subparser = parser.add_subparsers(dest='module', title='module')"
+                content=f"module_subparser = parser.add_subparsers(dest='module', title='module'{parser_class})"
             )
             no_imports = len(modules) - 1
             for module in modules.modules:
                 self.append(
                     content=f"{module.name.lower()}_parser = module_subparser.add_parser(name='{module.name}', help='{module.help}')"
                 )
-                setup_command_parser = SetupCommandParser(
-                    module.name, no_imports=bool(no_imports)
+                setup_command_parser = self._generate_command_parser(
+                    module, bool(no_imports), blocks
                 )
                 no_imports -= 1
-                module.add_args(module.args)
-                setup_command_parser.generate_code(module.commands)
                 self.insert(setup_command_parser, 0)
-                self.append(
-                    content=f"{module.name.lower()}_parser = {setup_command_parser.name}({module.name.lower()}_parser)"
-                )
+                module_parser = f"{module.name.lower()}_parser"
+                setup_name = f"setup_{module.name.lower()}_parser"
+                if self._lazy:
+                    content = f"{module_parser} = {module_parser}.defer({setup_name})"
+                else:
+                    content = f"{module_parser} = {setup_name}({module_parser})"
+                self.append(content=content)
             self.append(content="return parser")
         else:
             logging.info("No modules given. No setup parser code needs to be created")
 
+    def _generate_command_parser(
+        self, module: ModuleStructure, no_imports: bool, blocks: CodeBlockCache = None
+    ) -> Code:
+        """Generates the setup_<module>_parser function of a module with its add_<command>_args functions.
+
+        Args:
+            module (ModuleStructure): The module to generate the functions for.
+            no_imports (bool): If True, omit the imports of the generated functions.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
+
+        Returns:
+            Code: The generated functions.
+        """
+
+        def build() -> Code:
+            setup_command_parser = SetupCommandParser(
+                module.name, no_imports=no_imports, lazy=self._lazy
+            )
+            setup_command_parser.generate_code(module.commands, module.args)
+            return setup_command_parser
+
+        if blocks is None:
+            return build()
+        data = {"module": module.to_dict(), "no_imports": no_imports, "lazy": self._lazy}
+        return blocks.get_or_build("setup_command_parser", data, build)
+
     def from_yaml(self, yaml_file: str):
         """Generates the code based on a YAML configuration file.
 
@@ -363,27 +472,47 @@ class CreateParser(Function):
 
 
 class Execute(Function):
-    """Creates execute function to execute program logic"""
+    """Creates execute function to execute program logic
 
-    def __init__(self) -> None:
+    Args:
+        lazy_imports (bool, optional): If True, every class is imported inside the branch
+            executing it instead of at the top of the file. Defaults to False.
+        dispatch_table (bool, optional): If True, every command gets its own handler function
+            and execute looks the handler up in a dictionary keyed by (module, command)
+            instead of matching modules and commands case by case. Defaults to False.
+    """
+
+    def __init__(self, lazy_imports: bool = False, dispatch_table: bool = False) -> None:
         name = "execute"
         signature = {"args": dict}
         return_type = bool
         super().__init__(name, signature, return_type)
 
+        self._lazy_imports = lazy_imports
+        self._dispatch_table = dispatch_table
+        self._project_root: str
+        self._blocks: CodeBlockCache = None
+
     def generate_code(
         self,
         modules: ModuleStructures,
         project_root: str,
         setup_parser_file: str = "parser.py",
+        blocks: CodeBlockCache = None,
     ) -> None:
-        self._insert_command_calling(modules)
+        self._project_root = project_root
+        self._blocks = blocks
+        if self._dispatch_table:
+            self._insert_command_table(modules)
+        else:
+            self._insert_command_calling(modules)
 
         modules_to_import = {
             f"setup_{module_name.lower()}_parser": setup_parser_file
             for module_name in modules.locations.keys()
         }
-        modules_to_import = {**modules_to_import, **modules.locations}
+        if not self._lazy_imports:
+            modules_to_import = {**modules_to_import, **modules.locations}
         modules_to_import["setup_parser"] = setup_parser_file
 
         self._insert_imports(modules_to_import, project_root)
@@ -398,16 +527,7 @@ class Execute(Function):
         """
         if len(modules) == 1:
             module: ModuleStructure = modules.modules[0]
-            self.append(
-                content=f"module = {module.name}({create_call_args(module.args)})"
-            )
-            self.append(
-                content=f"_, command_parser = setup_{module.name.lower()}_parser(ArgumentParser())"
-            )
-
-            # generate matches from commands
-            match_case = self._generate_command_match_case(module.commands)
-            self.append(match_case)
+            self.append(self._generate_module_body(module))
         elif len(modules) > 1:
             match_case = self._generate_module_match_case(modules.modules)
             self.append(match_case)
@@ -416,32 +536,21 @@ class Execute(Function):
 
         self.append("return True")
 
-    def _generate_command_match_case(
-        self, commands: List[CommandStructure]
-    ) -> MatchCase:
+    def _generate_command_match_case(self, module: ModuleStructure) -> MatchCase:
         """Generates match cases for commands.
 
         Args:
-            commands (List[CommandStructure]): A list of CommandStructure objects representing the subcommands.
+            module (ModuleStructure): The module whose commands should be matched.
 
         Returns:
             MatchCase: A MatchCase object containing match cases for commands.
         """
         matches: List[Match] = []
 
-        for command in commands:
+        for command in module.commands:
             command: CommandStructure
             match_name = command.name.replace("_", "-")
-
-            body = Code.from_str(
-                code=f"module.{command.name}({create_call_args(command.args)})"
-            )
-            # add wrapper funcs
-            for flag in command.decorator_flags:
-                flag: DecoratorFlagStructure
-                cls = DecoratorWrapGenerator.get_class(flag.name)
-                body = cls.add_on_execute_level(body, flag.values)
-
+            body = self._generate_command_body(module, command)
             match_code = Match(match_value=match_name, body=body)
             matches.append(match_code)
 
@@ -451,6 +560,125 @@ class Execute(Function):
         match_case = MatchCase(match_name="args['command']", matches=matches)
         return match_case
 
+    def _generate_command_body(
+        self, module: ModuleStructure, command: CommandStructure
+    ) -> Code:
+        """Generates the code calling a command on an existing module instance.
+
+        The parsers of the commands are only rebuilt for a command whose decorator needs
+        access to them. All other commands run without building the argparse tree a
+        second time.
+
+        Args:
+            module (ModuleStructure): The module the command belongs to.
+            command (CommandStructure): The command to call.
+
+        Returns:
+            Code: The calling code, wrapped by the decorators of the command.
+        """
+        body = Code.from_str(
+            code=f"module.{command.name}({create_call_args(command.args)})"
+        )
+        if self._needs_command_parser(command):
+            body.insert(
+                LineOfCode(
+                    f"_, command_parser = setup_{module.name.lower()}_parser(ArgumentParser())"
+                ),
+                0,
+            )
+        # add wrapper funcs
+        for flag in command.decorator_flags:
+            flag: DecoratorFlagStructure
+            cls = DecoratorWrapGenerator.get_class(flag.name)
+            body = cls.add_on_execute_level(body, flag.values)
+        return body
+
+    def _insert_command_table(self, modules: ModuleStructures) -> None:
+        """Adds one handler function per command, the dispatch table and the lookup.
+
+        The handlers and the table are placed in front of the execute function. Looking up
+        a command costs the same for every command, no matter how many commands there are.
+
+        Args:
+            modules (ModuleStructures): A ModuleStructures object containing module and command information.
+        """
+        if len(modules) == 0:
+            logging.error("No given modules to process")
+
+        handlers = Code()
+        table = Code()
+        table.append(content="COMMANDS = {")
+        table._tab_level += 1
+        for module in modules.modules:
+            module: ModuleStructure
+            handlers.append(
+                self._generate_block(
+                    "execute_handlers", module, partial(self._generate_handlers, module)
+                )
+            )
+            for command in module.commands:
+                command: CommandStructure
+                match_name = command.name.replace("_", "-")
+                handler_name = self._handler_name(module, command)
+                table.append(content=f"('{module.name}', '{match_name}'): {handler_name},")
+        table._tab_level -= 1
+        table.append(content="}")
+        handlers.append(table)
+        self.insert(handlers, 0)
+
+        if len(modules) == 1:
+            module_name = f"'{modules.modules[0].name}'"
+        else:
+            module_name = "args.get('module')"
+        self.append(
+            content=f"handler = COMMANDS.get(({module_name}, args.get('command')))"
+        )
+        self.append(content="if handler is None:")
+        self._tab_level += 1
+        self.append(content="return False")
+        self._tab_level -= 1
+        self.append(content="handler(args)")
+        self.append("return True")
+
+    def _generate_handlers(self, module: ModuleStructure) -> Code:
+        """Generates the handler functions of all commands of a module.
+
+        Args:
+            module (ModuleStructure): The module to generate the handlers for.
+
+        Returns:
+            Code: The handler functions.
+        """
+        handlers = Code()
+        for command in module.commands:
+            handlers.append(self._generate_command_handler(module, command))
+        return handlers
+
+    @staticmethod
+    def _handler_name(module: ModuleStructure, command: CommandStructure) -> str:
+        return f"_handle_{module.name.lower()}_{command.name.lower()}"
+
+    def _generate_command_handler(
+        self, module: ModuleStructure, command: CommandStructure
+    ) -> Function:
+        """Generates the handler function which creates the module and calls one command.
+
+        Args:
+            module (ModuleStructure): The module the command belongs to.
+            command (CommandStructure): The command to call.
+
+        Returns:
+            Function: The handler function.
+        """
+        handler = Function(self._handler_name(module, command), {"args": dict}, None)
+        if self._lazy_imports:
+            handler.append(content=self._import_statement(module.name, module.location))
+        handler.append(
+            content=f"module = {module.name}({create_call_args(module.args)})"
+        )
+        handler.append(self._generate_command_body(module, command))
+        return handler
+
     def _generate_module_match_case(self, modules: List[ModuleStructure]) -> MatchCase:
         """Generates match cases for modules.
 
@@ -465,14 +693,7 @@ class Execute(Function):
         for module in modules:
             module: ModuleStructure
             match_name = module.name
-            body = Code.from_str(
-                f"module = {module.name}({create_call_args(module.args)})"
-            )
-            body.append(
-                content=f"_, command_parser = setup_{module.name.lower()}_parser(ArgumentParser())"
-            )
-            body.append(self._generate_command_match_case(module.commands))
-            
+            body = self._generate_module_body(module)
             matches.append(Match(match_value=match_name, body=body))
 
         # add default case
@@ -481,6 +702,63 @@ class Execute(Function):
         match_cases = MatchCase(match_name="args['module']", matches=matches)
         return match_cases
 
+    def _generate_module_body(self, module: ModuleStructure) -> Code:
+        """Generates the code creating a module instance and matching its commands.
+
+        Args:
+            module (ModuleStructure): The module to generate the code for.
+
+        Returns:
+            Code: The generated code.
+        """
+
+        def build() -> Code:
+            body = Code()
+            if self._lazy_imports:
+                body.append(self._import_statement(module.name, module.location))
+            body.append(f"module = {module.name}({create_call_args(module.args)})")
+            body.append(self._generate_command_match_case(module))
+            return body
+
+        return self._generate_block("execute_module", module, build)
+
+    def _generate_block(
+        self, kind: str, module: ModuleStructure, build: Callable[[], Code]
+    ) -> Code:
+        """Reuse the code generated for an unchanged module in a previous run or generate it.
+
+        Args:
+            kind (str): Kind of the generated code.
+            module (ModuleStructure): The module the code is generated from.
+            build (Callable[[], Code]): Generates the code.
+
+        Returns:
+            Code: The generated code.
+        """
+        if self._blocks is None:
+            return build()
+        data = {
+            "module": module.to_dict(),
+            "project_root": self._project_root,
+            "lazy_imports": self._lazy_imports,
+        }
+        return self._blocks.get_or_build(kind, data, build)
+
+    @staticmethod
+    def _needs_command_parser(command: CommandStructure) -> bool:
+        """Check if one of the decorators of a command needs the command parsers at execution.
+
+        Args:
+            command (CommandStructure): The command to check.
+
+        Returns:
+            bool: True if the command parsers have to be available in the case of the command.
+        """
+        return any(
+            DecoratorWrapGenerator.get_class(flag.name).needs_command_parser
+            for flag in command.decorator_flags
+        )
+
     def _insert_imports(self, files: Dict[str, str], project_root: str) -> None:
         """Generates import statements for modules.
 
@@ -492,21 +770,37 @@ class Execute(Function):
         """
         imports = Code()
         imports.append(content="from argparse import ArgumentParser")
-        imports.append(content="from pathlib import Path")
-        imports.append(content="from pyargwriter import api")
 
         for module_name, path in files.items():
-            path = (
-                project_root.rstrip("/")
-                + "/"
-                + path.split(project_root)[-1].lstrip("/")
-            )
-            path = path.rstrip(".py")
-            path = path.replace("/", ".")
-            path = path.lstrip(".")
-            imports.append(content=f"from {path} import {module_name}")
+            imports.append(content=self._import_statement(module_name, path, project_root))
         self.insert(imports, 0)
 
+    def _import_statement(
+        self, module_name: str, path: str, project_root: str = None
+    ) -> str:
+        """Generates the statement importing a name from a file of the project.
+
+        Args:
+            module_name (str): The name to import.
+            path (str): The path to the file defining the name.
+            project_root (str, optional): what is the folder of the project main.
+                Defaults to the project root given to generate_code.
+
+        Returns:
+            str: The import statement.
+        """
+        if project_root is None:
+            project_root = self._project_root
+        path = (
+            project_root.rstrip("/")
+            + "/"
+            + path.split(project_root)[-1].lstrip("/")
+        )
+        path = path.rstrip(".py")
+        path = path.replace("/", ".")
+        path = path.lstrip(".")
+        return f"from {path} import {module_name}"
+
 
 class MainFunc(Function):
     """Represents the main function of a Python script that uses argparse for command-line arguments.
@@ -605,6 +899,10 @@ class MainCaller(Code):
 
 class DecoratorWrapGenerator(Code, ABC):
     wrapper_func: Callable
+    needs_command_parser: bool = False
+    """bool: whether the wrapped call needs the parser of its command at execution"""
+    defers_parser: bool = False
+    """bool: whether the parser level code is deferred until the parser of its command is used"""
 
     def __init__(self):
         super().__init__()
@@ -652,6 +950,9 @@ class HydraDecoratorWrapGenerator(DecoratorWrapGenerator):
 
     wrapper_func = hydra_wrapper
     parser_func = add_hydra_parser
+    needs_command_parser = True
+    # get_args_parser imports hydra, only the parser of the hydra command pays for it
+    defers_parser = True
 
     def __init__(self):
         super().__init__()
@@ -660,27 +961,23 @@ class HydraDecoratorWrapGenerator(DecoratorWrapGenerator):
     def add_on_parser_level(
         cls, existing_code: Code, flag_values: dict[str, Any]
     ) -> Code:
-        # check for existing import
-        insert_line = (
+        # insert import if it does not exist yet
+        existing_code.add_import(
             f"from pyargwriter.api.hydra_plugin import {cls.parser_func.__name__}"
         )
-        if insert_line not in existing_code:
-            insert_line = LineOfCode(insert_line, 0)
-            # insert imports
-            existing_code.insert(insert_line, 0)
+        existing_code.add_import("from pyargwriter.api.lazy_parser import LazyArgumentParser")
 
         # assuming last line: <command-name> = add_<command-name>_args(<command-name>)
-        last_line = existing_code.get_line(-1).content
-        last_line = last_line.lstrip(" ").rstrip("\n")
-        cmd_name = last_line.split(" = ")[0]
-        existing_code.append(f"{cmd_name} = {cls.parser_func.__name__}({cmd_name})")
+        # or with lazy parsers: <command-name> = <command-name>.defer(add_<command-name>_args)
+        cmd_name = existing_code.get_line(-1).raw.split(" = ")[0]
+        existing_code.append(f"{cmd_name} = {cmd_name}.defer({cls.parser_func.__name__})")
         return existing_code
 
     @classmethod
     def add_on_execute_level(
         cls, existing_code: Code, flag_values: dict[str, Any]
     ) -> Code:
-        execute_line = existing_code.get_line(-1).content.lstrip(" ").rstrip("\n")
+        execute_line = existing_code.get_line(-1).raw
         func = execute_line.split("(")[0]
         cmd = func.split(".")[-1]
         args = "args"
@@ -700,12 +997,14 @@ class HydraDecoratorWrapGenerator(DecoratorWrapGenerator):
             kwargs.append("config_path=str(Path.cwd())")
 
         kwargs = ", ".join(kwargs)
-        replace_line = (
-            "api.hydra_plugin."
-            + cls.wrapper_func.__name__
-            + f"({func}, {args}, {parser}, {kwargs})"
-        )
+        replace_line = cls.wrapper_func.__name__ + f"({func}, {args}, {parser}, {kwargs})"
         existing_code.replace(LineOfCode(replace_line, 0), -1)
+
+        # import hydra support only inside the case of the decorated command
+        existing_code.add_import(
+            f"from pyargwriter.api.hydra_plugin import {cls.wrapper_func.__name__}"
+        )
+        existing_code.add_import("from pathlib import Path")
         return existing_code
 
 
@@ -715,17 +1014,25 @@ class CodeGenerator:
     This class provides methods to generate Python code for creating argparse-based command-line parsers, including the setup parser, main function, and main caller.
 
     Args:
-        None
+        lazy_subparsers (bool, optional): If True, the generated parser only adds the arguments
+            of the executed command. Defaults to False.
+        lazy_imports (bool, optional): If True, the generated main file only imports the class
+            of the executed command. Defaults to False.
+        dispatch_table (bool, optional): If True, the generated main file looks commands up in a
+            dictionary of handler functions instead of matching them case by case. Defaults to False.
 
     Attributes:
+        _options (Dict[str, bool]): The generation options.
         _setup_parser (SetupParser): An instance of the SetupParser class for generating setup parser code.
         _main_func (MainFunc): An instance of the MainFunc class for generating main function code.
         _main_caller (MainCaller): An instance of the MainCaller class for generating main caller code.
 
     Methods:
-        from_dict(modules: List[Dict[str, Any]], parser_file: str) -> None: Generates code based on a list of module dictionaries and a parser file name.
+        from_dict(modules: List[Dict[str, Any]], parser_file: str, blocks: CodeBlockCache = None) -> None: Generates code based on a list of module dictionaries and a parser file name.
+        from_structures(modules: ModuleStructures, parser_file: str, blocks: CodeBlockCache = None) -> None: Generates code based on parsed module structures and a parser file name.
         from_yaml(yaml_file: str, parser_file: str): Generates code from a YAML file and a parser file name.
         from_json(json_file: str, parser_file: str): Generates code from a JSON file and a parser file name.
+        from_binary(binary_file: str, parser_file: str): Generates code from a binary structure file and a parser file name.
         write(setup_parser_path: str, main_path: str, force: bool = False): Writes the generated code to specified files.
 
     Example:
@@ -736,32 +1043,71 @@ class CodeGenerator:
         >>> generator.write("setup_parser.py", "main.py")
     """
 
-    def __init__(self) -> None:
-        self._setup_parser = SetupParser()
+    def __init__(
+        self,
+        lazy_subparsers: bool = False,
+        lazy_imports: bool = False,
+        dispatch_table: bool = False,
+    ) -> None:
+        self._options = {
+            "lazy_subparsers": lazy_subparsers,
+            "lazy_imports": lazy_imports,
+            "dispatch_table": dispatch_table,
+        }
+        self._setup_parser = SetupParser(lazy=lazy_subparsers)
         self._create_parser = CreateParser()
-        self._execute = Execute()
+        self._execute = Execute(lazy_imports=lazy_imports, dispatch_table=dispatch_table)
         self._main_func = MainFunc()
         self._main_caller = MainCaller()
 
-    def from_dict(self, modules: List[Dict[str, Any]], parser_file: str) -> None:
+    def from_dict(
+        self,
+        modules: List[Dict[str, Any]],
+        parser_file: str,
+        blocks: CodeBlockCache = None,
+    ) -> None:
         """Generates code based on a list of module dictionaries and a parser file name.
 
         Args:
             modules (List[Dict[str, Any]]): A list of dictionaries representing the module structure.
             parser_file (str): The path to the future parser file.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
         """
-        modules = ModuleStructures.from_dict(modules)
+        self.from_structures(ModuleStructures.from_dict(modules), parser_file, blocks)
+
+    def from_structures(
+        self,
+        modules: ModuleStructures,
+        parser_file: str,
+        blocks: CodeBlockCache = None,
+    ) -> None:
+        """Generates code based on already parsed module structures and a parser file name.
 
-        self._setup_parser.generate_code(deepcopy(modules))
+        None of the generators modifies the given structures, so the same instance is
+        shared by all of them without being copied.
+
+        Args:
+            modules (ModuleStructures): The module structure to generate code for.
+            parser_file (str): The path to the future parser file.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run.
+                Only the code of changed modules is generated again. Defaults to None.
+        """
+        if blocks is not None:
+            # the order of the modules and the options shape the files as a whole
+            blocks.set_context(
+                {"parser_file": parser_file, "modules": modules.names, **self._options}
+            )
+        self._setup_parser.generate_code(modules, blocks)
 
         project_root = parser_file.split("/")[0]
         self._execute.generate_code(
-            modules=deepcopy(modules),
+            modules=modules,
             project_root=project_root,
             setup_parser_file=parser_file,
+            blocks=blocks,
         )
 
-        self._create_parser.generate_code(deepcopy(modules))
+        self._create_parser.generate_code(modules)
         self._execute.append(self._create_parser)
 
         self._main_func.generate_code()
@@ -769,40 +1115,83 @@ class CodeGenerator:
 
         self._main_func.append(self._main_caller)
 
-    def from_yaml(self, yaml_file: str, parser_file: str) -> None:
+    def from_yaml(
+        self, yaml_file: str, parser_file: str, blocks: CodeBlockCache = None
+    ) -> None:
         """Generates code from a YAML file and a parser file name.
 
         Args:
             yaml_file (str): The path to the YAML file containing module structure data.
             parser_file (str): The path to the future parser file.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
 
         """
         data = load_yaml(yaml_file)
-        self.from_dict(data, parser_file)
+        self.from_dict(data, parser_file, blocks)
 
-    def from_json(self, json_file: str, parser_file: str) -> None:
+    def from_json(
+        self, json_file: str, parser_file: str, blocks: CodeBlockCache = None
+    ) -> None:
         """Generates code from a JSON file and a parser file name.
 
         Args:
             json_file (str): The path to the JSON file containing module structure data.
             parser_file (str): The path to the future parser file.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
 
         """
         data = load_json(json_file)
-        self.from_dict(data, parser_file)
+        self.from_dict(data, parser_file, blocks)
 
-    def write(
-        self, setup_parser_path: str, main_path: str, force: bool = False
+    def from_binary(
+        self, binary_file: str, parser_file: str, blocks: CodeBlockCache = None
     ) -> None:
-        """Generates code from a JSON file and a parser file name.
+        """Generates code from a binary structure file and a parser file name.
 
         Args:
-            json_file (str): The path to the JSON file containing module structure data.
+            binary_file (str): The path to the binary file containing module structure data.
             parser_file (str): The path to the future parser file.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
+
+        """
+        data = load_binary(binary_file)
+        self.from_dict(data, parser_file, blocks)
+
+    def from_jsonl(
+        self, jsonl_file: str, parser_file: str, blocks: CodeBlockCache = None
+    ) -> None:
+        """Generates code from a JSON Lines file with one module per line and a parser file name.
+
+        The modules are converted to structures line by line, so the file as a whole is
+        never loaded. The generated files depend on all modules at once, e.g. a single
+        module is not added as a subcommand, so the structures themselves are collected
+        before the code is generated.
+
+        Args:
+            jsonl_file (str): The path to the JSON Lines file containing module structure data.
+            parser_file (str): The path to the future parser file.
+            blocks (CodeBlockCache, optional): Code generated for unchanged modules in a previous run. Defaults to None.
+
+        """
+        modules = ModuleStructures()
+        modules.modules.extend(map(ModuleStructure.from_dict, iter_jsonl(jsonl_file)))
+        self.from_structures(modules, parser_file, blocks)
+
+    def write(
+        self, setup_parser_path: str, main_path: str, force: bool = False
+    ) -> bool:
+        """Writes the generated parser and main file.
+
+        Args:
+            setup_parser_path (str): The path to write the parser file to.
+            main_path (str): The path to write the main file to.
+            force (bool, optional): Whether to overwrite existing files without asking. Defaults to False.
+
+        Returns:
+            bool: False if overwriting one of the files was declined, True otherwise.
         """
         if force:
-            self._setup_parser.write_force(path=setup_parser_path)
-            self._main_func.write_force(path=main_path)
-        else:
-            self._setup_parser.write(path=setup_parser_path)
-            self._main_func.write(path=main_path)
+            written = self._setup_parser.write_force(path=setup_parser_path)
+            return self._main_func.write_force(path=main_path) and written
+        written = self._setup_parser.write(path=setup_parser_path)
+        return self._main_func.write(path=main_path) and written
@@ -2,9 +2,14 @@ import ast
 import inspect
 import logging
 from ast import ClassDef, FunctionDef, NodeVisitor
-from typing import Dict, List, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, TextIO, Tuple
 
+from pyargwriter._core.annotation_resolver import AnnotationResolver
 from pyargwriter._core.docstring_parser import DocstringParser
+from pyargwriter._core.inspection_cache import InspectionCache
 from pyargwriter._core.structures import (
     ArgumentStructure,
     CommandStructure,
@@ -13,27 +18,56 @@ from pyargwriter._core.structures import (
     ModuleStructures,
 )
 import pyargwriter.decorator
-from pyargwriter.utils.file_system import write_json, write_yaml
+from pyargwriter.utils.file_system import (
+    load_file_tree,
+    write_binary,
+    write_json,
+    write_json_line,
+    write_yaml,
+)
 
+# maximum number of files inspected by a worker process at once
+MAX_BATCH_SIZE = 16
 
-class DecoratorInspector(NodeVisitor):
-    def __init__(self):
-        self.imports = {}  # Track imports for resolving decorator origins
-        self.local_definitions = set()  # Track locally defined functions
-        
-        self.decorator_args = {}
-        """key: decorator_name, value: arguments of decorator, default values included"""
+
+class DecoratorInspector:
+    def __init__(self, imports: Dict[str, str] = None):
+        self.imports = {} if imports is None else imports  # Track imports for resolving decorator origins
+        self.local_definitions = set()  # Track locally defined functions of the current file
 
         self.decorator_module = pyargwriter.decorator
 
-    def visit_FunctionDef(self, node):
-        self.decorator_args = {}
+    def reset(self) -> None:
+        """Forget the imports and definitions of the previously inspected file."""
+        self.imports.clear()
+        self.local_definitions.clear()
+
+    def inspect(self, node: FunctionDef) -> List[DecoratorFlagStructure]:
+        """Resolve the pyargwriter decorators of a function.
+
+        Args:
+            node (FunctionDef): The function.
+
+        Returns:
+            List[DecoratorFlagStructure]: The pyargwriter decorators with their explicitly given arguments.
+        """
         self.local_definitions.add(node.name)
+        # key: decorator_name, value: arguments of decorator
+        decorator_args = {}
         for decorator in node.decorator_list:
-            self.inspect_decorator(decorator)
+            resolved = self.inspect_decorator(decorator)
+            if resolved is not None:
+                decorator_args[resolved[0]] = resolved[1]
 
-        
-    def inspect_decorator(self, decorator):
+        res = []
+        for name, args in decorator_args.items():
+            flag_struct = DecoratorFlagStructure()
+            flag_struct.name = name
+            flag_struct.values = args
+            res.append(flag_struct)
+        return res
+
+    def inspect_decorator(self, decorator) -> Tuple[str, dict] | None:
         if isinstance(decorator, ast.Name):
             pass
             # name = decorator.id
@@ -52,7 +86,7 @@ class DecoratorInspector(NodeVisitor):
 
             if not self._resolve_origin(name):
                 logging.info(f"decorator: {name}, did not pass import check")
-                return
+                return None
             
             # Extract explicitly provided args and kwargs
             args = [ast.literal_eval(arg) for arg in decorator.args]
@@ -61,13 +95,10 @@ class DecoratorInspector(NodeVisitor):
             # Combine with defaults from the decorator signature
             decorator_func = getattr(self.decorator_module, name)
             final_args = self._build_arg_dict(args, kwargs, decorator_func, include_defaults=False)
-            self.decorator_args[name] = final_args
+            return name, final_args
         else:
             print("  Decorator: Complex or dynamic decorator, unable to resolve.")
-
-    def update_imports(self, imports: dict[str, str]):
-        self.imports = {**self.imports, **imports}
-   
+        return None
 
     def _resolve_origin(self, name: str) -> bool:
         """checks if the given decorator name comes from pyargwriter or is just defined somewhere else and has nothing to do with pyargwriter
@@ -113,30 +144,33 @@ class DecoratorInspector(NodeVisitor):
         default_values.update(kwargs)
 
         return default_values
-    
-    def get_decorator_flag_structs(self) -> List[DecoratorFlagStructure]:
-        res = []
-        for name, args in self.decorator_args.items():
-            flag_struct = DecoratorFlagStructure()
-            flag_struct.name = name
-            flag_struct.values = args
-            res.append(flag_struct)
-        return res
 
 
-class ClassInspector(NodeVisitor):
-    """inspect class internals like the functions, ..."""
+class ClassInspector:
+    """collects the signatures of the functions of a single class
 
-    def __init__(self, docstring_format: str = "google"):
-        super().__init__()
+    A new instance is created for every class and released once the class is emitted,
+    so no state is carried over from one class to the next.
+    """
 
+    def __init__(
+        self,
+        docstring_parser: DocstringParser,
+        decorator_inspector: DecoratorInspector,
+        annotation_resolver: AnnotationResolver = None,
+    ):
         self._func_signatures: Dict[str, Tuple[List[ArgumentStructure], str, List[DecoratorFlagStructure]]] = {}
         """dict[str, Tuple[List[ArgumentStructure], str]: key: func_name, value:"""
 
-        self.decorator_inspector = DecoratorInspector()
-        self.docstring_parser = DocstringParser.build_parser(docstring_format)
+        self.decorator_inspector = decorator_inspector
+        self.docstring_parser = docstring_parser
+        self.annotation_resolver = (
+            AnnotationResolver(decorator_inspector.imports)
+            if annotation_resolver is None
+            else annotation_resolver
+        )
 
-    def visit_FunctionDef(self, node: FunctionDef):
+    def add_function(self, node: FunctionDef):
         if node.name == "__init__":
             # 1. do init stuff
             arguments = self._get_arguments(node)
@@ -145,8 +179,7 @@ class ClassInspector(NodeVisitor):
 
         elif node.name[0] != "_":
             # 2. only use functions marked as public functions
-            self.decorator_inspector.visit_FunctionDef(node)
-            decorator_flag_structs = self.decorator_inspector.get_decorator_flag_structs()
+            decorator_flag_structs = self.decorator_inspector.inspect(node)
             arguments = self._get_arguments(node, exceptions=self._get_argument_exceptions(decorator_flag_structs))
             help_message = self.docstring_parser.get_help_msg(node)
             # help_message, _ = self._get_help_msgs(node)
@@ -189,15 +222,9 @@ class ClassInspector(NodeVisitor):
 
 
             if arg.annotation:
-                if isinstance(arg.annotation, ast.Name):
-                    argument.type = eval(arg.annotation.id)
-                elif isinstance(arg.annotation, ast.Subscript):
-                    # argument type is a list of some values
-                    # logging.warning(
-                    #     "List annotation automatically set to List[str]. Please adapt in generated code if this is not equal to your application."
-                    # )
-                    argument.type = eval(arg.annotation.slice.id)
-                    argument.nargs = "+"
+                # type, nargs and choices
+                for key, value in self.annotation_resolver.resolve(arg.annotation).items():
+                    setattr(argument, key, value)
             if default is not None:
                 if isinstance(default, ast.List):
                     argument.default = [item.value for item in default.elts]
@@ -267,13 +294,27 @@ class ClassInspector(NodeVisitor):
 
 
 class ModuleInspector(NodeVisitor):
-    def __init__(self, docstring_format: str = "google"):
+    """walks the tree of a file once and collects imports, classes and their functions
+
+    While a class is visited, its functions are collected by a ClassInspector of this
+    class only. Everything the inspection of a file depends on, like the imports, is reset
+    when the next file is visited.
+    """
+
+    def __init__(self, docstring_format: str = "google", headers_only: bool = False):
         super().__init__()
 
-        self.func_inspector = ClassInspector(docstring_format)
         self.docstring_parser = DocstringParser.build_parser(docstring_format)
+        self._docstring_format = docstring_format
+        self._headers_only = headers_only
         self._modules = ModuleStructures()
         self.imports = {}
+        self.decorator_inspector = DecoratorInspector(self.imports)
+        self.annotation_resolver = AnnotationResolver(self.imports)
+        self._class_inspector: ClassInspector = None
+        self._location: str = None
+        # receives every module as soon as it is inspected
+        self._emit: Callable[[ModuleStructure], None] = self._modules.modules.append
 
     def __repr__(self) -> str:
         """Return a string representation of the parsed modules.
@@ -281,49 +322,274 @@ class ModuleInspector(NodeVisitor):
         Returns:
             str: A string representation of the parsed modules.
         """
-        result = "["
-        for module in self.modules.modules:
-            result += repr(module)
-            result += ",\n"
-        result = result.rstrip(",\n")
-        result += "]"
-        return result
+        return "".join(self._iter_repr())
+
+    def _iter_repr(self) -> Iterator[str]:
+        """Lazily produce the string representation of the parsed modules.
+
+        Yields:
+            str: Consecutive pieces of the representation, one module at a time.
+        """
+        yield "["
+        for idx, module in enumerate(self.modules.modules):
+            if idx:
+                yield ",\n"
+            yield repr(module)
+        yield "]"
+
+    def render_to(self, stream: TextIO) -> None:
+        """Write the string representation of the parsed modules to a text stream.
+
+        Args:
+            stream (TextIO): Writable text stream, e.g. an open file or sys.stdout.
+        """
+        for chunk in self._iter_repr():
+            stream.write(chunk)
+        stream.write("\n")
     
     def visit_Import(self, node):
+        if self._class_inspector is not None:
+            # imports in a class body are not visible to decorators
+            return
         for alias in node.names:
             self.imports[alias.asname or alias.name] = alias.name
 
     def visit_ImportFrom(self, node):
+        if self._class_inspector is not None:
+            return
         module = node.module
         for alias in node.names:
             full_name = f"{module}.{alias.name}" if module else alias.name
             self.imports[alias.asname or alias.name] = full_name
 
-    def visit_ClassDef(self, node: ClassDef):
-        module_structure = ModuleStructure()
-        module_structure.name = node.name
+    def visit_FunctionDef(self, node: FunctionDef):
+        if self._class_inspector is None:
+            # module level function, may define classes or import modules
+            self.generic_visit(node)
+            return
+        # the body of a function inside a class is not inspected
+        self._class_inspector.add_function(node)
 
-        self.func_inspector.decorator_inspector.update_imports(self.imports)
-        self.func_inspector.visit(node)
-        init_args = self.func_inspector.init_args
-        module_structure.args.extend(init_args)
-        module_structure.help = self._get_class_help_msg(node)
+    def visit_ClassDef(self, node: ClassDef):
+        if self._class_inspector is not None:
+            # functions of a nested class are added to the enclosing class
+            self.generic_visit(node)
+            return
 
-        module_structure.commands.extend(self.func_inspector.public_def)
-        self._modules.modules.append(module_structure)
+        self._class_inspector = ClassInspector(
+            self.docstring_parser, self.decorator_inspector, self.annotation_resolver
+        )
+        try:
+            self.generic_visit(node)
+            module_structure = ModuleStructure()
+            module_structure.name = node.name
+            module_structure.args.extend(self._class_inspector.init_args)
+            module_structure.help = self._get_class_help_msg(node)
+            module_structure.commands.extend(self._class_inspector.public_def)
+        finally:
+            self._class_inspector = None
+
+        if self._location is not None:
+            module_structure.location = self._location
+        self._emit(module_structure)
 
     def visit(self, node, location: str = None):
-        super().visit(node)
-        for ms in self._modules.modules:
-            if hasattr(ms, "location") or location is None:
-                continue
-            ms.location = location
+        if not isinstance(node, ast.Module):
+            super().visit(node)
+            return
 
-    def write(self, path: str):
-        """Write the extracted structured information to a file in YAML or JSON format.
+        self.decorator_inspector.reset()
+        self.annotation_resolver.reset()
+        self._location = location
+        try:
+            super().visit(node)
+        finally:
+            self._location = None
+            # parsed docstrings are only reused during the walk over this file
+            self.docstring_parser.reset()
+
+    def visit_files(
+        self,
+        files: Iterable[str],
+        jobs: int = 1,
+        cache: InspectionCache = None,
+        emit: Callable[[ModuleStructure], None] = None,
+    ) -> None:
+        """Inspect the given source files and collect their modules.
+
+        Each file is looked up in the given cache and inspected as soon as it is
+        produced by the given iterable, so discovery and inspection overlap. Files found
+        in the cache are not parsed at all. With more than one job the missing files are
+        parsed and inspected in worker processes. The modules are passed on in the order
+        of the given files, so the result does not depend on which worker finishes first.
+
+        Args:
+            files (Iterable[str]): Paths to the Python source files.
+            jobs (int, optional): Number of worker processes. Defaults to 1.
+            cache (InspectionCache, optional): Cache of already inspected files. Defaults to None.
+            emit (Callable[[ModuleStructure], None], optional): Receives every module as soon
+                as it is inspected, in the order of the files, instead of collecting it in
+                modules. Defaults to None.
+        """
+        if emit is not None:
+            self._emit = emit
+        try:
+            self._visit_files(files, jobs, cache)
+        finally:
+            self._emit = self._modules.modules.append
+
+    def _visit_files(
+        self, files: Iterable[str], jobs: int = 1, cache: InspectionCache = None
+    ) -> None:
+        """Inspect the given source files and pass their modules to the current receiver.
+
+        The files are looked up in the cache as they are produced by the given iterable.
+        Files missing in the cache are inspected right away or, with more than one job,
+        handed to the worker processes in small batches.
+
+        Args:
+            files (Iterable[str]): Paths to the Python source files.
+            jobs (int, optional): Number of worker processes. Defaults to 1.
+            cache (InspectionCache, optional): Cache of already inspected files. Defaults to None.
+        """
+        if jobs > 1:
+            self._visit_files_parallel(files, jobs, cache)
+        elif cache is None:
+            for file in files:
+                self.visit(load_file_tree(file, self._headers_only), file)
+        else:
+            for file in files:
+                modules = cache.get(file)
+                if modules is None:
+                    modules = self._inspect_file(file)
+                    cache.put(file, modules)
+                for module in modules:
+                    self._emit(module)
+
+        if cache is not None:
+            cache.save()
+
+    def _visit_files_parallel(
+        self, files: Iterable[str], jobs: int, cache: InspectionCache = None
+    ) -> None:
+        """Inspect the files missing in the cache in worker processes.
+
+        Every file waits in a queue until its modules are known, either from the cache or
+        from the batch of a worker inspecting it. The modules at the head of the queue
+        are passed on as soon as they are known, so they keep the order of the files.
+        The first batches hold a single file to keep every worker busy from the start.
+
+        Args:
+            files (Iterable[str]): Paths to the Python source files.
+            jobs (int): Number of worker processes.
+            cache (InspectionCache, optional): Cache of already inspected files. Defaults to None.
+        """
+        inspect_func = partial(
+            inspect_files,
+            docstring_format=self._docstring_format,
+            headers_only=self._headers_only,
+        )
+        # entries of [file, modules, future of the batch, position in the batch]
+        queue: Deque[list] = deque()
+        batch: List[list] = []
+        num_batches = 0
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for file in files:
+                modules = None if cache is None else cache.get(file)
+                entry = [file, modules, None, 0]
+                queue.append(entry)
+                if modules is None:
+                    batch.append(entry)
+                    if len(batch) >= min(MAX_BATCH_SIZE, num_batches // jobs + 1):
+                        self._submit_batch(executor, inspect_func, batch)
+                        batch = []
+                        num_batches += 1
+                self._emit_known(queue, cache)
+
+            if batch:
+                self._submit_batch(executor, inspect_func, batch)
+            self._emit_known(queue, cache, wait=True)
+
+    @staticmethod
+    def _submit_batch(
+        executor: ProcessPoolExecutor, inspect_func: Callable, batch: List[list]
+    ) -> None:
+        """Hand a batch of files to a worker process.
+
+        Args:
+            executor (ProcessPoolExecutor): The worker processes.
+            inspect_func (Callable): Inspects a list of files.
+            batch (List[list]): Queue entries of the files to inspect.
+        """
+        future = executor.submit(inspect_func, [entry[0] for entry in batch])
+        for position, entry in enumerate(batch):
+            entry[2] = future
+            entry[3] = position
+
+    def _emit_known(
+        self, queue: Deque[list], cache: InspectionCache = None, wait: bool = False
+    ) -> None:
+        """Pass on the modules at the head of the queue which are already known.
+
+        Args:
+            queue (Deque[list]): Entries of the files in their order.
+            cache (InspectionCache, optional): Stores the modules inspected by the workers. Defaults to None.
+            wait (bool, optional): Whether to wait for the workers until the queue is empty. Defaults to False.
+        """
+        while queue:
+            file, modules, future, position = queue[0]
+            if modules is None:
+                if future is None or not (wait or future.done()):
+                    return
+                modules = future.result()[position]
+                if cache is not None:
+                    cache.put(file, modules)
+            queue.popleft()
+            for module in modules:
+                self._emit(module)
+
+    def _inspect_file(self, file: str) -> List[ModuleStructure]:
+        """Inspect a single file and return its modules instead of passing them on.
+
+        Args:
+            file (str): Path to the Python source file.
+
+        Returns:
+            List[ModuleStructure]: The modules defined in the file.
+        """
+        modules = []
+        emit, self._emit = self._emit, modules.append
+        try:
+            self.visit(load_file_tree(file, self._headers_only), file)
+        finally:
+            self._emit = emit
+        return modules
+
+    def stream(
+        self, files: Iterable[str], path: str, jobs: int = 1, cache: InspectionCache = None
+    ) -> None:
+        """Inspect the given source files and write every module to a JSON Lines file.
+
+        Every module is written to its own line as soon as it is inspected and not kept
+        afterwards, so the inspected modules do not accumulate in memory.
+
+        Args:
+            files (Iterable[str]): Paths to the Python source files.
+            path (str): The path to the JSON Lines (.jsonl) output file.
+            jobs (int, optional): Number of worker processes. Defaults to 1.
+            cache (InspectionCache, optional): Cache of already inspected files. Defaults to None.
+        """
+        with open(path, "wb") as file:
+            self.visit_files(
+                files, jobs, cache, emit=lambda module: write_json_line(module.to_dict(), file)
+            )
+
+    def write(self, path: str, compact: bool = False):
+        """Write the extracted structured information to a file in YAML, JSON, JSON Lines or binary format.
 
         Args:
             path (str): The path to the output file.
+            compact (bool, optional): Whether to write JSON without indentation. Defaults to False.
 
         """
         if "." not in path:
@@ -339,7 +605,14 @@ class ModuleInspector(NodeVisitor):
             case "yml":
                 write_func = write_yaml
             case "json":
-                write_func = write_json
+                write_func = partial(write_json, compact=compact)
+            case "pawb":
+                write_func = write_binary
+            case "jsonl":
+                with open(path, "wb") as file:
+                    for module in self.modules.modules:
+                        write_json_line(module.to_dict(), file)
+                return
             case _:
                 msg = f"Not implemented write method for file type {file_type}"
                 logging.error(msg)
@@ -361,3 +634,25 @@ class ModuleInspector(NodeVisitor):
     @property
     def modules(self) -> ModuleStructures:
         return self._modules
+
+
+def inspect_files(
+    files: List[str], docstring_format: str = "google", headers_only: bool = False
+) -> List[List[ModuleStructure]]:
+    """Parse and inspect a batch of source files with one ModuleInspector.
+
+    Used by the worker processes of ModuleInspector.visit_files. Everything the
+    inspection of a file depends on is reset for the next file, so the result is the
+    same as inspecting every file on its own.
+
+    Args:
+        files (List[str]): Paths to the Python source files.
+        docstring_format (str, optional): Format of the docstrings in the files. Defaults to "google".
+        headers_only (bool, optional): Whether to drop the bodies of methods before parsing.
+            Defaults to False.
+
+    Returns:
+        List[List[ModuleStructure]]: The modules defined in every file, in the order of the files.
+    """
+    inspector = ModuleInspector(docstring_format, headers_only)
+    return [inspector._inspect_file(file) for file in files]
@@ -1,16 +1,69 @@
-from abc import ABC, abstractmethod
-from ast import ClassDef, FunctionDef
+from abc import ABC
+from ast import AST, AsyncFunctionDef, ClassDef, FunctionDef
 import ast
 import logging
 import re
 from typing import Dict
 
+from pyargwriter._core.docstring_tokenizer import (
+    DocstringGrammar,
+    DocstringSections,
+    SectionTokenizer,
+)
+
+
+class ParsedDocstring:
+    """Sections of the docstring of a single node, parsed once.
+
+    Args:
+        text (str | None): The cleaned docstring, None if the node has no docstring.
+        summary (str): First line of the docstring.
+        args (Dict[str, str]): Help message of every argument.
+        returns (str): Help message of the return value.
+        raises (Dict[str, str]): Help message of every raised exception.
+        args_error (Exception, optional): Error raised when the arguments are accessed,
+            if the argument section could not be parsed. Defaults to None.
+
+    Attributes:
+        text (str | None): The cleaned docstring, None if the node has no docstring.
+        summary (str): First line of the docstring.
+        returns (str): Help message of the return value.
+        raises (Dict[str, str]): Help message of every raised exception.
+    """
+
+    def __init__(
+        self,
+        text: str | None,
+        summary: str,
+        args: Dict[str, str],
+        returns: str,
+        raises: Dict[str, str],
+        args_error: Exception = None,
+    ) -> None:
+        self.text = text
+        self.summary = summary
+        self._args = args
+        self.returns = returns
+        self.raises = raises
+        self._args_error = args_error
+
+    @property
+    def args(self) -> Dict[str, str]:
+        """Dict[str, str]: help message of every argument"""
+        if self._args_error is not None:
+            raise self._args_error
+        return self._args
+
 
 class DocstringParser(ABC):
     default_help_msg = "--no-documentation-exists--"
+    grammar: DocstringGrammar
+    """how the format marks sections, set by every subclass"""
 
     def __init__(self):
         super().__init__()
+        self._tokenizer = SectionTokenizer(self.grammar)
+        self._parsed: Dict[AST, ParsedDocstring] = {}
 
     def _check_for_docstring(self, node: FunctionDef):
         doc_str = ast.get_docstring(node)
@@ -20,7 +73,25 @@ class DocstringParser(ABC):
             error_msg = f"Process was aborted because of missing doc-string in function: {node.name}"
             raise ValueError(error_msg)
 
-    @abstractmethod
+    def reset(self) -> None:
+        """Forget the docstrings parsed so far, e.g. after the walk over a file."""
+        self._parsed.clear()
+
+    def parse(self, node: FunctionDef | ClassDef) -> ParsedDocstring:
+        """Parse the docstring of a node or return the result of a previous call.
+
+        Args:
+            node (FunctionDef | ClassDef): ast object to extract docstring from
+
+        Returns:
+            ParsedDocstring: sections of the docstring
+        """
+        parsed = self._parsed.get(node)
+        if parsed is None:
+            parsed = self._parse(node)
+            self._parsed[node] = parsed
+        return parsed
+
     def get_help_msg(self, node: FunctionDef | ClassDef) -> str:
         """get first line of docstring
 
@@ -30,9 +101,11 @@ class DocstringParser(ABC):
         Returns:
             str: first line of docstring
         """
-        raise NotImplementedError
+        parsed = self.parse(node)
+        if parsed.text is None:
+            logging.info(f"No docstring in {node.name} found.")
+        return parsed.summary
 
-    @abstractmethod
     def get_arg_help_msg(self, node: FunctionDef) -> Dict[str, str]:
         """get key value pairs of arg_name and its help message
 
@@ -42,9 +115,8 @@ class DocstringParser(ABC):
         Returns:
             Dict[str, str]: arg_name: help message
         """
-        raise NotImplementedError
+        return dict(self.parse(node).args)
 
-    @abstractmethod
     def get_return_msg(self, node: FunctionDef) -> str:
         """get help message of return type
 
@@ -54,35 +126,53 @@ class DocstringParser(ABC):
         Returns:
             str: help message of return type
         """
-        raise NotImplementedError
-
-    @classmethod
-    def build_parser(cls, docstring_format: str) -> "DocstringParser":
-        class_dict = {
-            "epytext": EpyTextParser,
-            "rest": ReSTParser,
-            "google": GoogleParser,
-            "numpydoc": NumpyDocParser,
-        }
-        return class_dict[docstring_format.lower()]()
+        return self.parse(node).returns
 
+    def _parse(self, node: FunctionDef | ClassDef) -> ParsedDocstring:
+        """Parse all sections of the docstring of a node.
 
-class GoogleParser(DocstringParser):
-    def __init__(self):
-        super().__init__()
+        Args:
+            node (FunctionDef | ClassDef): ast object to extract docstring from
 
-    def get_help_msg(self, node):
+        Returns:
+            ParsedDocstring: sections of the docstring
+        """
         docstring = ast.get_docstring(node)
-        if docstring is None:
-            logging.info(f"No docstring in {node.name} found.")
-            msg = self.default_help_msg
-        else:
-            msg = docstring.split("\n")[0]
+        sections = None if docstring is None else self._tokenizer.tokenize(docstring)
+
+        args, args_error = {}, None
+        if isinstance(node, (FunctionDef, AsyncFunctionDef)):
+            try:
+                args = self._parse_node_args(node, sections)
+            except ValueError as error:
+                # raised when the arguments are accessed, the other sections stay usable
+                args_error = error
+
+        if sections is None:
+            return ParsedDocstring(
+                None, self.default_help_msg, args, self.default_help_msg, {}, args_error
+            )
+        return ParsedDocstring(
+            docstring,
+            sections.summary or self.default_help_msg,
+            args,
+            self._parse_returns(sections),
+            self._parse_raises(sections),
+            args_error,
+        )
+
+    def _parse_node_args(
+        self, node: FunctionDef, sections: DocstringSections | None
+    ) -> Dict[str, str]:
+        """Get the help messages of the arguments of a function.
 
-        return msg
+        Args:
+            node (FunctionDef): the function
+            sections (DocstringSections | None): sections of the docstring, None if there is no docstring
 
-    def get_arg_help_msg(self, node):
-        docstring = ast.get_docstring(node)
+        Returns:
+            Dict[str, str]: arg_name: help message
+        """
         num_args = len(node.args.args)
         if num_args == 0:
             return dict()
@@ -90,137 +180,140 @@ class GoogleParser(DocstringParser):
             return dict()
 
         # if there is no documentation
-        if docstring is None:
+        if sections is None:
             keys = [arg.arg for arg in node.args.args]
             if "self" in keys:
                 keys.remove("self")
             values = [self.default_help_msg] * len(keys)
-            res = dict(zip(keys, values))
-            return res
-
-        # if there is a sufficient docstring -> extract message
-        docstring: list[str] = docstring.split("\n")
-        args_start = docstring.index("Args:")
-        res = {}
-        for idx in range(args_start + 1, args_start + num_args):
-            splits = docstring[idx].strip(" ").split(":")
-            arg = splits[0]
-            # delete bracket with type information
-            arg = re.sub(r"\(.*?\)", "", arg).strip(" ")
-            msg = ":".join(splits[1:]).strip(" ")
-            res[arg] = msg
-        return res
+            return dict(zip(keys, values))
 
-    def get_return_msg(self, node):
-        return super().get_return_msg(node)
+        return self._parse_args(node, sections)
 
+    def _parse_args(self, node: FunctionDef, sections: DocstringSections) -> Dict[str, str]:
+        """get key value pairs of arg_name and its help message
 
-class EpyTextParser(DocstringParser):
-    """Parser for Epydoc-style docstrings.
-    
-    Format:
-        @param arg_name: description
-        @type arg_name: type
-        @return: description
-        @rtype: return_type
-    """
-    
-    def __init__(self):
-        super().__init__()
+        Arguments without documentation get the default help message.
 
-    def get_help_msg(self, node):
-        """Extract first line of docstring for Epydoc format.
-        
         Args:
-            node: AST node (FunctionDef or ClassDef)
-            
-        Returns:
-            str: First line of docstring or default message
-        """
-        docstring = ast.get_docstring(node)
-        if docstring is None:
-            logging.info(f"No docstring in {node.name} found.")
-            return self.default_help_msg
-        
-        # Get first line before any @param tags
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("@"):
-                return stripped
-        
-        return self.default_help_msg
+            node (FunctionDef): the documented function
+            sections (DocstringSections): sections of the docstring
 
-    def get_arg_help_msg(self, node):
-        """Extract argument help messages from Epydoc format.
-        
-        Args:
-            node: FunctionDef AST node
-            
         Returns:
-            Dict[str, str]: Mapping of argument names to help messages
+            Dict[str, str]: arg_name: help message
         """
-        docstring = ast.get_docstring(node)
-        num_args = len(node.args.args)
-        
-        if num_args == 0:
-            return dict()
-        elif num_args == 1 and node.args.args[0].arg == "self":
-            return dict()
-        
-        # if there is no documentation
-        if docstring is None:
-            keys = [arg.arg for arg in node.args.args]
-            if "self" in keys:
-                keys.remove("self")
-            values = [self.default_help_msg] * len(keys)
-            return dict(zip(keys, values))
-        
-        # Parse @param tags
-        lines = docstring.split("\n")
-        res = {}
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("@param "):
-                # Format: @param arg_name: description
-                match = re.match(r"@param\s+(\w+):\s*(.*)", stripped)
-                if match:
-                    arg_name = match.group(1)
-                    description = match.group(2)
-                    res[arg_name] = description if description else self.default_help_msg
-        
-        # Fill in missing arguments with default message
+        res = {
+            key: text or self.default_help_msg
+            for key, text in sections.entries("args")
+            if key is not None
+        }
         for arg in node.args.args:
             if arg.arg != "self" and arg.arg not in res:
                 res[arg.arg] = self.default_help_msg
-        
         return res
 
-    def get_return_msg(self, node):
-        """Extract return message from Epydoc format.
-        
+    def _parse_returns(self, sections: DocstringSections) -> str:
+        """get help message of return type
+
         Args:
-            node: FunctionDef AST node
-            
+            sections (DocstringSections): sections of the docstring
+
         Returns:
-            str: Return description or default message
+            str: help message of return type
         """
-        docstring = ast.get_docstring(node)
-        if docstring is None:
-            return self.default_help_msg
-        
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("@return:") or stripped.startswith("@returns:"):
-                # Format: @return: description
-                match = re.match(r"@returns?:\s*(.*)", stripped)
-                if match:
-                    description = match.group(1)
-                    return description if description else self.default_help_msg
-        
-        return self.default_help_msg
+        description = " ".join(text or key or "" for key, text in sections.entries("returns"))
+        return description.strip() or self.default_help_msg
+
+    def _parse_raises(self, sections: DocstringSections) -> Dict[str, str]:
+        """get key value pairs of exception and its help message
+
+        Args:
+            sections (DocstringSections): sections of the docstring
+
+        Returns:
+            Dict[str, str]: exception: help message
+        """
+        return {
+            key: text or self.default_help_msg
+            for key, text in sections.entries("raises")
+            if key is not None
+        }
+
+    @classmethod
+    def build_parser(cls, docstring_format: str) -> "DocstringParser":
+        class_dict = {
+            "epytext": EpyTextParser,
+            "rest": ReSTParser,
+            "google": GoogleParser,
+            "numpydoc": NumpyDocParser,
+            "auto": AutoParser,
+        }
+        return class_dict[docstring_format.lower()]()
+
+
+class GoogleParser(DocstringParser):
+    """Parser for Google-style docstrings.
+
+    Format:
+        Args:
+            arg_name (type): description
+                which may span several lines
+
+        Returns:
+            return_type: description
+
+        Raises:
+            ExceptionType: description
+    """
+
+    grammar = DocstringGrammar(
+        sections={
+            "Args": "args",
+            "Arguments": "args",
+            "Parameters": "args",
+            "Returns": "returns",
+            "Return": "returns",
+            "Yields": "returns",
+            "Raises": "raises",
+        },
+        header=r"(?P<name>[A-Z][A-Za-z]*(?: [A-Za-z]+)?):$",
+        # name (type): description, the type may contain one level of brackets
+        entry=r"(?P<key>[^\s:(][^:(]*?)\s*(?:\((?P<type>[^()]*(?:\([^()]*\)[^()]*)*)\))?\s*:(?:\s+(?P<text>.*))?$",
+    )
+
+    def __init__(self):
+        super().__init__()
+
+    def _parse_args(self, node, sections):
+        if "args" not in sections:
+            raise ValueError(f"No 'Args:' section in docstring of {node.name}")
+        # documented arguments only, they are matched with the signature by position
+        return {key: text for key, text in sections.entries("args") if key is not None}
+
+
+class EpyTextParser(DocstringParser):
+    """Parser for Epydoc-style docstrings.
+    
+    Format:
+        @param arg_name: description
+        @type arg_name: type
+        @return: description
+        @rtype: return_type
+        @raise ExceptionType: description
+    """
+
+    grammar = DocstringGrammar(
+        sections={
+            "param": "args",
+            "return": "returns",
+            "returns": "returns",
+            "raise": "raises",
+            "raises": "raises",
+        },
+        field=r"@(?P<tag>\w+)(?:\s+(?:[^:]*\s)?(?P<key>[^\s:]+))?:(?:\s*(?P<text>.*))$",
+    )
+
+    def __init__(self):
+        super().__init__()
 
 
 class ReSTParser(DocstringParser):
@@ -231,104 +324,27 @@ class ReSTParser(DocstringParser):
         :type arg_name: type
         :return: description
         :rtype: return_type
+        :raises ExceptionType: description
     """
-    
-    def __init__(self):
-        super().__init__()
 
-    def get_help_msg(self, node):
-        """Extract first line of docstring for ReST format.
-        
-        Args:
-            node: AST node (FunctionDef or ClassDef)
-            
-        Returns:
-            str: First line of docstring or default message
-        """
-        docstring = ast.get_docstring(node)
-        if docstring is None:
-            logging.info(f"No docstring in {node.name} found.")
-            return self.default_help_msg
-        
-        # Get first line before any :param tags
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.startswith(":"):
-                return stripped
-        
-        return self.default_help_msg
+    grammar = DocstringGrammar(
+        sections={
+            "param": "args",
+            "parameter": "args",
+            "arg": "args",
+            "argument": "args",
+            "return": "returns",
+            "returns": "returns",
+            "raise": "raises",
+            "raises": "raises",
+            "except": "raises",
+            "exception": "raises",
+        },
+        field=r":(?P<tag>\w+)(?:\s+(?:[^:]*\s)?(?P<key>[^\s:]+))?:(?:\s*(?P<text>.*))$",
+    )
 
-    def get_arg_help_msg(self, node):
-        """Extract argument help messages from ReST format.
-        
-        Args:
-            node: FunctionDef AST node
-            
-        Returns:
-            Dict[str, str]: Mapping of argument names to help messages
-        """
-        docstring = ast.get_docstring(node)
-        num_args = len(node.args.args)
-        
-        if num_args == 0:
-            return dict()
-        elif num_args == 1 and node.args.args[0].arg == "self":
-            return dict()
-        
-        # if there is no documentation
-        if docstring is None:
-            keys = [arg.arg for arg in node.args.args]
-            if "self" in keys:
-                keys.remove("self")
-            values = [self.default_help_msg] * len(keys)
-            return dict(zip(keys, values))
-        
-        # Parse :param tags
-        lines = docstring.split("\n")
-        res = {}
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith(":param "):
-                # Format: :param arg_name: description
-                match = re.match(r":param\s+(\w+):\s*(.*)", stripped)
-                if match:
-                    arg_name = match.group(1)
-                    description = match.group(2)
-                    res[arg_name] = description if description else self.default_help_msg
-        
-        # Fill in missing arguments with default message
-        for arg in node.args.args:
-            if arg.arg != "self" and arg.arg not in res:
-                res[arg.arg] = self.default_help_msg
-        
-        return res
-
-    def get_return_msg(self, node):
-        """Extract return message from ReST format.
-        
-        Args:
-            node: FunctionDef AST node
-            
-        Returns:
-            str: Return description or default message
-        """
-        docstring = ast.get_docstring(node)
-        if docstring is None:
-            return self.default_help_msg
-        
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith(":return:") or stripped.startswith(":returns:"):
-                # Format: :return: description
-                match = re.match(r":returns?:\s*(.*)", stripped)
-                if match:
-                    description = match.group(1)
-                    return description if description else self.default_help_msg
-        
-        return self.default_help_msg
+    def __init__(self):
+        super().__init__()
 
 
 class NumpyDocParser(DocstringParser):
@@ -344,149 +360,122 @@ class NumpyDocParser(DocstringParser):
         -------
         return_type
             description
+
+        Raises
+        ------
+        ExceptionType
+            description
     """
-    
+
+    grammar = DocstringGrammar(
+        sections={
+            "Parameters": "args",
+            "Returns": "returns",
+            "Yields": "returns",
+            "Raises": "raises",
+        },
+        header=r"(?P<name>[A-Z][A-Za-z]*(?: [A-Za-z]+)?)$",
+        underlined=True,
+        # name : type, the description follows on the next lines
+        entry=r"(?P<key>[^:]+?)(?:\s*:\s*(?P<type>.*))?$",
+    )
+
     def __init__(self):
         super().__init__()
 
-    def get_help_msg(self, node):
-        """Extract first line of docstring for NumPy format.
-        
-        Args:
-            node: AST node (FunctionDef or ClassDef)
-            
-        Returns:
-            str: First line of docstring or default message
-        """
-        docstring = ast.get_docstring(node)
-        if docstring is None:
-            logging.info(f"No docstring in {node.name} found.")
-            return self.default_help_msg
-        
-        # Get first line before Parameters section
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if stripped and stripped not in ["Parameters", "Returns", "-" * len(stripped)]:
-                return stripped
-        
-        return self.default_help_msg
 
-    def get_arg_help_msg(self, node):
-        """Extract argument help messages from NumPy format.
-        
+# markers of the argument sections, whichever comes first decides the format
+_FORMAT_MARKER = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<google>(?:Args|Arguments):[ \t]*$)"
+    r"|(?P<rest>:param\b)"
+    r"|(?P<epytext>@param\b)"
+    r"|(?P<numpydoc>Parameters[ \t]*\r?\n[ \t]*---)"
+    r")",
+    re.MULTILINE,
+)
+
+
+class AutoParser(DocstringParser):
+    """Parser which detects the format of every docstring.
+
+    Each docstring is searched for the marker of an argument section ("Args:",
+    ":param", "@param" or "Parameters" underlined with dashes) and parsed by the parser
+    of this format. The first format found in a file is remembered until reset and used
+    for the docstrings of this file without marker, like class docstrings or
+    docstrings of functions without arguments. Before any format is found, Google
+    style is assumed. One parser instance per format is created on first use and
+    reused for all files.
+
+    Attributes:
+        _parsers (Dict[str, DocstringParser]): Parser instance of each used format.
+        _file_format (str): Format detected in the current file, None until detected.
+
+    Example:
+        >>> parser = DocstringParser.build_parser("auto")
+        >>> parser.get_arg_help_msg(function_node)
+        {'a': 'The first number.'}
+        >>> parser.detect_format(function_node)
+        'rest'
+    """
+
+    # docstrings are parsed by the parser of the detected format
+    grammar = None
+    default_format = "google"
+
+    def __init__(self):
+        super().__init__()
+        self._parsers: Dict[str, DocstringParser] = {}
+        self._file_format: str = None
+
+    def reset(self) -> None:
+        """Forget the parsed docstrings and the format of the current file."""
+        super().reset()
+        self._file_format = None
+        for parser in self._parsers.values():
+            parser.reset()
+
+    def detect_format(self, node: FunctionDef | ClassDef) -> str:
+        """Get the docstring format of a node.
+
         Args:
-            node: FunctionDef AST node
-            
+            node (FunctionDef | ClassDef): ast object to extract docstring from
+
         Returns:
-            Dict[str, str]: Mapping of argument names to help messages
+            str: name of the format as accepted by build_parser
         """
-        docstring = ast.get_docstring(node)
-        num_args = len(node.args.args)
-        
-        if num_args == 0:
-            return dict()
-        elif num_args == 1 and node.args.args[0].arg == "self":
-            return dict()
-        
-        # if there is no documentation
-        if docstring is None:
-            keys = [arg.arg for arg in node.args.args]
-            if "self" in keys:
-                keys.remove("self")
-            values = [self.default_help_msg] * len(keys)
-            return dict(zip(keys, values))
-        
-        # Parse Parameters section
-        lines = docstring.split("\n")
-        res = {}
-        
-        in_params_section = False
-        current_arg = None
-        current_description = []
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            # Check if we're entering Parameters section
-            if stripped == "Parameters":
-                # Next line should be dashes
-                if i + 1 < len(lines) and lines[i + 1].strip().startswith("-"):
-                    in_params_section = True
-                continue
-            
-            # Check if we're leaving Parameters section
-            if in_params_section and stripped in ["Returns", "Raises", "Examples", "Notes"]:
-                if current_arg:
-                    res[current_arg] = " ".join(current_description).strip() or self.default_help_msg
-                break
-            
-            if in_params_section and stripped and not stripped.startswith("-"):
-                # Check if this is a parameter line (contains :)
-                if ":" in stripped:
-                    # Save previous parameter
-                    if current_arg:
-                        res[current_arg] = " ".join(current_description).strip() or self.default_help_msg
-                    
-                    # Parse new parameter: arg_name : type
-                    parts = stripped.split(":", 1)
-                    current_arg = parts[0].strip()
-                    current_description = []
-                else:
-                    # This is a description line
-                    if current_arg:
-                        current_description.append(stripped)
-        
-        # Save last parameter
-        if current_arg:
-            res[current_arg] = " ".join(current_description).strip() or self.default_help_msg
-        
-        # Fill in missing arguments with default message
-        for arg in node.args.args:
-            if arg.arg != "self" and arg.arg not in res:
-                res[arg.arg] = self.default_help_msg
-        
-        return res
+        match = None
+        if (
+            node.body
+            and isinstance(node.body[0], ast.Expr)
+            and isinstance(node.body[0].value, ast.Constant)
+            and isinstance(node.body[0].value.value, str)
+        ):
+            match = _FORMAT_MARKER.search(node.body[0].value.value)
+        if match is None:
+            return self._file_format or self.default_format
+
+        docstring_format = match.lastgroup
+        if self._file_format is None:
+            self._file_format = docstring_format
+        return docstring_format
+
+    def parse(self, node: FunctionDef | ClassDef) -> ParsedDocstring:
+        """Parse the docstring of a node with the parser of its format.
 
-    def get_return_msg(self, node):
-        """Extract return message from NumPy format.
-        
         Args:
-            node: FunctionDef AST node
-            
+            node (FunctionDef | ClassDef): ast object to extract docstring from
+
         Returns:
-            str: Return description or default message
+            ParsedDocstring: sections of the docstring
         """
-        docstring = ast.get_docstring(node)
-        if docstring is None:
-            return self.default_help_msg
-        
-        lines = docstring.split("\n")
-        in_returns_section = False
-        description_lines = []
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            # Check if we're entering Returns section
-            if stripped == "Returns":
-                # Next line should be dashes
-                if i + 1 < len(lines) and lines[i + 1].strip().startswith("-"):
-                    in_returns_section = True
-                continue
-            
-            # Check if we're leaving Returns section
-            if in_returns_section and stripped in ["Raises", "Examples", "Notes", "Parameters"]:
-                break
-            
-            # Collect description lines
-            if in_returns_section and stripped and not stripped.startswith("-"):
-                description_lines.append(stripped)
-        
-        if description_lines:
-            # Skip the first line if it looks like a type annotation
-            if len(description_lines) > 1:
-                return " ".join(description_lines[1:]).strip() or self.default_help_msg
-            return description_lines[0] or self.default_help_msg
-        
-        return self.default_help_msg
+        parsed = self._parsed.get(node)
+        if parsed is None:
+            docstring_format = self.detect_format(node)
+            parser = self._parsers.get(docstring_format)
+            if parser is None:
+                parser = self.build_parser(docstring_format)
+                self._parsers[docstring_format] = parser
+            parsed = parser.parse(node)
+            self._parsed[node] = parsed
+        return parsed
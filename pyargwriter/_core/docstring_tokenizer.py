@@ -0,0 +1,215 @@
+import re
+from typing import Dict, List, Tuple
+
+
+class DocstringGrammar:
+    """Describes how a docstring format marks its sections and their entries.
+
+    Formats like Google and NumPy group entries under section headers, formats like reST
+    and Epytext mark every entry with a tag. A grammar sets the patterns of the format
+    it describes and leaves the others at None.
+
+    Args:
+        sections (Dict[str, str]): Maps header or tag names to the name of the section in
+            DocstringSections, e.g. {"Args": "args"}. Other headers and tags end the current
+            section without being collected.
+        header (str, optional): Pattern of a section header with a "name" group, matched
+            on a line without indentation. Before the summary, only the names in sections
+            are headers unless headers are underlined. Defaults to None.
+        underlined (bool, optional): Whether a header has to be followed by a line of
+            dashes. Defaults to False.
+        entry (str, optional): Pattern of the first line of an entry in a section with
+            "key" and optional "text" groups. Lines not matching it become entries without
+            key. Defaults to None.
+        field (str, optional): Pattern of a tagged entry with "tag", "key" and "text"
+            groups. Defaults to None.
+
+    Attributes:
+        sections (Dict[str, str]): Maps header or tag names to section names.
+        header (re.Pattern): Compiled header pattern or None.
+        underlined (bool): Whether a header has to be followed by a line of dashes.
+        entry (re.Pattern): Compiled entry pattern or None.
+        field (re.Pattern): Compiled field pattern or None.
+
+    Example:
+        >>> grammar = DocstringGrammar(
+        ...     sections={"param": "args", "return": "returns"},
+        ...     field=r":(?P<tag>[a-z]+)(?: (?P<key>[a-z_]+))?: (?P<text>.*)",
+        ... )
+    """
+
+    def __init__(
+        self,
+        sections: Dict[str, str],
+        header: str = None,
+        underlined: bool = False,
+        entry: str = None,
+        field: str = None,
+    ) -> None:
+        self.sections = sections
+        self.header = None if header is None else re.compile(header)
+        self.underlined = underlined
+        self.entry = None if entry is None else re.compile(entry)
+        self.field = None if field is None else re.compile(field)
+
+
+class DocstringSections:
+    """Summary and entries of a docstring, as found by a SectionTokenizer.
+
+    Args:
+        summary (str | None): First line of free text, None if there is none.
+        sections (Dict[str, List[Tuple[str | None, str]]]): (key, text) pairs of every entry
+            by section name.
+
+    Attributes:
+        summary (str | None): First line of free text, None if there is none.
+        sections (Dict[str, List[Tuple[str | None, str]]]): (key, text) pairs of every entry
+            by section name.
+
+    Methods:
+        entries(section: str) -> List[Tuple[str | None, str]]: Get the entries of a section.
+    """
+
+    def __init__(
+        self,
+        summary: str | None,
+        sections: Dict[str, List[Tuple[str | None, str]]],
+    ) -> None:
+        self.summary = summary
+        self.sections = sections
+
+    def __contains__(self, section: str) -> bool:
+        return section in self.sections
+
+    def entries(self, section: str) -> List[Tuple[str | None, str]]:
+        """Get the entries of a section.
+
+        Args:
+            section (str): Name of the section, e.g. "args".
+
+        Returns:
+            List[Tuple[str | None, str]]: (key, text) pairs, empty if the section is missing.
+        """
+        return self.sections.get(section, [])
+
+
+_DASHES = re.compile(r"-{2,}$")
+
+
+class SectionTokenizer:
+    """Splits docstrings into summary and section entries in a single pass over the lines.
+
+    The tokenizer only knows about indentation: a section holds the lines indented at
+    least as deep as its first line. A line at this indentation starts a new entry, a
+    deeper line continues the description of the current entry, so descriptions may span
+    several lines. Where sections and entries start is defined by the DocstringGrammar.
+
+    Args:
+        grammar (DocstringGrammar): Grammar of the docstring format.
+
+    Attributes:
+        _grammar (DocstringGrammar): Grammar of the docstring format.
+
+    Methods:
+        tokenize(docstring: str) -> DocstringSections: Split a cleaned docstring.
+
+    Example:
+        >>> tokenizer = SectionTokenizer(google_grammar)
+        >>> sections = tokenizer.tokenize(ast.get_docstring(node))
+        >>> sections.entries("args")
+        [('a', 'The first number.'), ('b', 'The second number.')]
+    """
+
+    def __init__(self, grammar: DocstringGrammar) -> None:
+        self._grammar = grammar
+
+    def tokenize(self, docstring: str) -> DocstringSections:
+        """Split a cleaned docstring into summary and section entries.
+
+        Args:
+            docstring (str): The docstring as returned by ast.get_docstring.
+
+        Returns:
+            DocstringSections: The summary and the entries of each collected section.
+        """
+        grammar = self._grammar
+        header, entry_pattern, field = grammar.header, grammar.entry, grammar.field
+        names = grammar.sections
+
+        lines = docstring.split("\n")
+        summary = None
+        sections: Dict[str, List[Tuple[str | None, str]]] = {}
+        # entries of the current section, None outside of sections
+        entries: List[List] = None
+        # indentation of the entries of the current section, None until the first entry
+        entry_indent: int = None
+        # the current entry as [key, description lines]
+        entry: List = None
+        skip = False
+
+        for idx, line in enumerate(lines):
+            if skip:
+                skip = False
+                continue
+            stripped = line.strip()
+            if not stripped:
+                continue
+            indent = len(line) - len(line.lstrip())
+
+            if field is not None:
+                match = field.match(stripped)
+                if match is not None:
+                    name = names.get(match.group("tag"))
+                    entries = None if name is None else sections.setdefault(name, [])
+                    entry = [match.group("key"), [match.group("text") or ""]]
+                    if entries is not None:
+                        entries.append(entry)
+                    entry_indent = indent
+                    continue
+
+            if header is not None and indent == 0:
+                match = header.match(stripped)
+                if match is not None and (
+                    (idx + 1 < len(lines) and _DASHES.match(lines[idx + 1].strip()))
+                    if grammar.underlined
+                    # a summary like "Steps:" is no header of an unknown section
+                    else summary is not None or match.group("name") in names
+                ):
+                    name = names.get(match.group("name"))
+                    # unknown sections are skipped until the next header
+                    entries = [] if name is None else sections.setdefault(name, [])
+                    entry = None
+                    entry_indent = None
+                    skip = grammar.underlined
+                    continue
+
+            if entry_indent is None and entries is not None:
+                entry_indent = indent
+
+            if entry_indent is not None and indent > entry_indent and entry is not None:
+                entry[1].append(stripped)
+                continue
+
+            if field is None and entries is not None and indent == entry_indent:
+                match = entry_pattern.match(stripped)
+                if match is None:
+                    entry = [None, [stripped]]
+                else:
+                    entry = [match.group("key"), [match.groupdict().get("text") or ""]]
+                entries.append(entry)
+                continue
+
+            # free text ends the current section
+            entries = None
+            entry = None
+            entry_indent = None
+            if summary is None:
+                summary = stripped
+
+        return DocstringSections(
+            summary,
+            {
+                name: [(key, " ".join(parts).strip()) for key, parts in section]
+                for name, section in sections.items()
+            },
+        )
@@ -0,0 +1,188 @@
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+# tokens which change the string or bracket state of a line
+_CODE_TOKEN = re.compile(r"""#|'''|\"\"\"|'|"|[(\[{]|[)\]}]""")
+# rest of a string up to and including its closing quotes
+_STRING_END = {
+    **{
+        quote: re.compile(rf"[^\\{quote}\n]*(?:\\.[^\\{quote}\n]*)*{quote}", re.DOTALL)
+        for quote in ["'", '"']
+    },
+    **{
+        quote * 3: re.compile(
+            rf"[^\\{quote}]*(?:(?:\\.|{quote}(?!{quote}{quote}))[^\\{quote}]*)*{quote * 3}",
+            re.DOTALL,
+        )
+        for quote in ["'", '"']
+    },
+}
+_CLASS_HEADER = re.compile(r"[ \t]*class\b")
+# bodies of async methods are kept, the inspector visits functions defined in them
+_DEF_HEADER = re.compile(r"[ \t]*def\b")
+_STRING_START = re.compile(r"[ \t]*[rRuU]?['\"]")
+
+
+class HeaderScanner:
+    """Removes the bodies of methods from Python source before it is parsed.
+
+    Inspecting a class only requires the signatures, decorators and docstrings of its
+    methods. The scanner reads the source line by line, splits it into logical lines
+    with a lightweight lexer which only tracks strings, comments and brackets, and
+    drops every statement of a method body except its docstring. Bodies without a
+    docstring are replaced by "pass". Everything outside of methods, like module level
+    functions, is kept. Parsing the returned source therefore yields the same classes,
+    methods and docstrings without materializing the nodes of the method bodies.
+
+    Attributes:
+        _string (str): Quote of the string the current line continues, None outside of strings.
+        _depth (int): Number of open brackets.
+        _opens_block (bool): Whether the last logical line ends with a colon.
+
+    Methods:
+        scan(lines: Iterable[str]) -> Iterator[str]: Yield the lines without method bodies.
+
+    Example:
+        >>> with open("my_module.py", "r", encoding="utf-8") as file:
+        ...     source = "".join(HeaderScanner().scan(file))
+        >>> tree = ast.parse(source)
+    """
+
+    def __init__(self) -> None:
+        self._string: str = None
+        self._depth = 0
+        self._opens_block = False
+
+    def scan(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield the lines of the source without the bodies of methods.
+
+        Args:
+            lines (Iterable[str]): Physical lines of the source, including line endings.
+
+        Yields:
+            str: The kept lines.
+        """
+        # (indent, is class) of the classes and functions enclosing the current line
+        scopes: List[Tuple[int, bool]] = []
+        # indent of the method whose body is dropped, None outside of method bodies
+        method_indent: int = None
+        body_indent = ""
+        kept_docstring = False
+
+        for indent, logical_line in self._logical_lines(lines):
+            first = logical_line[0]
+            if method_indent is not None:
+                if indent is None:
+                    continue
+                if indent > method_indent:
+                    if not body_indent:
+                        body_indent = first[:indent]
+                        if _STRING_START.match(first):
+                            kept_docstring = True
+                            yield from logical_line
+                    continue
+                if body_indent and not kept_docstring:
+                    yield body_indent + "pass\n"
+                method_indent = None
+
+            yield from logical_line
+            if indent is None:
+                continue
+
+            while scopes and scopes[-1][0] >= indent:
+                scopes.pop()
+            is_class = _CLASS_HEADER.match(first) is not None
+            is_def = not is_class and _DEF_HEADER.match(first) is not None
+            if not (is_class or is_def):
+                continue
+
+            in_class = bool(scopes) and scopes[-1][1]
+            scopes.append((indent, is_class))
+            if is_def and in_class and self._opens_block:
+                method_indent = indent
+                body_indent = ""
+                kept_docstring = False
+
+        if method_indent is not None and body_indent and not kept_docstring:
+            yield body_indent + "pass\n"
+
+    def _logical_lines(
+        self, lines: Iterable[str]
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """Group physical lines into logical lines.
+
+        Args:
+            lines (Iterable[str]): Physical lines of the source.
+
+        Yields:
+            Tuple[int, List[str]]: Indent and physical lines of each logical line. The indent
+                is None for blank lines and comments.
+        """
+        logical_line: List[str] = []
+        indent = None
+        for line in lines:
+            if not logical_line:
+                stripped = line.lstrip()
+                if not stripped or stripped[0] == "#":
+                    yield None, [line]
+                    continue
+                indent = len(line) - len(stripped)
+            logical_line.append(line)
+            if self._continues(line):
+                continue
+            yield indent, logical_line
+            logical_line = []
+        if logical_line:
+            yield indent, logical_line
+
+    def _continues(self, line: str) -> bool:
+        """Update the string and bracket state with a physical line.
+
+        Also sets _opens_block to whether the line ends with a colon outside of
+        strings and comments.
+
+        Args:
+            line (str): The physical line.
+
+        Returns:
+            bool: True if the logical line continues on the next physical line.
+        """
+        pos = 0
+        code_end = 0
+        while True:
+            if self._string is not None:
+                match = _STRING_END[self._string].match(line, pos)
+                if match is None:
+                    if len(self._string) == 1 and not line.rstrip("\r\n").endswith("\\"):
+                        # unterminated string, let the parser report it
+                        self._string = None
+                        break
+                    return True
+                self._string = None
+                pos = match.end()
+                code_end = pos
+                continue
+
+            match = _CODE_TOKEN.search(line, pos)
+            if match is None:
+                code_end = len(line)
+                break
+            token = match.group()
+            if token == "#":
+                code_end = match.start()
+                break
+            if token in _STRING_END:
+                self._string = token
+            elif token in "([{":
+                self._depth += 1
+            else:
+                self._depth = max(0, self._depth - 1)
+            pos = match.end()
+
+        code = line[:code_end].rstrip()
+        if code.endswith("\\"):
+            return True
+        if self._depth > 0:
+            return True
+        self._opens_block = code.endswith(":")
+        return False
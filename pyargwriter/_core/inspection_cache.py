@@ -0,0 +1,219 @@
+import hashlib
+import json
+import logging
+import os
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, List
+
+from pyargwriter._core.structures import ModuleStructure
+
+try:
+    PYARGWRITER_VERSION = version("pyargwriter")
+except PackageNotFoundError:
+    PYARGWRITER_VERSION = "unknown"
+
+# bump whenever the inspection produces different structures for the same file, the
+# package version is not updated by every change, e.g. of an editable install
+INSPECTION_SCHEMA = 2
+
+CACHE_DIR = ".pyargwriter_cache"
+MAX_ENTRIES = 4096
+
+
+class InspectionCache:
+    """On-disk cache for the modules found in Python source files.
+
+    Every entry holds the serialized ModuleStructures of one file. Entries are addressed by
+    the hash of the file content, the pyargwriter version, INSPECTION_SCHEMA and the
+    docstring format, so a cached result is never used for a different input or after a
+    change of the inspection.
+    An index remembers the modification time, size and content hash of every inspected
+    path: as long as those match, a file is neither read nor hashed again and a warm run
+    only costs a stat call per file. The least recently used entries are evicted once the
+    cache holds more than max_entries entries.
+
+    Args:
+        docstring_format (str, optional): Format of the docstrings in the inspected files. Defaults to "google".
+        directory (str, optional): Directory to store the cache in. Defaults to ".pyargwriter_cache".
+        max_entries (int, optional): Maximum number of cached files. Defaults to 4096.
+
+    Attributes:
+        _directory (str): Directory to store the cache in.
+        _salt (str): Part of every entry key besides the content hash.
+        _max_entries (int): Maximum number of cached files.
+        _index (Dict[str, Any]): Stat records of the inspected paths and access ticks of the entries.
+        _dirty (bool): Whether the index changed since it was loaded.
+
+    Methods:
+        get(path: str) -> List[ModuleStructure] | None: Return the cached modules of a file.
+        put(path: str, modules: List[ModuleStructure]) -> None: Store the modules of a file.
+        save() -> None: Evict the least recently used entries and write the index.
+
+    Example:
+        >>> cache = InspectionCache(docstring_format="google")
+        >>> modules = cache.get("my_module.py")
+        >>> if modules is None:
+        ...     modules = inspect_files(["my_module.py"])[0]
+        ...     cache.put("my_module.py", modules)
+        >>> cache.save()
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        docstring_format: str = "google",
+        directory: str = CACHE_DIR,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        self._directory = directory
+        self._salt = f"{PYARGWRITER_VERSION}:{INSPECTION_SCHEMA}:{docstring_format.lower()}"
+        self._max_entries = max_entries
+        self._index: Dict[str, Any] = None
+        self._dirty = False
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        """Dict[str, Any]: the index, loaded from disk on first access"""
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def get(self, path: str) -> List[ModuleStructure] | None:
+        """Return the cached modules of a file.
+
+        Args:
+            path (str): Path to the Python source file.
+
+        Returns:
+            List[ModuleStructure] | None: The modules of the file or None on a cache miss.
+        """
+        key = self._entry_key(path)
+        if key not in self.index["entries"]:
+            return None
+
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as err:
+            logging.debug(f"Ignore broken cache entry for {path}: {err}")
+            self.index["entries"].pop(key)
+            self._dirty = True
+            return None
+
+        self._touch(key)
+        modules = [ModuleStructure.from_dict(module) for module in data]
+        for module in modules:
+            # the same content may be found at several paths
+            module.location = path
+        return modules
+
+    def put(self, path: str, modules: List[ModuleStructure]) -> None:
+        """Store the modules of a file.
+
+        Args:
+            path (str): Path to the Python source file.
+            modules (List[ModuleStructure]): The modules found in the file.
+        """
+        key = self._entry_key(path)
+        os.makedirs(self._directory, exist_ok=True)
+        self._write_json([module.to_dict() for module in modules], self._entry_path(key))
+        self._touch(key)
+
+    def save(self) -> None:
+        """Evict the least recently used entries and write the index if it changed."""
+        if not self._dirty:
+            return
+
+        entries: Dict[str, int] = self.index["entries"]
+        if len(entries) > self._max_entries:
+            by_age = sorted(entries, key=entries.get)
+            for key in by_age[: len(entries) - self._max_entries]:
+                entries.pop(key)
+                try:
+                    os.remove(self._entry_path(key))
+                except OSError:
+                    pass
+
+        # forget stat records of evicted entries
+        self.index["files"] = {
+            path: record
+            for path, record in self.index["files"].items()
+            if self._key(record[2]) in entries
+        }
+
+        os.makedirs(self._directory, exist_ok=True)
+        self._write_json(self.index, os.path.join(self._directory, self.INDEX_FILE))
+        self._dirty = False
+
+    def _entry_key(self, path: str) -> str:
+        """Return the key of the entry for a file and update its stat record if needed.
+
+        Args:
+            path (str): Path to the Python source file.
+
+        Returns:
+            str: The entry key.
+        """
+        abs_path = os.path.abspath(path)
+        stat = os.stat(abs_path)
+        record = self.index["files"].get(abs_path)
+        if record is None or record[0] != stat.st_mtime_ns or record[1] != stat.st_size:
+            with open(abs_path, "rb") as file:
+                digest = hashlib.sha256(file.read()).hexdigest()
+            record = [stat.st_mtime_ns, stat.st_size, digest]
+            self.index["files"][abs_path] = record
+            self._dirty = True
+        return self._key(record[2])
+
+    def _key(self, digest: str) -> str:
+        """Combine the content hash with the version and docstring format.
+
+        Args:
+            digest (str): The hash of the file content.
+
+        Returns:
+            str: The entry key.
+        """
+        return hashlib.sha256(f"{self._salt}:{digest}".encode()).hexdigest()
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as most recently used.
+
+        Args:
+            key (str): The entry key.
+        """
+        self.index["tick"] += 1
+        self.index["entries"][key] = self.index["tick"]
+        self._dirty = True
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._directory, key + ".json")
+
+    def _load_index(self) -> Dict[str, Any]:
+        """Load the index from disk or start with an empty one.
+
+        Returns:
+            Dict[str, Any]: The index.
+        """
+        try:
+            with open(os.path.join(self._directory, self.INDEX_FILE), "r", encoding="utf-8") as file:
+                index = json.load(file)
+            if {"tick", "files", "entries"} <= set(index):
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"tick": 0, "files": {}, "entries": {}}
+
+    @staticmethod
+    def _write_json(data: Any, path: str) -> None:
+        """Write JSON to a temporary file and move it into place.
+
+        Args:
+            data (Any): The data to write.
+            path (str): The destination path.
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from ast import List
 import json
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Dict, TextIO, Type
 
 
 class Structure(ABC):
@@ -22,13 +22,29 @@ class Structure(ABC):
         to_dict(self) -> dict:
             Abstract method for converting the object to a dictionary representation.
 
+        render_to(self, stream: TextIO) -> None:
+            Write the JSON representation of the object to a text stream.
+
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         """Return a JSON representation of the structured object."""
         structure = self.to_dict()
         return json.dumps(structure, indent=2)
 
+    def render_to(self, stream: TextIO) -> None:
+        """Write the JSON representation of the object to a text stream.
+
+        The JSON text is encoded incrementally instead of being built as one string first.
+
+        Args:
+            stream (TextIO): Writable text stream, e.g. an open file or sys.stdout.
+        """
+        json.dump(self.to_dict(), stream, indent=2)
+        stream.write("\n")
+
     @classmethod
     @abstractmethod
     def from_dict(cls: Structure, data: dict):
@@ -59,33 +75,59 @@ class Structure(ABC):
         raise NotImplementedError
 
 
+# value of fields which are not set, they are left out of the dictionary representation
+_MISSING = object()
+
+
 class ArgumentStructure(Structure):
-    def __init__(self) -> None:
-        """Class representing an argument structure.
+    """Class representing an argument structure.
 
-        This class defines the structure for command-line arguments.
+    This class defines the structure for command-line arguments. Instances are slotted
+    records, fields which are not set are left out of the dictionary representation,
+    like the default of a required argument. Keys of a dictionary which are no field,
+    e.g. further keyword arguments of add_argument given in a YAML file, are kept
+    and written back by to_dict.
 
-        Attributes:
-            name_or_flags (str): The name or flags for the argument.
-            dest (str): The destination attribute for the argument.
-            type (Type): The data type of the argument.
-            help (str): The help text for the argument.
-            default (None): The default value for the argument (default is None).
+    Attributes:
+        help (str): The help text for the argument.
+        dest (str): The destination attribute for the argument.
+        name_or_flags (str): The name or flags for the argument.
+        type (Type): The data type of the argument.
+        nargs (str | int): The number of values of the argument, e.g. "+".
+        choices (List): The allowed values of the argument.
+        default (None): The default value for the argument (default is None).
 
-        Methods:
-            from_dict(cls, data: Dict[str, str]) -> ArgumentStructure:
-                Create an instance of the class from a dictionary.
+    Methods:
+        from_dict(cls, data: Dict[str, str]) -> ArgumentStructure:
+            Create an instance of the class from a dictionary.
 
-            to_dict(self) -> dict:
-                Convert the argument structure to a dictionary representation.
+        to_dict(self) -> dict:
+            Convert the argument structure to a dictionary representation.
 
-        """
-        self.name_or_flags: str
+    """
+
+    __slots__ = (
+        "help",
+        "dest",
+        "name_or_flags",
+        "type",
+        "nargs",
+        "choices",
+        "default",
+        "_extra",
+    )
+    _FIELDS = __slots__[:-1]
+    """Tuple[str]: fields in the order of the dictionary representation"""
+
+    def __init__(self) -> None:
+        self.help: str = ""
         self.dest: str
+        self.name_or_flags: str
         self.type: Type
         self.nargs: str
-        self.help: str = ""
+        self.choices: List
         self.default: None
+        self._extra: Dict[str, Any] = None
 
     @classmethod
     def from_dict(cls: ArgumentStructure, data: Dict[str, str]) -> ArgumentStructure:
@@ -99,8 +141,15 @@ class ArgumentStructure(Structure):
             ArgumentStructure: An instance of the ArgumentStructure class created from the dictionary.
         """
         arg = cls()
+        setters = _ARGUMENT_SETTERS
         for key, value in data.items():
-            setattr(arg, key, value)
+            setter = setters.get(key)
+            if setter is not None:
+                setter(arg, value)
+            elif arg._extra is None:
+                arg._extra = {key: value}
+            else:
+                arg._extra[key] = value
 
         return arg
 
@@ -111,21 +160,32 @@ class ArgumentStructure(Structure):
             dict: A dictionary representation of the argument structure.
         """
         structure = {}
-        for name, value in vars(self).items():
-            if isinstance(value, Type):
-                value = value.__name__
-            structure[name] = value
+        for name in self._FIELDS:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                structure[name] = value
+        value_type = structure.get("type")
+        if isinstance(value_type, type):
+            structure["type"] = value_type.__name__
+        if self._extra is not None:
+            structure.update(self._extra)
 
         # check if the minimal number of args is in the dict:
-        required_keys = set(["name_or_flags", "dest", "help"])
-        keys = set(structure.keys())
-        if required_keys.intersection(keys) != required_keys:
+        if "dest" not in structure or "name_or_flags" not in structure:
             logging.warning("There are keys in the generated structure missing")
 
         return structure
-    
+
+
+# slot descriptor setter of every field of ArgumentStructure, by name
+_ARGUMENT_SETTERS = {
+    name: getattr(ArgumentStructure, name).__set__ for name in ArgumentStructure._FIELDS
+}
+
 
 class DecoratorFlagStructure(Structure):
+    __slots__ = ("name", "values")
+
     def __init__(self):
         self.name: str
         self.values: Dict[str, Any]  # values from signature
@@ -177,6 +237,8 @@ class CommandStructure(Structure):
 
     """
 
+    __slots__ = ("name", "help", "args", "decorator_flags")
+
     def __init__(self) -> None:
         self.name: str
         self.help: str = ""
@@ -242,11 +304,10 @@ class ModuleStructure(Structure):
         to_dict(self) -> dict:
             Convert the module structure to a dictionary representation.
 
-        add_args(self, args: List[ArgumentStructure]) -> None:
-            Add given arguments to all commands in the module.
-
     """
 
+    __slots__ = ("name", "help", "commands", "location", "args")
+
     def __init__(self) -> None:
         self.name: str
         self.help: str = ""
@@ -301,16 +362,6 @@ class ModuleStructure(Structure):
             "args": [arg.to_dict() for arg in self.args],
         }
 
-    def add_args(self, args: List[ArgumentStructure]) -> None:
-        """Add given arguments to all commands in the module.
-
-        Args:
-            args (List[ArgumentStructure]): A list of arguments to add to the module's commands.
-        """
-        for command in self.commands:
-            command: CommandStructure
-            command.args.extend(args)
-
 
 class ModuleStructures(Structure):
     """Class representing a collection of module structures.
@@ -333,6 +384,8 @@ class ModuleStructures(Structure):
 
     """
 
+    __slots__ = ("modules",)
+
     def __init__(self) -> None:
         super().__init__()
         self.modules: List[ModuleStructure] = []
@@ -0,0 +1,29 @@
+from argparse import ArgumentTypeError
+
+_TRUE = {"true", "yes", "on", "1"}
+_FALSE = {"false", "no", "off", "0"}
+
+
+def str2bool(value: str) -> bool:
+    """Convert a command line value to bool.
+
+    Used by generated parsers as type of sequences of bool, as bool("False") is True.
+
+    Args:
+        value (str): The value, e.g. "True", "false", "yes" or "0".
+
+    Raises:
+        ArgumentTypeError: If the value is no boolean.
+
+    Returns:
+        bool: The converted value.
+
+    Example:
+        >>> parser.add_argument("--flags", type=str2bool, nargs="+")
+    """
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ArgumentTypeError(f"invalid bool value: '{value}'")
@@ -11,11 +11,9 @@ from argparse import (
 from textwrap import dedent
 from typing import Any, Callable, Dict
 
-from hydra import version
-from hydra._internal.deprecation_warning import deprecation_warning
-from hydra._internal.utils import _run_hydra, get_args_parser
-from hydra.main import _UNSPECIFIED_, _get_rerun_conf
-from hydra.core.utils import _flush_loggers
+# hydra and omegaconf are imported inside the functions. Generated command line
+# interfaces import this module, but only hydra decorated commands pay for hydra.
+_UNSPECIFIED_: Any = object()
 
 
 def add_hydra_parser(new_parser: ArgumentParser = None) -> ArgumentParser:
@@ -31,6 +29,8 @@ def add_hydra_parser(new_parser: ArgumentParser = None) -> ArgumentParser:
     Returns:
         ArgumentParser: _description_
     """
+    from hydra._internal.utils import get_args_parser
+
     if new_parser is None:
         new_parser = ArgumentParser(add_help=False)
 
@@ -105,6 +105,12 @@ def hydra_wrapper(
         config_path (str, optional): _description_. Defaults to _UNSPECIFIED_.
         config_name (str, optional): _description_. Defaults to None.
     """
+    from hydra import version
+    from hydra._internal.deprecation_warning import deprecation_warning
+    from hydra._internal.utils import _run_hydra
+    from hydra.main import _get_rerun_conf
+    from hydra.core.utils import _flush_loggers
+
     version.setbase(version_base)
 
     if config_path is _UNSPECIFIED_:
@@ -0,0 +1,60 @@
+from argparse import ArgumentParser, Namespace
+from typing import Callable, List, Sequence, Tuple
+
+
+class LazyArgumentParser(ArgumentParser):
+    """ArgumentParser which adds its arguments only once they are needed.
+
+    Generated parsers register one LazyArgumentParser per command and defer the
+    functions adding the arguments of that command. The deferred functions run right
+    before the parser parses its arguments or prints its help. Building the parser of
+    a command line interface therefore only pays for the command which is executed.
+
+    Example:
+        >>> subparsers = parser.add_subparsers(dest="command", parser_class=LazyArgumentParser)
+        >>> train = subparsers.add_parser("train", help="train the model")
+        >>> train = train.defer(add_train_args)
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._deferred: List[Callable[[ArgumentParser], ArgumentParser]] = []
+
+    def defer(
+        self, setup: Callable[[ArgumentParser], ArgumentParser]
+    ) -> "LazyArgumentParser":
+        """Register a function which adds arguments to this parser once needed.
+
+        Args:
+            setup (Callable[[ArgumentParser], ArgumentParser]): Function receiving this parser.
+
+        Returns:
+            LazyArgumentParser: The parser itself.
+        """
+        self._deferred.append(setup)
+        return self
+
+    def materialize(self) -> "LazyArgumentParser":
+        """Run all deferred functions in the order they were registered.
+
+        Returns:
+            LazyArgumentParser: The parser itself.
+        """
+        while self._deferred:
+            setup = self._deferred.pop(0)
+            setup(self)
+        return self
+
+    def parse_known_args(
+        self, args: Sequence[str] = None, namespace: Namespace = None
+    ) -> Tuple[Namespace, List[str]]:
+        self.materialize()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self) -> str:
+        self.materialize()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self.materialize()
+        return super().format_help()
@@ -1,6 +1,6 @@
 from typing import Callable
 from functools import wraps
-from hydra.main import _UNSPECIFIED_
+from pyargwriter.api.hydra_plugin import _UNSPECIFIED_
 
 from pyargwriter.utils.file_system import check_file_exists
 
@@ -10,6 +10,7 @@ def overwrite_protection(func: Callable) -> Callable:
 
     This decorator is designed to be used with functions that write files. It will check if
     the file already exists and prompt the user for confirmation before overwriting it.
+    The decorated function returns whether the file was written.
 
     Args:
         func (Callable): The function to be wrapped.
@@ -29,8 +30,9 @@ def overwrite_protection(func: Callable) -> Callable:
         if check_file_exists(path):
             overwrite = input(f"{path} already exists. Overwrite it? [Y, n]: ")
             if overwrite.lower() not in ["", "y"]:
-                return
+                return False
         func(*args, path, **kwargs)
+        return True
 
     return wrapper
 
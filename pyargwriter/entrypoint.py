@@ -1,13 +1,17 @@
 import logging
-from typing import Any, Dict, List
+import sys
+from functools import partial
+from typing import Any, Callable, Dict, List
+from pyargwriter._core.block_cache import STATE_FILE, CodeBlockCache
 from pyargwriter._core.code_generator import CodeGenerator
 from pyargwriter._core.code_inspector import ModuleInspector
+from pyargwriter._core.inspection_cache import InspectionCache
 from pyargwriter.decorator import overwrite_protection
 from pyargwriter.utils.file_system import (
     create_directory,
     create_file,
+    discover_files,
     get_project_root_name,
-    load_file_tree,
 )
 from pyargwriter.utils.formatter import BlackFormatter
 
@@ -26,6 +30,9 @@ class ArgParseWriter:
     Attributes:
         _force (bool): Whether to force overwrite existing files without prompting.
         _inspector (ModuleInspector): Inspects Python modules to extract structure.
+        _cache (InspectionCache): Cache of already inspected files, None if disabled.
+        _no_state (bool): Whether to generate all code again instead of reusing the code of
+            unchanged modules remembered in the output directory.
         _generator (CodeGenerator): Generates argparse code from parsed structure.
         _formatter (BlackFormatter): Formats generated code with Black.
         _arg_parse_structure (Dict[str, Any]): Parsed module structure data.
@@ -39,7 +46,18 @@ class ArgParseWriter:
         ... )
     """
 
-    def __init__(self, force: bool = False, docstring_format: str = "google", **kwargs) -> None:
+    def __init__(
+        self,
+        force: bool = False,
+        docstring_format: str = "google",
+        lazy_subparsers: bool = False,
+        lazy_imports: bool = False,
+        dispatch_table: bool = False,
+        no_cache: bool = False,
+        no_state: bool = False,
+        headers_only: bool = False,
+        **kwargs,
+    ) -> None:
         """Initialize ArgParseWriter instance.
 
         Args:
@@ -50,32 +68,75 @@ class ArgParseWriter:
                 - "reST": reStructuredText style docstrings
                 - "Google": Google style docstrings (default)
                 - "Numpydoc": NumPy style docstrings
+                - "Auto": detect the format of every docstring, for repositories mixing styles
                 Defaults to "google".
+            lazy_subparsers (bool, optional): Whether the generated parser adds the arguments of a
+                command only when this command is executed. Defaults to False.
+            lazy_imports (bool, optional): Whether the generated main file imports each class only
+                in the branch executing it. Defaults to False.
+            dispatch_table (bool, optional): Whether the generated main file dispatches commands
+                through a dictionary of handler functions. Defaults to False.
+            no_cache (bool, optional): Whether to inspect every file again instead of reusing
+                the results cached in ".pyargwriter_cache". Defaults to False.
+            no_state (bool, optional): Whether to generate all code again instead of only the
+                code of changed modules, without reading or writing ".pyargwriter_state.json"
+                in the output directory. Defaults to False.
+            headers_only (bool, optional): Whether to drop the bodies of methods before parsing
+                the source files. Faster and with less memory for large methods, the inspected
+                structures are the same. Defaults to False.
             **kwargs: Additional keyword arguments (currently unused, reserved for future extensions).
         """
         self._force = force
 
-        self._inspector = ModuleInspector(docstring_format)
-        self._generator = CodeGenerator()
+        self._inspector = ModuleInspector(docstring_format, headers_only)
+        self._cache = None if no_cache else InspectionCache(docstring_format)
+        self._no_state = no_state
+        self._generator = CodeGenerator(
+            lazy_subparsers=lazy_subparsers,
+            lazy_imports=lazy_imports,
+            dispatch_table=dispatch_table,
+        )
 
         self._formatter = BlackFormatter()
 
         self._arg_parse_structure: Dict[str, Any]
     
-    def parse_code(self, files: List[str], output: str, **kwargs):
+    def parse_code(
+        self,
+        files: List[str],
+        output: str,
+        jobs: int = 1,
+        ignore: List[str] = None,
+        marker: str = None,
+        compact: bool = False,
+        **kwargs,
+    ):
         """Parse Python source files and extract class/method structures for ArgumentParser generation.
 
         This method analyzes Python source files, extracts class definitions, method signatures,
-        and docstrings, then serializes the structure to a YAML or JSON file (or prints to console).
+        and docstrings, then serializes the structure to a YAML, JSON, JSON Lines or binary file
+        (or prints to console).
 
         Args:
-            files (List[str]): List of Python file paths to parse. Each file should contain
-                Python classes with properly documented methods.
+            files (List[str]): List of Python file paths, directories or glob patterns to parse.
+                Each file should contain Python classes with properly documented methods.
+                Directories are searched recursively for files defining a class.
             output (str): Output destination for parsed code structure. Options:
                 - "." : Print structure to stdout
                 - None : Return without writing (structure stored internally)
                 - "<path>.yaml" or "<path>.yml" : Write to YAML file
                 - "<path>.json" : Write to JSON file
+                - "<path>.pawb" : Write to binary file, fastest to load with write_code
+                - "<path>.jsonl" : Write every module to its own line as soon as it is inspected,
+                  without keeping the structure in memory
+            jobs (int, optional): Number of processes inspecting the files in parallel.
+                Defaults to 1.
+            ignore (List[str], optional): Additional patterns of files and directories to skip
+                while searching directories. Defaults to None.
+            marker (str, optional): Text files found in directories have to contain to be
+                parsed. Defaults to None.
+            compact (bool, optional): Whether to write a JSON output without indentation.
+                Defaults to False.
             **kwargs: Additional keyword arguments passed through (reserved for future use).
 
         Example:
@@ -85,24 +146,26 @@ class ArgParseWriter:
             ...     output='structure.yaml'
             ... )
         """
-        for file in files:
-            tree = load_file_tree(file)
-            self._inspector.visit(tree, file)
+        files = discover_files(files, ignore, marker)
+        if output is not None and output.endswith(".jsonl"):
+            self._inspector.stream(files, output, jobs, self._cache)
+            return
+        self._inspector.visit_files(files, jobs, self._cache)
 
         self._arg_parse_structure = self._inspector.modules
 
         # how to return values
         if output == ".":
-            print(repr(self._arg_parse_structure))
+            self._arg_parse_structure.render_to(sys.stdout)
         elif output is None:
             return
         else:
-            self._inspector.write(output)
+            self._inspector.write(output, compact)
 
     def write_code(self, file: str, output: str, pretty: bool = False, **kwargs):
         """Generate ArgumentParser Python code from a parsed structure file.
 
-        This method reads a previously parsed structure file (YAML or JSON) and generates
+        This method reads a previously parsed structure file (YAML, JSON, JSON Lines or binary) and generates
         the corresponding Python code for setting up ArgumentParser, including:
         - utils/parser.py: ArgumentParser setup functions
         - __main__.py: Main entry point with argument parsing logic
@@ -112,6 +175,8 @@ class ArgParseWriter:
             file (str): Path to the parsed structure file. Supported formats:
                 - .yaml or .yml: YAML format structure file
                 - .json: JSON format structure file
+                - .pawb: binary structure file
+                - .jsonl: JSON Lines structure file with one module per line, read line by line
             output (str): Output directory where generated files will be created.
                 The directory structure will be: <output>/utils/parser.py and <output>/__main__.py
             pretty (bool, optional): Whether to format generated code using Black formatter.
@@ -134,29 +199,24 @@ class ArgParseWriter:
                 generator_method = self._generator.from_yaml
             case "json":
                 generator_method = self._generator.from_json
+            case "pawb":
+                generator_method = self._generator.from_binary
+            case "jsonl":
+                generator_method = self._generator.from_jsonl
 
         output = output.rstrip("/")
-        generator_method(file, output + "/utils/parser.py")
-
-        create_directory(output + "/utils")
-        self._generator.write(
-            setup_parser_path=output + "/utils/parser.py",
-            main_path=output + "/__main__.py",
-            force=self._force,
+        self._write_generated(
+            partial(generator_method, file, output + "/utils/parser.py"), output, pretty
         )
 
-        # create __init__.py ?
-        init_path = output + "/__init__.py"
-        self._create_init(path=init_path)
-
-        if pretty:
-            self._format_code(output)
-
     def generate_parser(
         self,
         files: List[str],
         output: str,
         pretty: bool = False,
+        jobs: int = 1,
+        ignore: List[str] = None,
+        marker: str = None,
         **kwargs,
     ):
         """Complete end-to-end workflow: parse Python files and generate ArgumentParser code.
@@ -172,13 +232,19 @@ class ArgParseWriter:
         5. Optionally format the code with Black
 
         Args:
-            files (List[str]): List of Python source file paths to parse. Each file should
-                contain Python classes with properly documented methods following the
-                specified docstring format.
+            files (List[str]): List of Python source file paths, directories or glob patterns
+                to parse. Each file should contain Python classes with properly documented
+                methods following the specified docstring format.
             output (str): Output directory where generated files will be created.
                 The method will create the directory if it doesn't exist.
             pretty (bool, optional): Whether to format generated code using Black formatter
                 for consistent style. Defaults to False.
+            jobs (int, optional): Number of processes inspecting the files in parallel.
+                Defaults to 1.
+            ignore (List[str], optional): Additional patterns of files and directories to skip
+                while searching directories. Defaults to None.
+            marker (str, optional): Text files found in directories have to contain to be
+                parsed. Defaults to None.
             **kwargs: Additional keyword arguments passed through (reserved for future use).
 
         Example:
@@ -193,27 +259,64 @@ class ArgParseWriter:
             # - cli_app/__main__.py
             # - cli_app/__init__.py
         """
-        self.parse_code(files, None)
+        self.parse_code(files, None, jobs=jobs, ignore=ignore, marker=marker)
         output = output.rstrip("/")
         project_root_name = get_project_root_name(output)
-        self._generator.from_dict(
-            self._arg_parse_structure.to_dict(), project_root_name + "/utils/parser.py"
+        generate = partial(
+            self._generator.from_dict,
+            self._arg_parse_structure.to_dict(),
+            project_root_name + "/utils/parser.py",
         )
+        self._write_generated(generate, output, pretty)
+
+    def _write_generated(
+        self,
+        generate: Callable[[CodeBlockCache], None],
+        output: str,
+        pretty: bool = False,
+    ):
+        """Generate the code and write it to the output directory.
+
+        Unless no_state is set, the code generated for every module is remembered in
+        the output directory. The next run only generates the code of changed modules and
+        does not touch the files at all if nothing changed. If overwriting a file is
+        declined, the state of the previous run is kept, so the next run writes the
+        code again.
+
+        Args:
+            generate (Callable[[CodeBlockCache], None]): Generates the code, reusing the given blocks.
+            output (str): Output directory where generated files will be created.
+            pretty (bool, optional): Whether to format generated code using Black formatter.
+                Defaults to False.
+        """
+        paths = [output + "/utils/parser.py", output + "/__main__.py", output + "/__init__.py"]
+        state_path = output + "/" + STATE_FILE
+        blocks = None
+        if not self._no_state:
+            blocks = CodeBlockCache.load(state_path)
+            blocks.set_context({"pretty": pretty})
+
+        generate(blocks)
+        if blocks is not None and blocks.up_to_date(paths):
+            logging.info(f"Generated code in {output} is up to date")
+            return
 
         create_directory(output + "/utils")
-        self._generator.write(
-            setup_parser_path=output + "/utils/parser.py",
-            main_path=output + "/__main__.py",
+        written = self._generator.write(
+            setup_parser_path=paths[0],
+            main_path=paths[1],
             force=self._force,
         )
 
         # create __init__.py ?
-        init_path = output + "/__init__.py"
-        self._create_init(path=init_path)
+        written = self._create_init(path=paths[2]) and written
 
         if pretty:
             self._format_code(output)
 
+        if blocks is not None and written:
+            blocks.save(state_path, paths)
+
     def _format_code(
         self,
         *files,
@@ -223,14 +326,18 @@ class ArgParseWriter:
         logging.info(msg)
         self._formatter.format(files)
 
-    def _create_init(self, path):
-        """Create '__init__.py' file in the specified path."""
+    def _create_init(self, path) -> bool:
+        """Create '__init__.py' file in the specified path.
+
+        Returns:
+            bool: False if overwriting an existing file was declined, True otherwise.
+        """
         if self._force:
             create_file(path)
-        else:
+            return True
 
-            @overwrite_protection
-            def wrapper(path):
-                create_file(path)
+        @overwrite_protection
+        def wrapper(path):
+            create_file(path)
 
-            wrapper(path=path)
+        return wrapper(path=path)
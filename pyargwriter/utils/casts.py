@@ -49,6 +49,15 @@ def dict2args(d: Dict[str, Any]) -> str:
                 value = str(value)
             elif isinstance(value, str):
                 value = f"'{value}'"
+        elif key == "choices":
+            value = repr(value)
+
+        elif key == "nargs" and isinstance(value, int):
+            value = str(value)
+
+        elif key == "help":
+            # help messages may quote values, e.g. the choices of an argument
+            value = f"'{format_help(value)}'"
         else:
             value = f"'{value}'"
 
@@ -18,9 +18,9 @@ def add_general_args(parser: ArgumentParser) -> ArgumentParser:
     )
     parser.add_argument(
         "--docstring-format",
-        choices=["Epytext", "reST", "Google", "Numpydoc"],
+        choices=["Epytext", "reST", "Google", "Numpydoc", "Auto"],
         default="Google",
-        help="Format of docstring in given file."
+        help="Format of docstring in given file. Auto detects the format of every docstring."
     )
     return parser
 
@@ -41,6 +41,73 @@ def add_formatter_args(parser: ArgumentParser) -> ArgumentParser:
         action="store_true",
         help="If flag is set. The code will be formatted with Black.",
     )
+    parser.add_argument(
+        "--lazy-subparsers",
+        action="store_true",
+        help="If flag is set. The generated parser only adds the arguments of the executed command.",
+    )
+    parser.add_argument(
+        "--lazy-imports",
+        action="store_true",
+        help="If flag is set. The generated main file only imports the class of the executed command.",
+    )
+    parser.add_argument(
+        "--dispatch-table",
+        action="store_true",
+        help="If flag is set. The generated main file dispatches commands through a dictionary"
+        " of handler functions instead of match statements.",
+    )
+    parser.add_argument(
+        "--no-state",
+        action="store_true",
+        help="If flag is set. All code is generated again instead of reusing the code of unchanged"
+        " modules, and no .pyargwriter_state.json is written to the output directory.",
+    )
+    return parser
+
+
+def add_inspection_args(parser: ArgumentParser) -> ArgumentParser:
+    """Add arguments controlling the inspection of source files to the given ArgumentParser.
+
+    Args:
+        parser (ArgumentParser): The ArgumentParser to which inspection-related
+            arguments will be added.
+
+    Returns:
+        ArgumentParser: The modified ArgumentParser.
+    """
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes inspecting the given files in parallel.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="If flag is set. Every file is inspected again instead of reusing cached results.",
+    )
+    parser.add_argument(
+        "--headers-only",
+        action="store_true",
+        help="If flag is set. Method bodies are skipped while reading the given files,"
+        " which saves time and memory for large methods.",
+    )
+    parser.add_argument(
+        "--ignore",
+        nargs="+",
+        type=str,
+        default=None,
+        help="Patterns of files and directories to skip when searching directories."
+        " Virtual environments, build directories and .gitignore entries are always skipped.",
+    )
+    parser.add_argument(
+        "--marker",
+        type=str,
+        default=None,
+        help="Only inspect files found in directories which contain this text, e.g. 'pyargwriter'.",
+    )
     return parser
 
 
@@ -59,15 +126,23 @@ def add_parser_args(parser: ArgumentParser) -> ArgumentParser:
         dest="files",
         nargs="+",
         type=str,
-        help="Collection of paths to the files you want to generate the argument parser for.",
+        help="Collection of paths to the files you want to generate the argument parser for."
+        " Directories and glob patterns are searched for files defining a class.",
         required=True,
     )
     parser.add_argument(
         "--output",
         type=str,
         default=".",
-        help="Path to file where to store the structural information",
+        help="Path to file where to store the structural information"
+        " (.yaml, .yml, .json, .jsonl or the binary .pawb format)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write JSON output without indentation. Smaller and faster to write and read.",
     )
+    parser = add_inspection_args(parser)
     parser = add_general_args(parser)
     return parser
 
@@ -87,7 +162,7 @@ def add_writer_args(parser: ArgumentParser) -> ArgumentParser:
         dest="file",
         type=str,
         help="Collection of paths to files with structural information"
-            " to generate the parser from. ",
+            " to generate the parser from (.yaml, .yml, .json, .jsonl or .pawb). ",
         required=True,
     )
     parser.add_argument(
@@ -123,7 +198,8 @@ def add_generate_parser_args(parser: ArgumentParser) -> ArgumentParser:
         dest="files",
         nargs="+",
         type=str,
-        help="Collection of paths to the files you want to generate the argument parser for.",
+        help="Collection of paths to the files you want to generate the argument parser for."
+        " Directories and glob patterns are searched for files defining a class.",
         required=True,
     )
     parser.add_argument(
@@ -133,6 +209,7 @@ def add_generate_parser_args(parser: ArgumentParser) -> ArgumentParser:
         help="Relative path to directory where you want to save the generated files",
     )
     parser = add_formatter_args(parser)
+    parser = add_inspection_args(parser)
     parser = add_general_args(parser)
 
     parser.add_argument(
@@ -0,0 +1,80 @@
+"""Benchmark of the docstring parsers on large docstrings.
+
+Run with:
+    python -m test.benchmark_docstring_parser
+"""
+
+import ast
+import timeit
+
+from pyargwriter._core.docstring_parser import DocstringParser
+
+NUM_ARGS = 200
+NUM_RUNS = 20
+DESCRIPTION = [
+    "A long description of the argument which",
+    "continues on the next line and mentions ['some', 'values'].",
+]
+
+
+def google_docstring() -> str:
+    lines = ["Summary line.", "", "Args:"]
+    for idx in range(NUM_ARGS):
+        lines.append(f"    arg_{idx} (int): {DESCRIPTION[0]}")
+        lines.append(f"        {DESCRIPTION[1]}")
+    lines += ["", "Returns:", "    int: The result.", "", "Raises:", "    ValueError: Never."]
+    return "\n".join(lines)
+
+
+def numpydoc_docstring() -> str:
+    lines = ["Summary line.", "", "Parameters", "----------"]
+    for idx in range(NUM_ARGS):
+        lines.append(f"arg_{idx} : int")
+        lines += [f"    {line}" for line in DESCRIPTION]
+    lines += ["", "Returns", "-------", "int", "    The result."]
+    lines += ["", "Raises", "------", "ValueError", "    Never."]
+    return "\n".join(lines)
+
+
+def field_docstring(prefix: str, raise_tag: str) -> str:
+    lines = ["Summary line.", ""]
+    for idx in range(NUM_ARGS):
+        lines.append(f"{prefix}param arg_{idx}: {DESCRIPTION[0]}")
+        lines.append(f"    {DESCRIPTION[1]}")
+        lines.append(f"{prefix}type arg_{idx}: int")
+    lines += [f"{prefix}return: The result.", f"{prefix}{raise_tag} ValueError: Never."]
+    return "\n".join(lines)
+
+
+DOCSTRINGS = {
+    "google": google_docstring(),
+    "numpydoc": numpydoc_docstring(),
+    "rest": field_docstring(":", "raises"),
+    "epytext": field_docstring("@", "raise"),
+}
+
+
+def build_function(docstring: str) -> ast.FunctionDef:
+    args = ", ".join(f"arg_{idx}" for idx in range(NUM_ARGS))
+    indented = docstring.replace("\n", "\n    ")
+    source = f'def function({args}):\n    """{indented}\n    """\n'
+    return ast.parse(source).body[0]
+
+
+def main():
+    for docstring_format, docstring in DOCSTRINGS.items():
+        parser = DocstringParser.build_parser(docstring_format)
+        node = build_function(docstring)
+        parsed = parser.parse(node)
+        assert len(parsed.args) == NUM_ARGS, docstring_format
+
+        def run():
+            parser.reset()
+            parser.parse(node)
+
+        seconds = min(timeit.repeat(run, number=NUM_RUNS, repeat=5)) / NUM_RUNS
+        print(f"{docstring_format:<10} {seconds * 1000:8.3f} ms per docstring")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the structure file formats on a large structure.
+
+Run with:
+    python -m test.benchmark_serialization
+"""
+
+import os
+import tempfile
+import timeit
+from functools import partial
+
+from pyargwriter.utils.file_system import (
+    JSON_BACKEND,
+    YAML_BACKEND,
+    load_binary,
+    load_json,
+    load_yaml,
+    write_binary,
+    write_json,
+    write_yaml,
+)
+
+NUM_MODULES = 50
+NUM_COMMANDS = 20
+NUM_ARGS = 10
+
+
+def build_structure() -> dict:
+    modules = []
+    for module_idx in range(NUM_MODULES):
+        commands = []
+        for command_idx in range(NUM_COMMANDS):
+            args = [
+                {
+                    "help": f"A description of argument {arg_idx}.",
+                    "dest": f"arg_{arg_idx}",
+                    "name_or_flags": f"--arg-{arg_idx}",
+                    "type": "int",
+                    "default": arg_idx,
+                }
+                for arg_idx in range(NUM_ARGS)
+            ]
+            commands.append(
+                {"name": f"command_{command_idx}", "help": "", "args": args, "decorator_flags": []}
+            )
+        modules.append(
+            {
+                "name": f"Module{module_idx}",
+                "help": "",
+                "commands": commands,
+                "location": f"module_{module_idx}.py",
+                "args": [],
+            }
+        )
+    return {"modules": modules}
+
+
+FORMATS = {
+    f"yaml ({YAML_BACKEND})": ("structure.yaml", write_yaml, load_yaml),
+    f"json ({JSON_BACKEND})": ("structure.json", write_json, load_json),
+    f"json compact ({JSON_BACKEND})": (
+        "structure.json",
+        partial(write_json, compact=True),
+        load_json,
+    ),
+    "pawb": ("structure.pawb", write_binary, load_binary),
+}
+
+
+def main():
+    data = build_structure()
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (file_name, write, load) in FORMATS.items():
+            path = os.path.join(directory, file_name)
+            write_seconds = min(timeit.repeat(lambda: write(data, path), number=1, repeat=3))
+            load_seconds = min(timeit.repeat(lambda: load(path), number=1, repeat=3))
+            assert load(path) == data, name
+            size = os.path.getsize(path) / 1e6
+            print(
+                f"{name:<22} write {write_seconds:7.3f} s  load {load_seconds:7.3f} s  {size:6.2f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,19 @@
 import glob
 import os
 import pytest
+from pyargwriter._core.code_inspector import ModuleInspector
+from pyargwriter._core.structures import ModuleStructures
 from pyargwriter.entrypoint import ArgParseWriter
 
+TEST_PROJECT_FILES = ["test/test_project/tester.py", "test/test_project/dummy_class.py"]
+
 
 def pytest_addoption(parser):
     parser.addoption("--keep-files", action="store_true")
 
 
 def run_pyargwriter():
-    writer = ArgParseWriter(force=True)
+    writer = ArgParseWriter(force=True, no_cache=True, no_state=True)
     input_file = "test/test_project/tester.py"
     output = "test/test_project"
     writer.generate_parser(files=[input_file], output=output, pretty=True)
@@ -22,6 +26,9 @@ def cleanup_generated_files():
 
     for file in files_to_remove:
         os.remove(file)
+    # written by tests generating the code with the state of the previous run
+    for file in glob.glob(base_dir + "/.pyargwriter_state.json"):
+        os.remove(file)
 
 
 @pytest.fixture(scope="session")
@@ -37,13 +44,42 @@ def cleanup_tmp_dir(request: pytest.FixtureRequest) -> None:
         yaml_files = glob.glob("test/tmp/*.yaml")
         yml_files = glob.glob("test/tmp/*.yml")
         json_files = glob.glob("test/tmp/*.json")
+        pawb_files = glob.glob("test/tmp/*.pawb")
+        jsonl_files = glob.glob("test/tmp/*.jsonl")
         python_files = glob.glob("test/tmp/*.py")
         emb_python_files = glob.glob("test/tmp/*/*.py")
+        state_files = glob.glob("test/tmp/.pyargwriter_state.json")
 
-        files = [*yaml_files, *yml_files, *json_files, *python_files, *emb_python_files]
+        files = [
+            *yaml_files,
+            *yml_files,
+            *json_files,
+            *pawb_files,
+            *jsonl_files,
+            *python_files,
+            *emb_python_files,
+            *state_files,
+        ]
 
         for file in files:
             os.remove(file)
 
     if not request.config.getoption("--keep-files"):
         request.addfinalizer(cleanup)
+
+
+def inspect_modules(files) -> ModuleStructures:
+    parser = ModuleInspector()
+    parser.visit_files(files)
+    # round trip through dicts, the generators get structures like read from a file
+    return ModuleStructures.from_dict(parser.modules.to_dict())
+
+
+@pytest.fixture
+def project_modules() -> ModuleStructures:
+    return inspect_modules(TEST_PROJECT_FILES)
+
+
+@pytest.fixture
+def ml_pipeline_modules() -> ModuleStructures:
+    return inspect_modules(["examples/ml_pipeline.py"])
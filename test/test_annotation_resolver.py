@@ -0,0 +1,101 @@
+import ast
+import subprocess
+import sys
+
+import pytest
+
+from pyargwriter._core.annotation_resolver import AnnotationResolver
+from pyargwriter._core.code_generator import CodeGenerator
+from pyargwriter._core.code_inspector import ModuleInspector
+
+
+def resolve(annotation: str, imports: dict = None) -> dict:
+    return AnnotationResolver(imports).resolve(ast.parse(annotation, mode="eval").body)
+
+
+@pytest.mark.parametrize(
+    "annotation, expected",
+    [
+        ("int", {"type": "int"}),
+        ("bool", {"type": "bool"}),
+        ("list[float]", {"type": "float", "nargs": "+"}),
+        ("List[str]", {"type": "str", "nargs": "+"}),
+        ("list[bool]", {"type": "str2bool", "nargs": "+"}),
+        ("Tuple[int, int]", {"type": "int", "nargs": 2}),
+        ("tuple[float, ...]", {"type": "float", "nargs": "+"}),
+        ("Optional[int]", {"type": "int"}),
+        ("Union[None, str]", {"type": "str"}),
+        ("float | None", {"type": "float"}),
+        ("Literal['a', 'b']", {"type": "str", "choices": ["a", "b"]}),
+        ("Literal[1, 2]", {"type": "int", "choices": [1, 2]}),
+        ("Path", {"type": "Path"}),
+        ("pathlib.Path", {"type": "Path"}),
+        ("'Optional[Path]'", {"type": "Path"}),
+        ("dict", {}),
+        ("Any", {}),
+        ("Union[int, str]", {}),
+        ("Literal[1, 'a']", {}),
+    ],
+)
+def test_resolve(annotation, expected):
+    assert resolve(annotation) == expected
+
+
+def test_resolve_through_imports():
+    imports = {"pl": "pathlib", "Seq": "typing.Sequence", "Path": "my_package.Path"}
+    assert resolve("pl.Path", imports) == {"type": "Path"}
+    assert resolve("Seq[int]", imports) == {"type": "int", "nargs": "+"}
+    # a different class of the same name is not converted
+    assert resolve("Path", imports) == {}
+
+
+def test_generated_converters(tmp_path):
+    source = '''
+from pathlib import Path
+from typing import Literal, Optional, Tuple
+
+
+class Tool:
+    """Tool with precisely typed arguments."""
+
+    def run(
+        self,
+        path: Path,
+        mode: Literal["fast", "slow"],
+        size: Tuple[int, int],
+        flags: list[bool],
+        limit: Optional[int] = None,
+    ):
+        """Run the tool.
+
+        Args:
+            path (Path): input file
+            mode (str): speed of the tool
+            size (Tuple[int, int]): width and height
+            flags (list[bool]): switches
+            limit (int, optional): maximum number of items. Defaults to None.
+        """
+'''
+    file = tmp_path / "tool.py"
+    file.write_text(source)
+    inspector = ModuleInspector()
+    inspector.visit_files([str(file)])
+    generator = CodeGenerator()
+    generator.from_dict(inspector.modules.to_dict(), "tool/utils/parser.py")
+    generator.write(str(tmp_path / "parser.py"), str(tmp_path / "main.py"), force=True)
+
+    script = (
+        "from argparse import ArgumentParser; from parser import setup_parser;"
+        "args = setup_parser(ArgumentParser()).parse_args(['run', '--path', 'a.txt', "
+        "'--mode', 'fast', '--size', '3', '4', '--flags', 'True', 'False']);"
+        "print(repr(args.path), args.mode, args.size, args.flags, args.limit)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split(" ", 1)[1].strip() == "fast [3, 4] [True, False] None"
+    assert "Path('a.txt')" in result.stdout
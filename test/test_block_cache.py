@@ -0,0 +1,149 @@
+import os
+import shutil
+
+from pyargwriter._core.block_cache import STATE_FILE, CodeBlockCache
+from pyargwriter._core.code_generator import CodeGenerator
+from pyargwriter._core.code_inspector import ModuleInspector
+from pyargwriter.entrypoint import ArgParseWriter
+
+
+FILES = ["test/test_project/tester.py", "test/test_project/dummy_class.py"]
+
+
+def generate(tmp_path, name: str, modules, blocks: CodeBlockCache = None, **kwargs):
+    generator = CodeGenerator(**kwargs)
+    generator.from_dict(modules, "proj/utils/parser.py", blocks)
+    parser_path = str(tmp_path / f"{name}_parser.py")
+    main_path = str(tmp_path / f"{name}_main.py")
+    generator.write(parser_path, main_path, force=True)
+    with open(parser_path) as parser_file, open(main_path) as main_file:
+        return parser_file.read(), main_file.read()
+
+
+def inspect_modules():
+    inspector = ModuleInspector()
+    inspector.visit_files(FILES)
+    return inspector.modules.to_dict()
+
+
+def test_reused_blocks_match_fresh_generation(tmp_path):
+    modules = inspect_modules()
+    fresh = generate(tmp_path, "fresh", modules)
+
+    for kwargs in [{}, {"dispatch_table": True}, {"lazy_imports": True}]:
+        blocks = CodeBlockCache()
+        assert generate(tmp_path, "first", modules, blocks, **kwargs)
+        blocks.save(str(tmp_path / STATE_FILE), [])
+
+        blocks = CodeBlockCache.load(str(tmp_path / STATE_FILE))
+        reused = generate(tmp_path, "reused", modules, blocks, **kwargs)
+        assert not blocks.changed
+        assert reused == generate(tmp_path, "plain", modules, **kwargs)
+    assert generate(tmp_path, "plain", modules) == fresh
+
+
+def test_only_changed_module_is_regenerated(tmp_path):
+    modules = inspect_modules()
+    blocks = CodeBlockCache()
+    generate(tmp_path, "first", modules, blocks)
+    blocks.save(str(tmp_path / STATE_FILE), [])
+
+    modules["modules"][1]["commands"] = modules["modules"][1]["commands"][:1]
+    blocks = CodeBlockCache.load(str(tmp_path / STATE_FILE))
+    reused = generate(tmp_path, "reused", modules, blocks)
+    assert blocks.changed
+    # the setup function and the execute branch of the changed module
+    assert blocks._misses == 2
+    assert reused == generate(tmp_path, "plain", modules)
+
+
+def test_changed_schema_regenerates_all_blocks(tmp_path, monkeypatch):
+    from pyargwriter._core import block_cache
+
+    modules = inspect_modules()
+    blocks = CodeBlockCache()
+    generate(tmp_path, "first", modules, blocks)
+    blocks.save(str(tmp_path / STATE_FILE), [])
+
+    monkeypatch.setattr(block_cache, "GENERATION_SCHEMA", block_cache.GENERATION_SCHEMA + 1)
+    blocks = CodeBlockCache.load(str(tmp_path / STATE_FILE))
+    generate(tmp_path, "reused", modules, blocks)
+    assert blocks._misses == 4
+
+
+def test_changed_context_regenerates_all_blocks(tmp_path):
+    modules = inspect_modules()
+    blocks = CodeBlockCache()
+    generate(tmp_path, "first", modules, blocks)
+    blocks.save(str(tmp_path / STATE_FILE), [])
+
+    blocks = CodeBlockCache.load(str(tmp_path / STATE_FILE))
+    reused = generate(tmp_path, "reused", modules, blocks, lazy_subparsers=True)
+    assert blocks._misses == 4
+    assert reused == generate(tmp_path, "plain", modules, lazy_subparsers=True)
+
+
+def test_unchanged_output_is_not_written(tmp_path):
+    output = str(tmp_path / "cli")
+    os.makedirs(output)
+    shutil.copy(FILES[1], output)
+    files = [os.path.join(output, "dummy_class.py")]
+    main_path = os.path.join(output, "__main__.py")
+
+    ArgParseWriter(force=True, no_cache=True).generate_parser(files, output)
+    assert os.path.isfile(os.path.join(output, STATE_FILE))
+    os.utime(main_path, ns=(0, 0))
+
+    ArgParseWriter(force=True, no_cache=True).generate_parser(files, output)
+    assert os.stat(main_path).st_mtime_ns == 0
+
+    # a modified output file is written again
+    with open(main_path, "a") as file:
+        file.write("\n")
+    ArgParseWriter(force=True, no_cache=True).generate_parser(files, output)
+    assert os.stat(main_path).st_mtime_ns != 0
+
+
+def test_no_state(tmp_path, monkeypatch):
+    from argparse import ArgumentParser
+
+    from pyargwriter.utils.parser import setup_parser
+
+    parser = setup_parser(ArgumentParser())
+    for command in ("write-code", "generate-argparser"):
+        args = parser.parse_args([command, "--input", "structure.json", "--no-state"])
+        assert args.no_state
+
+    files = [os.path.abspath(file) for file in FILES]
+    monkeypatch.chdir(tmp_path)
+    structure = "structure.json"
+    output = "cli"
+    writer = ArgParseWriter(force=True, no_cache=True, no_state=True)
+    writer.parse_code(files, structure)
+    writer.write_code(structure, output)
+    assert os.path.isfile(os.path.join(output, "__main__.py"))
+    assert not os.path.exists(os.path.join(output, STATE_FILE))
+
+    ArgParseWriter(force=True, no_cache=True).write_code(structure, output)
+    assert os.path.isfile(os.path.join(output, STATE_FILE))
+
+
+def test_declined_overwrite_is_generated_again(tmp_path, monkeypatch):
+    output = str(tmp_path / "cli")
+    os.makedirs(output)
+    for file in FILES:
+        shutil.copy(file, output)
+    files = [os.path.join(output, os.path.basename(file)) for file in FILES]
+    parser_path = os.path.join(output, "utils", "parser.py")
+
+    ArgParseWriter(no_cache=True).generate_parser(files[1:], output)
+
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+    ArgParseWriter(no_cache=True).generate_parser(files, output)
+    with open(parser_path) as file:
+        assert "ArgumentTester" not in file.read()
+
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+    ArgParseWriter(no_cache=True).generate_parser(files, output)
+    with open(parser_path) as file:
+        assert "ArgumentTester" in file.read()
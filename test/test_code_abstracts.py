@@ -4,6 +4,9 @@ This module contains comprehensive tests for the code abstraction classes:
 LineOfCode, Code, Function, Match, MatchCase, and DefaultCase.
 """
 
+import io
+import random
+
 import pytest
 from pyargwriter._core.code_abstracts import (
     LineOfCode,
@@ -45,6 +48,12 @@ class TestLineOfCode:
         expected_indent = " " * (TAB_SIZE * 3)
         assert line.content == f"{expected_indent}result = a + b\n"
 
+    def test_line_of_code_raw_content(self):
+        """Test that the raw content is stored without indentation."""
+        line = LineOfCode("x = 1", tab_level=2)
+        assert line.raw == "x = 1"
+        assert not hasattr(line, "__dict__")
+
 
 class TestCode:
     """Test cases for Code class."""
@@ -121,6 +130,24 @@ class TestCode:
 
         code1.insert(code2, 1)
         assert len(code1) == 4
+        lines = repr(code1).split("\n")
+        assert lines[:4] == ["main1", "insert1", "insert2", "main2"]
+
+    def test_code_insert_front_keeps_order(self):
+        """Test that repeated inserts at index 0 stack up in reverse call order."""
+        code = Code()
+        code.append("last")
+        code.insert([LineOfCode("b1"), LineOfCode("b2")], 0)
+        code.insert(LineOfCode("a"), 0)
+        assert repr(code).split("\n")[:4] == ["a", "b1", "b2", "last"]
+
+    def test_code_insert_negative_index(self):
+        """Test inserting relative to the end of the code block."""
+        code = Code()
+        code.append("line1")
+        code.append("line3")
+        code.insert(LineOfCode("line2"), -1)
+        assert repr(code).split("\n")[:3] == ["line1", "line2", "line3"]
 
     def test_code_replace_line(self):
         """Test replacing a line at specific index."""
@@ -144,6 +171,97 @@ class TestCode:
         code.append(line)
         assert line in code
 
+    def test_code_contains_after_replace_and_nesting(self):
+        """Test that membership checks follow replaced and nested lines."""
+        inner = Code()
+        inner.append("nested_line")
+        code = Code()
+        code.append("old_line")
+        code._tab_level = 1
+        code.append(inner)
+        assert "nested_line" in code
+
+        code.replace(LineOfCode("new_line"), 0)
+        assert "new_line" in code
+        assert "old_line" not in code
+
+        code.replace(LineOfCode("other_line", 1), -1)
+        assert "nested_line" not in code
+        assert "other_line" in code
+
+    def test_code_add_import_deduplicates(self):
+        """Test that import statements are only inserted once."""
+        code = Code()
+        code.append("x = 1")
+        assert code.add_import("from argparse import ArgumentParser")
+        assert not code.add_import("from argparse import ArgumentParser")
+        assert code.has_import("from argparse import ArgumentParser")
+        assert len(code) == 2
+        assert repr(code).startswith("from argparse import ArgumentParser\n")
+
+    def test_code_has_import_ignores_indented_imports(self):
+        """Test that imports inside nested blocks do not count as top level imports."""
+        body = Code.from_str("import os")
+        func = Function("lazy")
+        func.append(body)
+        assert "import os" in func
+        assert not func.has_import("import os")
+
+        module = Code()
+        module.insert(Code.from_str("import sys"), 0)
+        assert module.has_import("import sys")
+
+    def test_code_has_import_of_shifted_block(self):
+        """Test that imports of a block moved to the top level count as top level imports."""
+        inner = Code()
+        inner.append(LineOfCode("import os", 1))
+        code = Code()
+        code.append(inner)
+        assert code.has_import("import os")
+        assert not code.add_import("import os")
+        assert len(code) == 1
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_code_index_matches_linear_scan(self, seed):
+        """Test that the content and import index agree with a scan over all lines."""
+        rng = random.Random(seed)
+        imports = ["import os", "import sys", "from a import b"]
+        statements = imports + ["x = 1", "pass"]
+
+        def random_code():
+            code = Code()
+            for _ in range(rng.randint(1, 4)):
+                code.append(LineOfCode(rng.choice(statements), rng.randint(0, 2)))
+            if rng.random() < 0.5:
+                code.set_tab_level(rng.randint(0, 2))
+            return code
+
+        code = Code()
+        for _ in range(30):
+            operation = rng.choice(["insert", "append", "replace"])
+            if operation == "replace" and len(code):
+                line = LineOfCode(rng.choice(statements), rng.randint(0, 2))
+                code.replace(line, rng.randrange(len(code)))
+            elif operation == "insert":
+                code.insert(random_code(), rng.randint(0, len(code)))
+            else:
+                code.append(random_code())
+            if rng.random() < 0.2:
+                code.set_tab_level(rng.randint(0, 2))
+
+            lines = [(line, offset - code._depth) for line, offset in code._walk()]
+            for statement in statements:
+                assert (statement in code) == any(
+                    line.raw == statement for line, _ in lines
+                )
+                assert code.has_import(statement) == (
+                    statement in imports
+                    and any(
+                        line.raw == statement and line.tab_level + offset == 0
+                        for line, offset in lines
+                    )
+                )
+
     def test_code_set_tab_level(self):
         """Test setting tab level for all lines."""
         code = Code()
@@ -162,6 +280,69 @@ class TestCode:
         code.set_tab_level(-1)
         assert not repr(code).startswith(" ")
 
+    def test_code_iter_lines(self):
+        """Test lazily rendering Code line by line."""
+        code = Code()
+        code.append("line1")
+        code._tab_level = 1
+        code.append("line2")
+        expected_indent = " " * TAB_SIZE
+        assert list(code.iter_lines()) == ["line1\n", f"{expected_indent}line2\n"]
+
+    def test_code_render_to_stream(self):
+        """Test that buffered rendering to a stream matches repr."""
+        code = Code()
+        for idx in range(50):
+            code.append(f"x_{idx} = {idx}")
+        stream = io.StringIO()
+        code.render_to(stream, buffer_size=64)
+        assert stream.getvalue() == repr(code)
+
+    def test_code_nested_blocks_indentation(self):
+        """Test that nested blocks are indented relative to their parents on render."""
+        inner = Code()
+        inner.append("if x:")
+        inner._tab_level = 1
+        inner.append("y = 1")
+
+        outer = Code()
+        outer.append("def f(x):")
+        outer._tab_level = 1
+        outer.append(inner)
+        outer.append("return y")
+
+        indent = " " * TAB_SIZE
+        assert repr(outer) == (
+            f"def f(x):\n{indent}if x:\n{indent * 2}y = 1\n{indent}return y\n"
+        )
+        assert len(outer) == 4
+        assert [line.tab_level for line in outer.file] == [0, 1, 2, 1]
+
+    def test_code_append_does_not_alias_child(self):
+        """Test that changing a code block after appending it does not alter the parent."""
+        inner = Code.from_str("a = 1")
+        outer = Code()
+        outer.append(inner)
+        inner.append("b = 2")
+        assert len(outer) == 1
+        assert "b = 2" not in repr(outer)
+
+    def test_code_replace_and_get_line_in_nested_block(self):
+        """Test replacing and reading lines that live inside nested blocks."""
+        inner = Code()
+        inner.append("first")
+        inner.append("second")
+        outer = Code()
+        outer.append("head")
+        outer._tab_level = 1
+        outer.append(inner)
+
+        assert outer.get_line(-1).raw == "second"
+        assert outer.get_line(-1).tab_level == 1
+        outer.replace(LineOfCode("replaced", 1), -1)
+        indent = " " * TAB_SIZE
+        assert repr(outer) == f"head\n{indent}first\n{indent}replaced\n"
+
     def test_code_get_line(self):
         """Test getting a specific line by index."""
         code = Code()
@@ -7,6 +7,7 @@ GoogleParser, EpyTextParser, ReSTParser, and NumpyDocParser.
 import ast
 import pytest
 from pyargwriter._core.docstring_parser import (
+    AutoParser,
     DocstringParser,
     GoogleParser,
     EpyTextParser,
@@ -240,6 +241,22 @@ class TestClass:
         assert "config" in arg_help
         assert "Configuration dict" in arg_help["config"]
 
+    def test_summary_looking_like_header(self, parser):
+        """Test that a summary ending with a colon is no section header."""
+        code = '''
+class TestClass:
+    def steps(self, n):
+        """Steps:
+
+        Args:
+            n (int): number of steps
+        """
+        pass
+'''
+        func_node = ast.parse(code).body[0].body[0]
+        assert parser.get_help_msg(func_node) == "Steps:"
+        assert parser.get_arg_help_msg(func_node) == {"n": "number of steps"}
+
     def test_empty_docstring(self, parser):
         """Test handling of empty docstring."""
         code = '''
@@ -772,3 +789,228 @@ class MathUtils:
         # If 'b' is present, that's great; otherwise the parser has a known limitation
         if len(arg_help) > 1:
             assert "b" in arg_help
+
+
+class TestParsedDocstring:
+    """Test cases for the parsed docstring shared by all accessors."""
+
+    def test_parse_is_memoized(self, monkeypatch):
+        """Test that each docstring is parsed only once until reset."""
+        tree = ast.parse(GOOGLE_STYLE_CODE)
+        add_method = tree.body[0].body[1]
+        parser = GoogleParser()
+
+        calls = []
+        get_docstring = ast.get_docstring
+        monkeypatch.setattr(
+            ast, "get_docstring", lambda node: calls.append(node) or get_docstring(node)
+        )
+        parser.get_help_msg(add_method)
+        parser.get_arg_help_msg(add_method)
+        parser.get_return_msg(add_method)
+        assert len(calls) == 1
+
+        parser.reset()
+        parser.get_help_msg(add_method)
+        assert len(calls) == 2
+
+    def test_parse_sections(self):
+        """Test that summary, arguments, return value and exceptions are parsed."""
+        code = '''
+class Loader:
+    def load(self, path, strict):
+        """Load a file.
+
+        Args:
+            path (str): Path to the file.
+            strict (bool): Whether to fail on unknown keys.
+
+        Returns:
+            dict: The loaded data.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+'''
+        parsed = GoogleParser().parse(ast.parse(code).body[0].body[0])
+        assert parsed.summary == "Load a file."
+        assert parsed.args == {
+            "path": "Path to the file.",
+            "strict": "Whether to fail on unknown keys.",
+        }
+        assert parsed.returns == "The loaded data."
+        assert parsed.raises == {"FileNotFoundError": "If the file does not exist."}
+
+    def test_missing_args_section_fails_on_access(self):
+        """Test that a missing Args section only fails when the arguments are accessed."""
+        code = '''
+class Broken:
+    def run(self, a, b):
+        """Run without documented arguments."""
+'''
+        parser = GoogleParser()
+        method = ast.parse(code).body[0].body[0]
+        assert parser.get_help_msg(method) == "Run without documented arguments."
+        with pytest.raises(ValueError):
+            parser.get_arg_help_msg(method)
+
+
+class TestSectionTokenizer:
+    """Test cases for the section tokenizer shared by all docstring formats."""
+
+    def test_multi_line_descriptions_are_joined(self):
+        """Test that descriptions spanning several lines are joined."""
+        code = '''
+def run(stage, dry):
+    """Run a stage.
+
+    Args:
+        stage (str): The stage to run. Must be one
+            of ["train", "predict"].
+        dry (bool): Only print the commands.
+    """
+'''
+        parsed = GoogleParser().parse(ast.parse(code).body[0])
+        assert parsed.args == {
+            "stage": 'The stage to run. Must be one of ["train", "predict"].',
+            "dry": "Only print the commands.",
+        }
+
+    @pytest.mark.parametrize(
+        "parser, docstring",
+        [
+            (
+                NumpyDocParser(),
+                """Open a file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+
+    Returns
+    -------
+    file
+        The opened file.
+
+    Raises
+    ------
+    OSError
+        If the file can not be opened.
+    """,
+            ),
+            (
+                ReSTParser(),
+                """Open a file.
+
+    :param path: Path to the file.
+    :type path: str
+    :return: The opened file.
+    :raises OSError: If the file can not be opened.
+    """,
+            ),
+            (
+                EpyTextParser(),
+                """Open a file.
+
+    @param path: Path to the file.
+    @type path: str
+    @return: The opened file.
+    @raise OSError: If the file can not be opened.
+    """,
+            ),
+        ],
+    )
+    def test_sections_of_all_formats(self, parser, docstring):
+        """Test that every format yields the same sections."""
+        code = f'def open_file(path):\n    """{docstring}"""\n'
+        parsed = parser.parse(ast.parse(code).body[0])
+        assert parsed.summary == "Open a file."
+        assert parsed.args == {"path": "Path to the file."}
+        assert parsed.returns == "The opened file."
+        assert parsed.raises == {"OSError": "If the file can not be opened."}
+
+
+MIXED_STYLE_CODE = '''
+class Mixed:
+    """Class documented without argument section."""
+
+    def google(self, a):
+        """Google style.
+
+        Args:
+            a (int): First.
+        """
+
+    def rest(self, b):
+        """reST style.
+
+        :param b: Second.
+        """
+
+    def numpy(self, c):
+        """NumPy style.
+
+        Parameters
+        ----------
+        c : int
+            Third.
+        """
+
+    def epytext(self, d):
+        """Epytext style.
+
+        @param d: Fourth.
+        """
+'''
+
+
+class TestAutoParser:
+    """Test cases for the automatic detection of the docstring format."""
+
+    def test_build_parser(self):
+        """Test that auto is accepted by build_parser."""
+        assert isinstance(DocstringParser.build_parser("Auto"), AutoParser)
+
+    def test_format_per_function(self):
+        """Test that the format is detected for every function."""
+        methods = ast.parse(MIXED_STYLE_CODE).body[0].body[1:]
+        parser = AutoParser()
+        assert [parser.detect_format(method) for method in methods] == [
+            "google",
+            "rest",
+            "numpydoc",
+            "epytext",
+        ]
+        assert [parser.get_arg_help_msg(method) for method in methods] == [
+            {"a": "First."},
+            {"b": "Second."},
+            {"c": "Third."},
+            {"d": "Fourth."},
+        ]
+        # one parser per format is reused
+        assert len(parser._parsers) == 4
+
+    def test_format_of_file_is_reused(self):
+        """Test that docstrings without marker use the first format of the file."""
+        code = '''
+def documented(a):
+    """Documented.
+
+    :param a: First.
+    """
+
+def summary_only(b):
+    """Only a summary."""
+'''
+        documented, summary_only = ast.parse(code).body
+        parser = AutoParser()
+        assert parser.detect_format(summary_only) == "google"
+        parser.get_arg_help_msg(documented)
+        assert parser.detect_format(summary_only) == "rest"
+        assert parser.get_arg_help_msg(summary_only) == {
+            "b": DocstringParser.default_help_msg
+        }
+
+        parser.reset()
+        assert parser.detect_format(summary_only) == "google"
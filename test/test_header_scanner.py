@@ -0,0 +1,104 @@
+import ast
+import glob
+import re
+
+from pyargwriter._core.code_inspector import ModuleInspector
+from pyargwriter._core.header_scanner import HeaderScanner
+from pyargwriter.utils.file_system import load_file_tree
+
+
+TRICKY_SOURCE = '''
+import os
+
+
+class Tricky:
+    """Class with unusual formatting.
+
+    Args:
+        a (int): first
+    """
+
+    def __init__(self, a: int = (
+        1
+    )):
+        self.a = a
+
+    def strings(self, b: str = "x:"):  # comment with ':
+        """Docstring with a quote \\""" inside.
+
+        Args:
+            b (str): some text
+        """
+        text = """
+def fake(self):
+    pass
+"""
+        other = 'it\\'s'
+        return text + other
+
+    def no_docstring(self, c: list[int] = [1, 2]):
+        def nested(d):
+            return {
+                "key": [d,
+        ]}
+        return nested(c)
+
+    async def run(self, e: float):
+        """Async method."""
+
+        def helper(f: int):
+            """Helper in an async method.
+
+            Args:
+                f (int): value
+            """
+
+    def one_liner(self, g: bool = False): return g
+    if os.name == "nt":
+        def windows(self, h: str):
+            """Only on Windows.
+
+            Args:
+                h (str): value
+            """
+            return h
+
+def function(i: int):
+    class Local:
+        def method(self, j: int):
+            """Local method.
+
+            Args:
+                j (int): value
+            """
+            return j
+    return Local
+'''
+
+
+def inspect_tree(tree: ast.Module) -> str:
+    inspector = ModuleInspector()
+    inspector.visit(tree, "file.py")
+    # ast nodes as defaults are compared by their type
+    return re.sub(r" at 0x[0-9a-f]+", "", repr(inspector.modules.to_dict()))
+
+
+def test_headers_only_matches_full_parse():
+    for file in glob.glob("test/test_project/**/*.py", recursive=True) + glob.glob(
+        "examples/*.py"
+    ):
+        assert inspect_tree(load_file_tree(file, headers_only=True)) == inspect_tree(
+            load_file_tree(file)
+        )
+
+
+def test_scanner_drops_method_bodies():
+    source = "".join(HeaderScanner().scan(TRICKY_SOURCE.splitlines(keepends=True)))
+
+    assert "self.a = a" not in source
+    assert "return text + other" not in source
+    assert "nested" not in source
+    assert "Docstring with a quote" in source
+    # module level functions are kept
+    assert "class Local" in source
+    assert inspect_tree(ast.parse(source)) == inspect_tree(ast.parse(TRICKY_SOURCE))
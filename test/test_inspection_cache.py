@@ -0,0 +1,122 @@
+import os
+import shutil
+
+import pytest
+
+from pyargwriter._core.code_inspector import ModuleInspector, inspect_files
+from pyargwriter._core.inspection_cache import InspectionCache
+
+
+SOURCE = "test/test_project/dummy_class.py"
+
+
+def copy_source(tmp_path, name: str = "dummy_class.py") -> str:
+    path = str(tmp_path / name)
+    shutil.copy(SOURCE, path)
+    return path
+
+
+def test_cache_round_trip(tmp_path):
+    path = copy_source(tmp_path)
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    assert cache.get(path) is None
+
+    modules = inspect_files([path])[0]
+    cache.put(path, modules)
+    cache.save()
+
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    cached = cache.get(path)
+    assert [module.to_dict() for module in cached] == [
+        module.to_dict() for module in modules
+    ]
+
+
+def test_cache_miss_on_changed_content_or_format(tmp_path):
+    path = copy_source(tmp_path)
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    cache.put(path, inspect_files([path])[0])
+    cache.save()
+
+    other_format = InspectionCache("numpydoc", directory=str(tmp_path / "cache"))
+    assert other_format.get(path) is None
+
+    with open(path, "a") as file:
+        file.write("\n\nclass Extra:\n    pass\n")
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    assert cache.get(path) is None
+
+
+def test_cache_miss_on_changed_schema(tmp_path, monkeypatch):
+    from pyargwriter._core import inspection_cache
+
+    path = copy_source(tmp_path)
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    cache.put(path, inspect_files([path])[0])
+    cache.save()
+
+    schema = inspection_cache.INSPECTION_SCHEMA + 1
+    monkeypatch.setattr(inspection_cache, "INSPECTION_SCHEMA", schema)
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    assert cache.get(path) is None
+
+
+def test_cache_location_follows_path(tmp_path):
+    first = copy_source(tmp_path, "first.py")
+    second = copy_source(tmp_path, "second.py")
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    cache.put(first, inspect_files([first])[0])
+
+    assert cache.get(second)[0].location == second
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    paths = [copy_source(tmp_path, f"file_{idx}.py") for idx in range(3)]
+    for idx, path in enumerate(paths):
+        # make the content of each file unique
+        with open(path, "a") as file:
+            file.write(f"\n# {idx}\n")
+
+    cache = InspectionCache(directory=str(tmp_path / "cache"), max_entries=2)
+    for path in paths:
+        cache.put(path, inspect_files([path])[0])
+    cache.get(paths[0])
+    cache.save()
+
+    cache = InspectionCache(directory=str(tmp_path / "cache"), max_entries=2)
+    assert cache.get(paths[0]) is not None
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[2]) is not None
+    entries = [file for file in os.listdir(tmp_path / "cache") if file != "index.json"]
+    assert len(entries) == 2
+
+
+def test_module_inspector_uses_cache(tmp_path):
+    path = copy_source(tmp_path)
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+
+    inspector = ModuleInspector()
+    inspector.visit_files([path], cache=cache)
+    cached_inspector = ModuleInspector()
+    cached_inspector.visit_files([path], cache=cache)
+
+    assert cached_inspector.modules.to_dict() == inspector.modules.to_dict()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_files_are_inspected_as_they_are_produced(tmp_path, jobs):
+    paths = [copy_source(tmp_path, "first.py"), copy_source(tmp_path, "second.py")]
+    cache = InspectionCache(directory=str(tmp_path / "cache"))
+    if jobs > 1:
+        # cached modules are passed on without waiting for the workers
+        ModuleInspector().visit_files(paths[:1], cache=cache)
+
+    emitted = []
+
+    def produce():
+        yield paths[0]
+        assert emitted, "the first file was not inspected before the next one was produced"
+        yield paths[1]
+
+    ModuleInspector().visit_files(produce(), jobs, cache, emit=emitted.append)
+    assert [module.location for module in emitted] == paths
@@ -1,8 +1,13 @@
+from argparse import ArgumentParser
+import shutil
+import subprocess
+import sys
 import pytest
 from pyargwriter.entrypoint import ArgParseWriter
+from pyargwriter.api.lazy_parser import LazyArgumentParser
 from pyargwriter._core.code_generator import CodeGenerator
 from pyargwriter._core.code_inspector import ModuleInspector
-from pyargwriter.utils.file_system import load_file_tree
+from pyargwriter.utils.file_system import iter_jsonl, load_file_tree
 
 
 def test_code_parser(cleanup_tmp_dir):
@@ -59,7 +64,7 @@ def test_code_generator(cleanup_tmp_dir):
 
 
 def test_argument_parser_module(cleanup_tmp_dir):
-    pyargwriter = ArgParseWriter(True)
+    pyargwriter = ArgParseWriter(True, no_cache=True, no_state=True)
 
     files = ["test/test_project/tester.py", "test/test_project/dummy_class.py"]
     pyargwriter.parse_code(files=files, output=None)
@@ -67,16 +72,20 @@ def test_argument_parser_module(cleanup_tmp_dir):
     pyargwriter.parse_code(files=files, output="test/tmp/test.yaml")
     pyargwriter.parse_code(files=files, output="test/tmp/test.yml")
     pyargwriter.parse_code(files=files, output="test/tmp/test.json")
+    pyargwriter.parse_code(files=files, output="test/tmp/test.pawb")
+    pyargwriter.parse_code(files=files, output="test/tmp/test.jsonl")
 
     pyargwriter.write_code(file="test/tmp/test.yaml", output="test/tmp", pretty=True)
     pyargwriter.write_code(file="test/tmp/test.yml", output="test/tmp", pretty=True)
     pyargwriter.write_code(file="test/tmp/test.json", output="test/tmp", pretty=True)
+    pyargwriter.write_code(file="test/tmp/test.pawb", output="test/tmp", pretty=True)
+    pyargwriter.write_code(file="test/tmp/test.jsonl", output="test/tmp", pretty=True)
 
     pyargwriter.generate_parser(files, "test/tmp", pretty=True)
 
 
 def test_fail_class(cleanup_tmp_dir, caplog):
-    pyargwriter = ArgParseWriter(True)
+    pyargwriter = ArgParseWriter(True, no_cache=True, no_state=True)
 
     files = ["test/test_project/fail_class.py"]
     # Does not fail anymore... made it more robust
@@ -86,3 +95,267 @@ def test_fail_class(cleanup_tmp_dir, caplog):
         pyargwriter.write_code(
             file="test/tmp/test.toml", output="test/tmp", pretty=True
         )
+
+
+def test_code_generator_does_not_mutate_structures(project_modules):
+    modules = project_modules
+    expected = modules.to_dict()
+
+    generator = CodeGenerator()
+    generator.from_structures(modules, "test/temp/utils/parser.py")
+
+    assert modules.to_dict() == expected
+
+
+def test_execute_rebuilds_parser_only_for_hydra_commands(ml_pipeline_modules):
+    generator = CodeGenerator()
+    generator.from_structures(ml_pipeline_modules, "test/temp/utils/parser.py")
+    lines = [line.strip() for line in generator._execute.iter_lines()]
+
+    rebuild = "_, command_parser = setup_entrypoint_parser(ArgumentParser())"
+    assert lines.count(rebuild) == 1
+    # the hydra command train needs its parser, the other commands do not
+    case = lines.index("case 'train':")
+    assert rebuild in lines[case + 1 : lines.index("case 'evaluate':")]
+    assert "command_parser['train']" in lines[lines.index(rebuild) + 1]
+
+
+def test_lazy_argument_parser_adds_arguments_on_use():
+    calls = []
+
+    def add_args(parser: ArgumentParser) -> ArgumentParser:
+        calls.append(parser)
+        parser.add_argument("--a", type=int)
+        return parser
+
+    parser = ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", parser_class=LazyArgumentParser)
+    first = subparsers.add_parser("first").defer(add_args)
+    second = subparsers.add_parser("second").defer(add_args)
+
+    args = parser.parse_args(["first", "--a", "3"])
+
+    assert vars(args) == {"command": "first", "a": 3}
+    assert calls == [first]
+    assert "--a" in second.format_help()
+    assert calls == [first, second]
+
+
+def test_code_generator_lazy_subparsers(project_modules):
+    generator = CodeGenerator(lazy_subparsers=True)
+    generator.from_structures(project_modules, "test/temp/utils/parser.py")
+    code = repr(generator._setup_parser)
+
+    assert "parser_class=LazyArgumentParser" in code
+    assert "int_test = int_test.defer(add_int_test_args)" in code
+    assert "from pyargwriter.api.lazy_parser import LazyArgumentParser" in code
+
+    namespace = {}
+    exec(code, namespace)
+    setup = namespace["setup_parser"](ArgumentParser())
+    args = setup.parse_args(["ArgumentTester", "int-test", "--a", "1"])
+    assert args.a == 1
+
+
+def test_execute_lazy_imports(project_modules):
+    generator = CodeGenerator(lazy_imports=True)
+    generator.from_structures(project_modules, "test/temp/utils/parser.py")
+    lines = [line.strip() for line in generator._execute.iter_lines()]
+
+    assert not any(line.endswith("import ArgumentTester") for line in lines[:6])
+    case = lines.index("case 'DummyClass':")
+    assert lines[case + 1].startswith("from ")
+    assert lines[case + 1].endswith(" import DummyClass")
+    assert lines[case + 2] == "module = DummyClass()"
+
+
+def test_hydra_plugin_imports_hydra_on_use():
+    code = (
+        "import sys; import pyargwriter.api.hydra_plugin, pyargwriter.decorator; "
+        "assert 'hydra' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_generated_cli_imports_hydra_only_for_hydra_commands(tmp_path):
+    package = tmp_path / "mlcli"
+    package.mkdir()
+    shutil.copy("examples/ml_pipeline.py", package)
+    shutil.copy("examples/train_config.yaml", tmp_path)
+    cmd = [
+        "pyargwriter", "generate-argparser", "--no-cache", "--no-state", "-f",
+        "--input", "mlcli/ml_pipeline.py", "--output", "mlcli",
+    ]
+    subprocess.run(cmd, cwd=tmp_path, check=True, capture_output=True)
+
+    code = (
+        "import runpy, sys; sys.argv = ['mlcli', '{command}']; "
+        "runpy.run_module('mlcli', run_name='__main__'); "
+        "assert ('hydra' in sys.modules) == {expected}"
+    )
+    for command, expected in [("evaluate", False), ("train", True)]:
+        run = [sys.executable, "-c", code.format(command=command, expected=expected)]
+        subprocess.run(run, cwd=tmp_path, check=True, capture_output=True)
+
+
+def test_execute_imports_hydra_support_only_in_hydra_cases(ml_pipeline_modules):
+    generator = CodeGenerator()
+    generator.from_structures(ml_pipeline_modules, "test/temp/utils/parser.py")
+    lines = [line.strip() for line in generator._execute.iter_lines()]
+
+    assert "from pyargwriter import api" not in lines
+    case = lines.index("case 'train':")
+    assert "from pyargwriter.api.hydra_plugin import hydra_wrapper" in lines[case + 1 : case + 3]
+    assert lines.count("from pathlib import Path") == 1
+
+
+def test_execute_dispatch_table(project_modules):
+    generator = CodeGenerator(dispatch_table=True)
+    generator.from_structures(project_modules, "test/temp/utils/parser.py")
+    lines = [line.strip() for line in generator._execute.iter_lines()]
+
+    assert not any(line.startswith("match ") for line in lines)
+    assert "def _handle_dummyclass_do_something(args: dict) -> None:" in lines
+    assert "('DummyClass', 'do-something'): _handle_dummyclass_do_something," in lines
+    assert "handler = COMMANDS.get((args.get('module'), args.get('command')))" in lines
+
+    calls = []
+
+    class DummyClass:
+        def do_something(self):
+            calls.append("do_something")
+
+    code = "".join(
+        line
+        for line in generator._execute.iter_lines()
+        if not line.startswith("from ")
+    )
+    namespace = {"ArgumentParser": ArgumentParser, "DummyClass": DummyClass}
+    exec(code, namespace)
+
+    assert namespace["execute"]({"module": "DummyClass", "command": "do-something"})
+    assert not namespace["execute"]({"module": "DummyClass", "command": None})
+    assert not namespace["execute"]({"module": None})
+    assert calls == ["do_something"]
+
+
+def test_parallel_inspection_matches_sequential():
+    files = [
+        "test/test_project/tester.py",
+        "test/test_project/dummy_class.py",
+        "examples/ml_pipeline.py",
+        "examples/shopping.py",
+    ]
+    sequential = ModuleInspector()
+    sequential.visit_files(files)
+    parallel = ModuleInspector()
+    parallel.visit_files(files, jobs=2)
+
+    assert parallel.modules.names == sequential.modules.names
+    assert parallel.modules.to_dict() == sequential.modules.to_dict()
+    # commands of one class do not leak into the next one
+    assert [len(module) for module in sequential.modules.modules] == [13, 2, 4, 2, 4]
+
+
+def test_inspection_state_is_reset_per_file():
+    inspector = ModuleInspector()
+    inspector.visit(load_file_tree("examples/ml_pipeline.py"), "examples/ml_pipeline.py")
+    assert "add_hydra" in inspector.imports
+
+    inspector.visit(load_file_tree("test/test_project/tester.py"), "test/test_project/tester.py")
+    assert "add_hydra" not in inspector.imports
+    assert inspector.modules.locations == {
+        "Entrypoint": "examples/ml_pipeline.py",
+        "ArgumentTester": "test/test_project/tester.py",
+    }
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_stream_jsonl(tmp_path, jobs):
+    files = ["test/test_project/tester.py", "test/test_project/dummy_class.py"]
+    collected = ModuleInspector()
+    collected.visit_files(files)
+
+    emitted = []
+    streamed = ModuleInspector()
+    streamed.visit_files(files, jobs, emit=emitted.append)
+    assert len(streamed.modules) == 0
+    assert [module.to_dict() for module in emitted] == collected.modules.to_dict()["modules"]
+
+    path = tmp_path / "structure.jsonl"
+    streamed.stream(files, str(path), jobs)
+    lines = path.read_text().splitlines()
+    assert len(lines) == len(collected.modules)
+    assert list(iter_jsonl(str(path))) == collected.modules.to_dict()["modules"]
+
+    expected = CodeGenerator()
+    expected.from_structures(collected.modules, "tool/utils/parser.py")
+    generator = CodeGenerator()
+    generator.from_jsonl(str(path), "tool/utils/parser.py")
+    for name in ("_setup_parser", "_main_func"):
+        code = "".join(getattr(generator, name).iter_lines())
+        assert code == "".join(getattr(expected, name).iter_lines())
+
+
+def test_shared_init_args(tmp_path):
+    source = '''
+class Tool:
+    """Tool with arguments shared by all commands."""
+
+    def __init__(self, size: int = 1):
+        """Create the tool.
+
+        Args:
+            size (int): size of the tool
+        """
+
+    def run(self, n: int):
+        """Run the tool.
+
+        Args:
+            n (int): number of runs
+        """
+
+    def stop(self):
+        """Stop the tool."""
+
+    def tool_init(self, n: int):
+        """Initialize the tool.
+
+        Args:
+            n (int): number of steps
+        """
+'''
+    file = tmp_path / "tool.py"
+    file.write_text(source)
+    inspector = ModuleInspector()
+    inspector.visit_files([str(file)])
+    generator = CodeGenerator()
+    generator.from_structures(inspector.modules, "tool/utils/parser.py")
+    generator.write(str(tmp_path / "parser.py"), str(tmp_path / "main.py"), force=True)
+
+    code = (tmp_path / "parser.py").read_text()
+    # the module arguments do not clash with the command tool_init
+    assert code.count("def _add_tool_init_args(") == 1
+    assert code.count("def add_tool_init_args(") == 1
+    assert code.count("'--size'") == 1
+    assert code.count("parser = _add_tool_init_args(parser)") == 3
+
+    script = (
+        "from argparse import ArgumentParser; from parser import setup_parser;"
+        "parser = setup_parser(ArgumentParser());"
+        "print(vars(parser.parse_args(['run', '--n', '3', '--size', '2'])),"
+        "vars(parser.parse_args(['stop'])),"
+        "vars(parser.parse_args(['tool-init', '--n', '4'])))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == (
+        "{'command': 'run', 'n': 3, 'size': 2} {'command': 'stop', 'size': 1}"
+        " {'command': 'tool-init', 'n': 4, 'size': 1}"
+    )
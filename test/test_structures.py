@@ -106,6 +106,37 @@ class TestArgumentStructure:
         assert result["default"] == [1, 2, 3]
 
 
+    def test_argument_structure_is_slotted(self):
+        """Test that arguments have no instance dictionary and unset fields are left out."""
+        arg = ArgumentStructure()
+        arg.name_or_flags = "count"
+        arg.dest = "count"
+
+        assert not hasattr(arg, "__dict__")
+        assert not hasattr(arg, "default")
+        assert arg.to_dict() == {"help": "", "dest": "count", "name_or_flags": "count"}
+
+    def test_argument_structure_keeps_unknown_keys(self):
+        """Test that keys which are no field survive a round trip."""
+        data = {
+            "name_or_flags": "level",
+            "dest": "level",
+            "help": "Log level",
+            "metavar": "LEVEL",
+        }
+        arg = ArgumentStructure.from_dict(data)
+        assert arg.to_dict() == data
+
+    def test_argument_structure_pickle(self):
+        """Test that arguments can be sent to worker processes."""
+        import pickle
+
+        arg = ArgumentStructure.from_dict(
+            {"name_or_flags": "n", "dest": "n", "help": "", "type": "int", "metavar": "N"}
+        )
+        assert pickle.loads(pickle.dumps(arg)).to_dict() == arg.to_dict()
+
+
 class TestDecoratorFlagStructure:
     """Test cases for DecoratorFlagStructure class."""
 
@@ -275,32 +306,6 @@ class TestModuleStructure:
         module.commands.append(cmd2)
         assert len(module) == 2
 
-    def test_module_structure_add_args(self):
-        """Test add_args method to add arguments to all commands."""
-        module = ModuleStructure()
-        
-        cmd1 = CommandStructure()
-        cmd1.name = "process"
-        module.commands.append(cmd1)
-        
-        cmd2 = CommandStructure()
-        cmd2.name = "analyze"
-        module.commands.append(cmd2)
-        
-        # Add common arguments to all commands
-        common_arg = ArgumentStructure()
-        common_arg.name_or_flags = "verbose"
-        common_arg.dest = "verbose"
-        common_arg.type = bool
-        common_arg.help = "Verbose output"
-        
-        module.add_args([common_arg])
-        
-        assert len(module.commands[0].args) == 1
-        assert len(module.commands[1].args) == 1
-        assert module.commands[0].args[0].name_or_flags == "verbose"
-        assert module.commands[1].args[0].name_or_flags == "verbose"
-
     def test_module_structure_to_dict(self):
         """Test converting ModuleStructure to dictionary."""
         module = ModuleStructure()
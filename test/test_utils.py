@@ -1,3 +1,6 @@
+import pytest
+
+from pyargwriter.utils.file_system import load_binary, write_binary
 from pyargwriter.utils.type_testing import type_of_all
 
 
@@ -7,3 +10,100 @@ def test_type_off_all(cleanup_tmp_dir):
     type_of_all(a, t)
     a.append(3.4)
     type_of_all(a, t)
+
+
+def test_discover_files(tmp_path):
+    from pyargwriter.utils.file_system import discover_files
+
+    files = {
+        "cli/tool.py": "class Tool:\n    pass\n",
+        "cli/helpers.py": "def helper():\n    pass\n",
+        "cli/marked.py": "from pyargwriter import api\n\nclass Marked:\n    pass\n",
+        "cli/legacy/old.py": "class Old:\n    pass\n",
+        "cli/.venv/lib.py": "class Lib:\n    pass\n",
+        "cli/build/gen.py": "class Gen:\n    pass\n",
+        "cli/.gitignore": "legacy/\n",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    root = str(tmp_path / "cli")
+
+    assert list(discover_files([root])) == [f"{root}/marked.py", f"{root}/tool.py"]
+    assert list(discover_files([root], marker="pyargwriter")) == [f"{root}/marked.py"]
+    assert list(discover_files([root + "/*.py"], ignore=["marked.py"])) == [
+        f"{root}/tool.py"
+    ]
+    assert list(discover_files([root + "/**/*.py"], ignore=["marked.py"])) == [
+        f"{root}/tool.py"
+    ]
+    # explicit files are neither filtered nor duplicated
+    explicit = f"{root}/helpers.py"
+    assert list(discover_files([explicit, root, explicit])) == [
+        explicit,
+        f"{root}/marked.py",
+        f"{root}/tool.py",
+    ]
+
+
+def test_binary_structure_file(tmp_path):
+    data = {
+        "modules": [
+            {
+                "name": "Tool",
+                "help": "a tool",
+                "commands": [
+                    {
+                        "name": "run",
+                        "help": "run it",
+                        "args": [
+                            {
+                                "help": "",
+                                "dest": "n",
+                                "name_or_flags": "n",
+                                "type": "int",
+                                "default": 1,
+                            }
+                        ],
+                        "decorator_flags": [
+                            {"name": "add_hydra", "values": {"version_base": None}}
+                        ],
+                    }
+                ],
+                "location": "tool.py",
+                "args": [],
+            }
+        ]
+    }
+    path = tmp_path / "structure.pawb"
+    write_binary(data, str(path))
+    assert load_binary(str(path)) == data
+
+    content = bytearray(path.read_bytes())
+    content[-1] ^= 0xFF
+    path.write_bytes(bytes(content))
+    with pytest.raises(ValueError, match="corrupted"):
+        load_binary(str(path))
+
+    path.write_text("modules: []")
+    with pytest.raises(ValueError, match="no binary structure file"):
+        load_binary(str(path))
+
+
+@pytest.mark.parametrize("json_backend", ["default", "json"])
+def test_compact_json(tmp_path, monkeypatch, json_backend):
+    from pyargwriter.utils import file_system
+
+    if json_backend == "json":
+        monkeypatch.setattr(file_system, "orjson", None)
+    data = {"modules": [{"name": "Tool", "help": "größer's", "args": [], "big": 2**70}]}
+    path = tmp_path / "structure.json"
+    file_system.write_json(data, str(path), compact=True)
+    content = path.read_text(encoding="utf-8")
+    assert "\n" not in content and ": " not in content
+    assert file_system.load_json(str(path)) == data
+
+    file_system.write_json(data, str(path))
+    assert "\n    " in path.read_text()
+    assert file_system.load_json(str(path)) == data